@@ -55,8 +55,15 @@ from databento_dbn.v2 import TCBBOMsg
 
 from databento.common import API_VERSION
 from databento.common import bentologging
+from databento.common import book
+from databento.common import convert
+from databento.common import join
 from databento.common import symbology
+from databento.common.book import Market
+from databento.common.book import OrderBook
+from databento.common.convert import ConversionResult
 from databento.common.dbnstore import DBNStore
+from databento.common.dbnstore import MergedDBNStore
 from databento.common.enums import Delivery
 from databento.common.enums import FeedMode
 from databento.common.enums import HistoricalGateway
@@ -74,6 +81,7 @@ from databento.common.error import BentoServerError
 from databento.common.publishers import Dataset
 from databento.common.publishers import Publisher
 from databento.common.publishers import Venue
+from databento.common.stream import DBNStream
 from databento.common.symbology import InstrumentMap
 from databento.historical.client import Historical
 from databento.live.client import Live
@@ -103,9 +111,11 @@ __all__ = [
     "CBBOMsg",
     "CMBP1Msg",
     "Compression",
+    "ConversionResult",
     "ConsolidatedBidAskPair",
     "DBNRecord",
     "DBNStore",
+    "DBNStream",
     "Dataset",
     "Delivery",
     "Encoding",
@@ -123,9 +133,12 @@ __all__ = [
     "MBOMsg",
     "MBP1Msg",
     "MBP10Msg",
+    "Market",
     "MatchAlgorithm",
+    "MergedDBNStore",
     "Metadata",
     "OHLCVMsg",
+    "OrderBook",
     "Packaging",
     "Publisher",
     "RType",
@@ -169,3 +182,5 @@ enable_logging = bentologging.enable_logging
 read_dbn = DBNStore.from_file
 map_symbols_csv = symbology.map_symbols_csv
 map_symbols_json = symbology.map_symbols_json
+convert_many = convert.convert_many
+asof_join = join.asof_join
@@ -0,0 +1,686 @@
+from __future__ import annotations
+
+import array
+import bisect
+import functools
+import itertools
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Final
+from typing import NamedTuple
+
+import numpy as np
+from databento_dbn import UNDEF_PRICE
+from databento_dbn import DBNRecord
+from databento_dbn import MBOMsg
+from databento_dbn import Schema
+from databento_dbn import Side
+
+from databento.common.dbnstore import DBNStore
+from databento.common.enums import RecordFlags
+
+
+# The number of MBO records decoded at once when replaying a `DBNStore`
+BOOK_CHUNK_SIZE: Final = 2**16
+
+LEVEL_FIELDS: Final = (
+    ("bid_px", "i8"),
+    ("ask_px", "i8"),
+    ("bid_sz", "u4"),
+    ("ask_sz", "u4"),
+    ("bid_ct", "u4"),
+    ("ask_ct", "u4"),
+)
+
+_F_TOB: Final = int(RecordFlags.F_TOB)
+_SIZE_MAX: Final = int(np.iinfo(np.uint32).max)
+_UNDEF_LEVEL: Final = (UNDEF_PRICE, UNDEF_PRICE, 0, 0, 0, 0)
+_UNDEF_SIDE: Final = (UNDEF_PRICE, 0, 0)
+_NO_BOUNDARY: Final = 2**64
+_LEVEL_DTYPE: Final = np.dtype([("price", "i8"), ("size", "u8"), ("order_count", "u8")])
+
+
+class PriceLevel(NamedTuple):
+    """
+    An aggregated price level of an order book.
+
+    Attributes
+    ----------
+    price : int
+        The price of the level expressed as a signed integer where every 1
+        unit corresponds to 1e-9, i.e. 1/1,000,000,000 or 0.000000001.
+    size : int
+        The total size of the resting orders at the level.
+    order_count : int
+        The number of resting orders at the level.
+
+    """
+
+    price: int
+    size: int
+    order_count: int
+
+
+class Order(NamedTuple):
+    """
+    A resting order of an order book.
+
+    Attributes
+    ----------
+    order_id : int
+        The order ID assigned by the venue.
+    side : str
+        The side of the order, either "A" for ask or "B" for bid.
+    price : int
+        The price of the order expressed as a signed integer where every 1
+        unit corresponds to 1e-9, i.e. 1/1,000,000,000 or 0.000000001.
+    size : int
+        The remaining size of the order.
+
+    """
+
+    order_id: int
+    side: str
+    price: int
+    size: int
+
+
+class _PriceLevels:
+    """
+    The price levels of one side of an order book.
+
+    The prices, sizes, and order counts of the levels are kept in parallel
+    arrays sorted by price, so levels are located by binary search and the
+    top levels are read as numpy views of the arrays.
+    """
+
+    __slots__ = ("order_counts", "prices", "sizes")
+
+    def __init__(self) -> None:
+        self.prices = array.array("q")
+        self.sizes = array.array("Q")
+        self.order_counts = array.array("Q")
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def clear(self) -> None:
+        del self.prices[:]
+        del self.sizes[:]
+        del self.order_counts[:]
+
+    def add(self, price: int, size: int) -> None:
+        prices = self.prices
+        index = bisect.bisect_left(prices, price)
+        if index < len(prices) and prices[index] == price:
+            self.sizes[index] += size
+            self.order_counts[index] += 1
+        else:
+            prices.insert(index, price)
+            self.sizes.insert(index, size)
+            self.order_counts.insert(index, 1)
+
+    def remove(self, price: int, size: int, order_count: int) -> None:
+        index = self._find(price)
+        if index is None:
+            return
+        if self.order_counts[index] <= order_count:
+            del self.prices[index]
+            del self.sizes[index]
+            del self.order_counts[index]
+        else:
+            level_size = self.sizes[index]
+            self.sizes[index] = level_size - size if level_size > size else 0
+            self.order_counts[index] -= order_count
+
+    def resize(self, price: int, size: int) -> None:
+        index = self._find(price)
+        if index is not None:
+            level_size = self.sizes[index] + size
+            self.sizes[index] = level_size if level_size > 0 else 0
+
+    def get(self, index: int) -> PriceLevel:
+        return PriceLevel(self.prices[index], self.sizes[index], self.order_counts[index])
+
+    def top(self, depth: int | None, descending: bool) -> np.ndarray[Any, Any]:
+        # the views must not outlive the call, as arrays exporting their
+        # buffers cannot be resized
+        step = -1 if descending else 1
+        prices = np.frombuffer(self.prices, dtype=np.int64)[::step][:depth]
+        levels = np.empty(len(prices), dtype=_LEVEL_DTYPE)
+        levels["price"] = prices
+        levels["size"] = np.frombuffer(self.sizes, dtype=np.uint64)[::step][:depth]
+        levels["order_count"] = np.frombuffer(self.order_counts, dtype=np.uint64)[::step][:depth]
+        return levels
+
+    def _find(self, price: int) -> int | None:
+        index = bisect.bisect_left(self.prices, price)
+        if index < len(self.prices) and self.prices[index] == price:
+            return index
+        return None
+
+
+class OrderBook:
+    """
+    The limit order book of a single instrument, built incrementally from
+    MBO records.
+
+    Price levels are aggregated as orders are applied and their prices are
+    kept sorted, so the best levels and MBP snapshots are read without sorting.
+
+    Notes
+    -----
+    Trade, fill, and none actions do not change the book. A cancel reduces
+    the size of an order by the size of the record and removes it when no
+    size remains. A modify for an order which is not in the book adds it.
+    Records for orders which are not in the book, such as when starting from
+    the middle of a session, are ignored.
+    Top-of-book records, with the `F_TOB` flag, replace every level of their
+    side with a single level.
+
+    See Also
+    --------
+    Market
+
+    """
+
+    def __init__(self) -> None:
+        # the side, price, and size of each order
+        self._orders: dict[int, tuple[str, int, int]] = {}
+        self._bids = _PriceLevels()
+        self._asks = _PriceLevels()
+        # incremented whenever the book changes
+        self._version = 0
+        self._level_values_cache: tuple[int, int, tuple[int, ...]] | None = None
+        self.publisher_id: int | None = None
+        self.ts_event: int | None = None
+        self.ts_recv: int | None = None
+        self.sequence: int | None = None
+
+    def __len__(self) -> int:
+        return len(self._orders)
+
+    def __repr__(self) -> str:
+        bid, ask = self.bbo()
+        return f"<{type(self).__name__}(orders={len(self)}, bid={bid}, ask={ask})>"
+
+    def apply(self, record: MBOMsg) -> None:
+        """
+        Update the book with an MBO record.
+
+        Parameters
+        ----------
+        record : MBOMsg
+            The MBO record to apply.
+
+        """
+        self._apply(
+            str(record.action),
+            str(record.side),
+            record.order_id,
+            record.price,
+            record.size,
+            record.flags,
+        )
+        self.publisher_id = record.publisher_id
+        self.ts_event = record.ts_event
+        self.ts_recv = record.ts_recv
+        self.sequence = record.sequence
+
+    def clear(self) -> None:
+        """
+        Remove every order from the book.
+        """
+        self._version += 1
+        self._orders.clear()
+        self._bids.clear()
+        self._asks.clear()
+
+    def get_order(self, order_id: int) -> Order | None:
+        """
+        Return a resting order of the book.
+
+        Parameters
+        ----------
+        order_id : int
+            The order ID assigned by the venue.
+
+        Returns
+        -------
+        Order or None
+            The order, or `None` if it is not in the book.
+
+        """
+        order = self._orders.get(order_id)
+        if order is None:
+            return None
+        return Order(order_id, *order)
+
+    def bbo(self) -> tuple[PriceLevel | None, PriceLevel | None]:
+        """
+        Return the best bid and offer levels of the book.
+
+        Returns
+        -------
+        tuple[PriceLevel | None, PriceLevel | None]
+            The best bid and ask levels, with `None` for an empty side.
+
+        """
+        bid = self._bids.get(-1) if self._bids else None
+        ask = self._asks.get(0) if self._asks else None
+        return bid, ask
+
+    def levels(self, side: Side | str, depth: int | None = None) -> np.ndarray[Any, Any]:
+        """
+        Return the aggregated price levels of one side of the book, best
+        level first.
+
+        Parameters
+        ----------
+        side : Side or str
+            The side of the book, either "A" for ask or "B" for bid.
+        depth : int, optional
+            The maximum number of levels to return.
+            If `None`, every level is returned.
+
+        Returns
+        -------
+        np.ndarray
+            A structured array with the fields `price`, `size`, and `order_count`.
+
+        Raises
+        ------
+        ValueError
+            If `side` is neither ask nor bid.
+
+        """
+        if side == Side.BID:
+            return self._bids.top(depth, descending=True)
+        if side == Side.ASK:
+            return self._asks.top(depth, descending=False)
+        raise ValueError(f"invalid side {side!r}, use either 'A' or 'B'")
+
+    def snapshot(self, depth: int = 10) -> np.ndarray[Any, Any]:
+        """
+        Return the top levels of the book in the layout of the `levels` of
+        an MBP record.
+
+        Sizes are capped at the maximum of the 32-bit MBP size fields.
+        Levels beyond the depth of the book have `UNDEF_PRICE` prices and
+        zero sizes and counts.
+
+        Parameters
+        ----------
+        depth : int, default 10
+            The number of levels.
+
+        Returns
+        -------
+        np.ndarray
+            A structured array of `depth` levels with the fields `bid_px`,
+            `ask_px`, `bid_sz`, `ask_sz`, `bid_ct`, and `ask_ct`.
+
+        """
+        values = self._level_values(depth)
+        return np.array(
+            [values[index : index + 6] for index in range(0, len(values), 6)],
+            dtype=list(LEVEL_FIELDS),
+        )
+
+    def _level_values(self, depth: int) -> tuple[int, ...]:
+        """
+        Return the values of the top levels of the book in the order of the
+        level fields of an MBP record, which are cached until the book changes.
+        """
+        cached = self._level_values_cache
+        if cached is not None and cached[0] == self._version and cached[1] == depth:
+            return cached[2]
+
+        bids, asks = self._bids, self._asks
+        bid_levels = zip(
+            bids.prices[: -depth - 1 : -1],
+            bids.sizes[: -depth - 1 : -1],
+            bids.order_counts[: -depth - 1 : -1],
+        )
+        ask_levels = zip(asks.prices[:depth], asks.sizes[:depth], asks.order_counts[:depth])
+        values: list[int] = []
+        for bid, ask in itertools.zip_longest(bid_levels, ask_levels, fillvalue=_UNDEF_SIDE):
+            bid_px, bid_sz, bid_ct = bid
+            ask_px, ask_sz, ask_ct = ask
+            values += (
+                bid_px,
+                ask_px,
+                bid_sz if bid_sz < _SIZE_MAX else _SIZE_MAX,
+                ask_sz if ask_sz < _SIZE_MAX else _SIZE_MAX,
+                bid_ct,
+                ask_ct,
+            )
+        values += _UNDEF_LEVEL * (depth - max(min(len(bids), depth), min(len(asks), depth)))
+
+        level_values = tuple(values)
+        self._level_values_cache = (self._version, depth, level_values)
+        return level_values
+
+    def _get_side(self, side: str) -> _PriceLevels | None:
+        if side == "B":
+            return self._bids
+        if side == "A":
+            return self._asks
+        return None
+
+    def _apply(
+        self,
+        action: str,
+        side: str,
+        order_id: int,
+        price: int,
+        size: int,
+        flags: int,
+    ) -> None:
+        if action == "R":
+            self.clear()
+            return
+        if action not in ("A", "C", "M"):
+            return
+        self._version += 1
+
+        if flags & _F_TOB:
+            levels = self._get_side(side)
+            if levels is not None:
+                levels.clear()
+                if price != UNDEF_PRICE:
+                    levels.add(price, size)
+            return
+
+        orders = self._orders
+        order = orders.get(order_id)
+        if action == "C":
+            if order is None:
+                return
+            order_side, order_price, order_size = order
+            levels = self._bids if order_side == "B" else self._asks
+            if order_size > size:
+                orders[order_id] = (order_side, order_price, order_size - size)
+                levels.remove(order_price, size, 0)
+            else:
+                del orders[order_id]
+                levels.remove(order_price, order_size, 1)
+            return
+
+        levels = self._get_side(side)
+        if levels is None:
+            return
+        if order is not None:
+            order_side, order_price, order_size = order
+            if order_side == side and order_price == price:
+                levels.resize(price, size - order_size)
+                orders[order_id] = (side, price, size)
+                return
+            (self._bids if order_side == "B" else self._asks).remove(order_price, order_size, 1)
+        orders[order_id] = (side, price, size)
+        levels.add(price, size)
+
+
+class Market:
+    """
+    The limit order books of several instruments, keyed by `instrument_id`
+    and `publisher_id` and built incrementally from MBO records.
+
+    A `Market` can consume the records of a `DBNStore` or be added as a
+    callback of a `Live` client; records other than MBO are ignored.
+    The same instrument has a separate book for each publisher.
+
+    Examples
+    --------
+    >>> market = Market()
+    >>> live_client.add_callback(market.apply)
+    >>> book = market[(instrument_id, publisher_id)]
+
+    See Also
+    --------
+    OrderBook
+
+    """
+
+    def __init__(self) -> None:
+        self._books: dict[tuple[int, int], OrderBook] = {}
+
+    def __contains__(self, key: object) -> bool:
+        return key in self._books
+
+    def __getitem__(self, key: tuple[int, int]) -> OrderBook:
+        return self._books[key]
+
+    def __iter__(self) -> Iterator[tuple[int, int]]:
+        return iter(self._books)
+
+    def __len__(self) -> int:
+        return len(self._books)
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__}(instruments={len(self)})>"
+
+    @property
+    def books(self) -> dict[tuple[int, int], OrderBook]:
+        """
+        Return the order book of each instrument, keyed by `instrument_id`
+        and `publisher_id`.
+
+        Returns
+        -------
+        dict[tuple[int, int], OrderBook]
+
+        """
+        return self._books
+
+    def apply(self, record: DBNRecord) -> None:
+        """
+        Update the book of the instrument of a record.
+        Records other than MBO are ignored.
+
+        Parameters
+        ----------
+        record : DBNRecord
+            The record to apply.
+
+        """
+        if isinstance(record, MBOMsg):
+            key = (record.instrument_id, record.publisher_id)
+            book = self._books.get(key)
+            if book is None:
+                book = self._books[key] = OrderBook()
+            book.apply(record)
+
+    def apply_ndarray(self, records: np.ndarray[Any, Any]) -> None:
+        """
+        Update the books with an array of MBO records, such as from
+        `DBNStore.to_ndarray`.
+
+        This is considerably faster than applying each record as an `MBOMsg`.
+
+        Parameters
+        ----------
+        records : np.ndarray
+            The MBO records to apply.
+
+        """
+        for _ in self._apply_ndarray(records.reshape(-1), None, None, 0):
+            pass
+
+    def snapshot(self, depth: int = 10) -> np.ndarray[Any, Any]:
+        """
+        Return the top levels of every book as MBP-N rows.
+
+        Parameters
+        ----------
+        depth : int, default 10
+            The number of levels of each book.
+
+        Returns
+        -------
+        np.ndarray
+            A structured array with one row per book and the fields
+            `ts_recv`, `ts_event`, `publisher_id`, `instrument_id`, and `sequence`
+            of the last record applied to the book, followed by the fields of each
+            level as in an MBP-10 record, e.g. `bid_px_00` and `ask_sz_09`.
+
+        """
+        return np.array(
+            [
+                (
+                    book.ts_recv or 0,
+                    book.ts_event or 0,
+                    publisher_id,
+                    instrument_id,
+                    book.sequence or 0,
+                    *book._level_values(depth),
+                )
+                for (instrument_id, publisher_id), book in self._books.items()
+            ],
+            dtype=_snapshot_dtype(depth),
+        )
+
+    def snapshots(
+        self,
+        data: DBNStore | Iterable[DBNRecord],
+        interval: int,
+        depth: int = 10,
+    ) -> Iterator[np.ndarray[Any, Any]]:
+        """
+        Update the books with MBO records and yield a snapshot of every book
+        at each interval.
+
+        Each snapshot reflects every record with a `ts_recv` before the
+        interval boundary, and its `ts_recv` field is set to the boundary.
+        Snapshots are yielded for every boundary from the first record to
+        the end of the interval of the last record.
+
+        Parameters
+        ----------
+        data : DBNStore or Iterable[DBNRecord]
+            The records to apply.
+        interval : int
+            The interval between snapshots in nanoseconds.
+        depth : int, default 10
+            The number of levels of each book.
+
+        Yields
+        ------
+        np.ndarray
+            The snapshot of every book, as returned by `Market.snapshot`.
+
+        Raises
+        ------
+        ValueError
+            If `interval` is not positive.
+
+        """
+        if interval <= 0:
+            raise ValueError("`interval` must be positive")
+
+        boundary = None
+        if isinstance(data, DBNStore):
+            for records in data.to_ndarray(Schema.MBO, BOOK_CHUNK_SIZE):
+                boundary = yield from self._apply_ndarray(
+                    records.reshape(-1),
+                    interval,
+                    boundary,
+                    depth,
+                )
+        else:
+            for record in data:
+                if not isinstance(record, MBOMsg):
+                    continue
+                if boundary is None:
+                    boundary = record.ts_recv - record.ts_recv % interval + interval
+                while record.ts_recv >= boundary:
+                    yield self._snapshot_at(boundary, depth)
+                    boundary += interval
+                self.apply(record)
+
+        if boundary is not None:
+            yield self._snapshot_at(boundary, depth)
+
+    def _snapshot_at(self, ts_recv: int, depth: int) -> np.ndarray[Any, Any]:
+        snapshot = self.snapshot(depth)
+        snapshot["ts_recv"] = ts_recv
+        return snapshot
+
+    def _apply_ndarray(
+        self,
+        records: np.ndarray[Any, Any],
+        interval: int | None,
+        boundary: int | None,
+        depth: int,
+    ) -> Generator[np.ndarray[Any, Any], None, int | None]:
+        """
+        Apply records, yielding a snapshot before the first record at or after
+        each interval boundary if `interval` is set, and return the next boundary.
+        """
+        if len(records) == 0:
+            return boundary
+        if interval is None:
+            next_boundary = _NO_BOUNDARY
+        elif boundary is None:
+            first_ts_recv = int(records["ts_recv"][0])
+            next_boundary = first_ts_recv - first_ts_recv % interval + interval
+        else:
+            next_boundary = boundary
+
+        books = self._books
+        columns = zip(
+            records["instrument_id"].tolist(),
+            records["publisher_id"].tolist(),
+            records["action"].astype("U1").tolist(),
+            records["side"].astype("U1").tolist(),
+            records["order_id"].tolist(),
+            records["price"].tolist(),
+            records["size"].tolist(),
+            records["flags"].tolist(),
+            records["ts_event"].tolist(),
+            records["ts_recv"].tolist(),
+            records["sequence"].tolist(),
+        )
+        for (
+            instrument_id,
+            publisher_id,
+            action,
+            side,
+            order_id,
+            price,
+            size,
+            flags,
+            ts_event,
+            ts_recv,
+            sequence,
+        ) in columns:
+            while ts_recv >= next_boundary:
+                yield self._snapshot_at(next_boundary, depth)
+                next_boundary += interval  # type: ignore [operator]
+            key = (instrument_id, publisher_id)
+            book = books.get(key)
+            if book is None:
+                book = books[key] = OrderBook()
+                book.publisher_id = publisher_id
+            book._apply(action, side, order_id, price, size, flags)
+            book.ts_event = ts_event
+            book.ts_recv = ts_recv
+            book.sequence = sequence
+
+        return None if interval is None else next_boundary
+
+
+@functools.cache
+def _snapshot_dtype(depth: int) -> np.dtype[Any]:
+    fields = [
+        ("ts_recv", "u8"),
+        ("ts_event", "u8"),
+        ("publisher_id", "u2"),
+        ("instrument_id", "u4"),
+        ("sequence", "u4"),
+    ]
+    for index in range(depth):
+        fields.extend((f"{name}_{index:02d}", dtype) for name, dtype in LEVEL_FIELDS)
+    return np.dtype(fields)
@@ -0,0 +1,275 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+import threading
+import uuid
+from collections.abc import Generator
+from collections.abc import Mapping
+from contextlib import contextmanager
+from os import PathLike
+from pathlib import Path
+from typing import Final
+
+from databento.common.parsing import datetime_to_unix_nanoseconds
+from databento.common.validation import validate_path
+
+
+CACHE_MAX_SIZE: Final = 2**33
+CACHE_SUFFIX: Final = ".dbn.zst"
+
+
+class DBNCache:
+    """
+    A cache of zstd compressed DBN responses in a directory on disk.
+
+    Entries are addressed by a hash of their request, so identical requests
+    share an entry however their timestamps are formatted. When the entries
+    exceed `max_size` bytes, the least recently used entries are evicted.
+
+    Parameters
+    ----------
+    directory : PathLike[str] or str
+        The directory of the cache, which is created if it does not exist.
+    max_size : int, default 8 GiB
+        The maximum total size of the entries in bytes.
+
+    Raises
+    ------
+    ValueError
+        If `max_size` is not a positive integer.
+
+    """
+
+    def __init__(
+        self,
+        directory: PathLike[str] | str,
+        max_size: int = CACHE_MAX_SIZE,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("`max_size` must be a positive integer")
+
+        self._directory = validate_path(directory, "directory")
+        self._directory.mkdir(parents=True, exist_ok=True)
+        self._max_size = max_size
+        self._lock = threading.Lock()
+
+    def __repr__(self) -> str:
+        name = self.__class__.__name__
+        return f"<{name}(directory={self._directory}, max_size={self._max_size})>"
+
+    @property
+    def directory(self) -> Path:
+        """
+        Return the directory of the cache.
+
+        Returns
+        -------
+        Path
+
+        """
+        return self._directory
+
+    @property
+    def max_size(self) -> int:
+        """
+        Return the maximum total size of the entries in bytes.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._max_size
+
+    @property
+    def size(self) -> int:
+        """
+        Return the total size of the entries in bytes.
+
+        Returns
+        -------
+        int
+
+        """
+        return sum(size for _, size, _ in self._entries())
+
+    @staticmethod
+    def key(url: str, data: Mapping[str, object | None]) -> str:
+        """
+        Return the key of the entry of a request.
+
+        Parameters
+        ----------
+        url : str
+            The URL of the request.
+        data : Mapping[str, object | None]
+            The parameters of the request.
+
+        Returns
+        -------
+        str
+
+        """
+        request: dict[str, object] = {"url": url}
+        for name, value in data.items():
+            if value is None:
+                continue
+            if name in ("start", "end"):
+                value = datetime_to_unix_nanoseconds(str(value))
+            request[name] = value
+        return hashlib.sha256(json.dumps(request, sort_keys=True).encode()).hexdigest()
+
+    def path(self, key: str) -> Path:
+        """
+        Return the path of an entry, whether or not it is cached.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Returns
+        -------
+        Path
+
+        """
+        return self._directory / f"{key}{CACHE_SUFFIX}"
+
+    def get(self, key: str) -> Path | None:
+        """
+        Return the path of an entry, marking it as the most recently used.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Returns
+        -------
+        Path or None
+            The path of the entry, or `None` if it is not cached.
+
+        """
+        path = self.path(key)
+        try:
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        return path
+
+    def read(self, key: str) -> bytes | None:
+        """
+        Return the contents of an entry, marking it as the most recently used.
+
+        The entry is read while no entries can be evicted.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Returns
+        -------
+        bytes or None
+            The contents of the entry, or `None` if it is not cached.
+
+        """
+        with self._lock:
+            path = self.get(key)
+            if path is None:
+                return None
+            return path.read_bytes()
+
+    def copy(self, key: str, path: PathLike[str] | str) -> bool:
+        """
+        Copy an entry to `path`, marking it as the most recently used.
+
+        The entry is copied while no entries can be evicted.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+        path : PathLike[str] or str
+            The path to copy the entry to.
+
+        Returns
+        -------
+        bool
+            If the entry was cached and copied.
+
+        """
+        with self._lock:
+            entry_path = self.get(key)
+            if entry_path is None:
+                return False
+            shutil.copyfile(entry_path, path)
+            return True
+
+    @contextmanager
+    def write(self, key: str) -> Generator[Path, None, None]:
+        """
+        Write an entry, which is only added to the cache if the context exits
+        without an exception.
+
+        Parameters
+        ----------
+        key : str
+            The key of the entry.
+
+        Yields
+        ------
+        Path
+            A path to write the entry to, which does not exist yet. It cannot
+            be evicted, so it can be read until the context exits.
+
+        """
+        path = self.path(key)
+        temp_path = path.with_name(f"{key}.{uuid.uuid4().hex}.tmp")
+        try:
+            yield temp_path
+            os.replace(temp_path, path)
+        finally:
+            temp_path.unlink(missing_ok=True)
+        self.evict(keep=path)
+
+    def evict(self, keep: Path | None = None) -> None:
+        """
+        Remove the least recently used entries until the entries fit within
+        `max_size` bytes.
+
+        Parameters
+        ----------
+        keep : Path, optional
+            The path of an entry which is never removed.
+
+        """
+        with self._lock:
+            entries = sorted(self._entries())
+            size = sum(entry_size for _, entry_size, _ in entries)
+            for _, entry_size, path in entries:
+                if size <= self._max_size:
+                    break
+                if path == keep:
+                    continue
+                path.unlink(missing_ok=True)
+                size -= entry_size
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache.
+        """
+        with self._lock:
+            for _, _, path in self._entries():
+                path.unlink(missing_ok=True)
+
+    def _entries(self) -> Generator[tuple[int, int, Path], None, None]:
+        for path in self._directory.glob(f"*{CACHE_SUFFIX}"):
+            try:
+                stat = path.stat()
+            except FileNotFoundError:
+                continue
+            yield stat.st_mtime_ns, stat.st_size, path
@@ -96,6 +96,27 @@ SCHEMA_STRUCT_MAP_V1: Final[dict[Schema, type[DBNRecord]]] = {
 }
 
 
+def schema_struct_map(version: int) -> dict[Schema, type[DBNRecord]]:
+    """
+    Return a mapping of Schema variants to DBNRecord types for a DBN version.
+
+    Parameters
+    ----------
+    version : int
+        The DBN version of the metadata.
+
+    Returns
+    -------
+    dict[Schema, type[DBNRecord]]
+
+    """
+    if version == 1:
+        return SCHEMA_STRUCT_MAP_V1
+    if version == 2:
+        return SCHEMA_STRUCT_MAP_V2
+    return SCHEMA_STRUCT_MAP
+
+
 CORPORATE_ACTIONS_DATETIME_COLUMNS: Final[list[str]] = [
     "ts_record",
     "ts_created",
@@ -0,0 +1,221 @@
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import time
+from collections.abc import Iterable
+from concurrent.futures import ProcessPoolExecutor
+from os import PathLike
+from pathlib import Path
+from typing import Any
+from typing import Final
+from typing import Literal
+from typing import NamedTuple
+
+from databento.common.dbnstore import DBNStore
+from databento.common.symbology import InstrumentMap
+from databento.common.validation import validate_file_write_path
+from databento.common.validation import validate_path
+
+
+logger = logging.getLogger(__name__)
+
+CONVERT_FORMATS: Final = ("csv", "json", "parquet")
+
+# The instrument map shared by the files converted in a worker process
+_worker_instrument_map: InstrumentMap | None = None
+
+
+class ConversionResult(NamedTuple):
+    """
+    The result of converting a DBN file.
+
+    Attributes
+    ----------
+    path : Path
+        The DBN file which was converted.
+    out_path : Path
+        The file the converted data was written to.
+    nbytes : int
+        The size of the DBN file in bytes.
+    duration : float
+        The time taken to convert the file in seconds.
+
+    """
+
+    path: Path
+    out_path: Path
+    nbytes: int
+    duration: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Return the conversion throughput in bytes of DBN data per second.
+
+        Returns
+        -------
+        float
+
+        """
+        if self.duration <= 0:
+            return float("inf")
+        return self.nbytes / self.duration
+
+
+def convert_many(
+    paths: Iterable[PathLike[str] | str],
+    fmt: str = "parquet",
+    out_dir: PathLike[str] | str | None = None,
+    symbology_file: PathLike[str] | str | None = None,
+    workers: int | None = None,
+    mode: Literal["w", "x"] = "w",
+    **kwargs: Any,
+) -> list[ConversionResult]:
+    """
+    Convert several DBN files, such as the files of a batch job, using a pool
+    of processes.
+
+    Each file is written next to the DBN file, or to `out_dir`, with the
+    `.dbn` and `.zst` suffixes replaced by the suffix of the format.
+
+    Parameters
+    ----------
+    paths : Iterable[PathLike[str] or str]
+        The DBN files to convert.
+    fmt : str, default "parquet"
+        The format to convert to, one of "csv", "json", or "parquet".
+    out_dir : PathLike[str] or str, optional
+        The directory to write the converted files to, which is created if it
+        does not exist. If unspecified, each file is written to the directory of its DBN file.
+    symbology_file : PathLike[str] or str, optional
+        Path to a `symbology.json` file to use as a symbology source for all files.
+        If unspecified, the symbology mappings of each file's metadata are used.
+    workers : int, optional
+        The number of worker processes to use. If `None`, the number of
+        processors on the machine is used. If 1, files are converted in the
+        calling process.
+    mode : str, default "w"
+        The file write mode to use, either "x" or "w".
+    **kwargs : Any
+        Keyword arguments to pass to `DBNStore.to_csv`, `DBNStore.to_json`,
+        or `DBNStore.to_parquet`.
+
+    Returns
+    -------
+    list[ConversionResult]
+        The result of each conversion, in the order of `paths`.
+
+    Raises
+    ------
+    ValueError
+        If an invalid format is specified.
+        If `workers` is not a positive integer.
+        If two files would be converted to the same path.
+    FileNotFoundError
+        If a non-existent file is specified.
+
+    See Also
+    --------
+    DBNStore.to_csv
+    DBNStore.to_json
+    DBNStore.to_parquet
+
+    """
+    if fmt not in CONVERT_FORMATS:
+        raise ValueError(
+            f"The `fmt` was not a valid value. Use any of {list(CONVERT_FORMATS)}.",
+        )
+    if workers is not None and workers < 1:
+        raise ValueError("`workers` must be a positive integer")
+
+    in_paths = [validate_path(path, "paths") for path in paths]
+    out_dir_valid = None
+    if out_dir is not None:
+        out_dir_valid = validate_path(out_dir, "out_dir")
+        out_dir_valid.mkdir(parents=True, exist_ok=True)
+
+    out_paths = []
+    for in_path in in_paths:
+        if not in_path.is_file():
+            raise FileNotFoundError(f"{in_path} does not exist")
+        out_path = _get_out_path(in_path, fmt, out_dir_valid)
+        out_paths.append(validate_file_write_path(out_path, "paths", exist_ok=mode == "w"))
+
+    if len(set(out_paths)) != len(out_paths):
+        raise ValueError("multiple files cannot be converted to the same path")
+
+    instrument_map = None
+    if symbology_file is not None:
+        instrument_map = InstrumentMap()
+        with open(symbology_file) as input_symbology:
+            instrument_map.insert_json(json.load(input_symbology))
+
+    if workers == 1:
+        _init_worker(instrument_map)
+        try:
+            results = [
+                _convert_file(in_path, out_path, fmt, mode, kwargs)
+                for in_path, out_path in zip(in_paths, out_paths)
+            ]
+        finally:
+            _init_worker(None)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=_init_worker,
+            initargs=(instrument_map,),
+        ) as executor:
+            futures = [
+                executor.submit(_convert_file, in_path, out_path, fmt, mode, kwargs)
+                for in_path, out_path in zip(in_paths, out_paths)
+            ]
+            results = [future.result() for future in futures]
+
+    for result in results:
+        logger.info(
+            "converted %s to %s in %.3fs (%.1f MB/s)",
+            result.path.name,
+            result.out_path.name,
+            result.duration,
+            result.throughput / 1e6,
+        )
+
+    return results
+
+
+def _get_out_path(in_path: Path, fmt: str, out_dir: Path | None) -> Path:
+    name = in_path.name
+    for suffix in (".zst", ".dbn"):
+        name = name.removesuffix(suffix)
+    return (in_path.parent if out_dir is None else out_dir) / f"{name}.{fmt}"
+
+
+def _init_worker(instrument_map: InstrumentMap | None) -> None:
+    global _worker_instrument_map
+    _worker_instrument_map = instrument_map
+
+
+def _convert_file(
+    path: Path,
+    out_path: Path,
+    fmt: str,
+    mode: Literal["w", "x"],
+    kwargs: dict[str, Any],
+) -> ConversionResult:
+    start = time.perf_counter()
+
+    store = DBNStore.from_file(path)
+    if _worker_instrument_map is not None:
+        # the store inserts its own metadata into the map, so each file gets a copy
+        store._instrument_map = copy.copy(_worker_instrument_map)
+
+    getattr(store, f"to_{fmt}")(out_path, mode=mode, **kwargs)
+
+    return ConversionResult(
+        path=path,
+        out_path=out_path,
+        nbytes=store.nbytes,
+        duration=time.perf_counter() - start,
+    )
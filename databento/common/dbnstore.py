@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import abc
+import bisect
 import datetime
 import decimal
+import heapq
 import itertools
 import logging
+import mmap
+import time
 import warnings
 import zoneinfo
 from collections.abc import Callable
 from collections.abc import Generator
+from collections.abc import Iterable
 from collections.abc import Iterator
 from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
 from io import BufferedReader
 from io import BytesIO
 from os import PathLike
@@ -29,6 +36,8 @@ import databento_dbn
 import numpy as np
 import pandas as pd
 import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import zstandard
 from databento_dbn import FIXED_PRICE_SCALE
@@ -37,6 +46,7 @@ from databento_dbn import Compression
 from databento_dbn import DBNDecoder
 from databento_dbn import DBNRecord
 from databento_dbn import Encoding
+from databento_dbn import ErrorMsg
 from databento_dbn import InstrumentDefMsg
 from databento_dbn import InstrumentDefMsgV1
 from databento_dbn import InstrumentDefMsgV2
@@ -44,30 +54,54 @@ from databento_dbn import Metadata
 from databento_dbn import RType
 from databento_dbn import Schema
 from databento_dbn import SType
+from databento_dbn import SymbolMappingMsg
+from databento_dbn import SystemMsg
 from databento_dbn import Transcoder
 from databento_dbn import VersionUpgradePolicy
 
 from databento.common.constants import DEFINITION_TYPE_MAX_MAP
 from databento.common.constants import SCHEMA_STRUCT_MAP
-from databento.common.constants import SCHEMA_STRUCT_MAP_V1
-from databento.common.constants import SCHEMA_STRUCT_MAP_V2
+from databento.common.constants import schema_struct_map
 from databento.common.enums import PriceType
+from databento.common.enums import RecordFlags
 from databento.common.error import BentoError
 from databento.common.error import BentoWarning
+from databento.common.parsing import optional_datetime_to_unix_nanoseconds
 from databento.common.symbology import InstrumentMap
+from databento.common.symbology import MappingInterval
+from databento.common.symbology import SymbolMapping
 from databento.common.types import Default
 from databento.common.types import MappingIntervalDict
 from databento.common.validation import validate_enum
 from databento.common.validation import validate_file_write_path
 from databento.common.validation import validate_maybe_enum
 from databento.common.validation import validate_path
+from databento.common.zstd import FRAME_INDEX_SUFFIX
+from databento.common.zstd import FrameIndexEntry
+from databento.common.zstd import ParallelZstdReader
+from databento.common.zstd import ZstdFrame
+from databento.common.zstd import create_zstd_executor
+from databento.common.zstd import read_frame_index
+from databento.common.zstd import read_frames
+from databento.common.zstd import write_frame_index
 
 
 logger = logging.getLogger(__name__)
 
 PARQUET_CHUNK_SIZE: Final = 2**16
+PARQUET_ROW_GROUP_SIZE: Final = 2**17
+MERGE_CHUNK_SIZE: Final = 2**12
+SLICE_CHUNK_SIZE: Final = 2**16
+STATS_CHUNK_SIZE: Final = 2**16
+RESAMPLE_CHUNK_SIZE: Final = 2**16
+MBP_BATCH_SIZE: Final = 2**12
+REPLAY_BATCH_SIZE: Final = 2**16
+SCAN_READ_SIZE: Final = 2**20
+SCAN_RUN_SIZE: Final = 2**6
 
 if TYPE_CHECKING:
+    import polars as pl
+
     from databento.historical.client import Historical
 
 
@@ -112,6 +146,53 @@ def is_dbn(reader: IO[bytes]) -> bool:
     return reader.read(3) == b"DBN"
 
 
+def _validate_tz(
+    tz: datetime.tzinfo | str | Default[datetime.tzinfo],
+    pretty_ts: bool,
+) -> datetime.tzinfo:
+    if isinstance(tz, Default):
+        tz = tz.value  # consume default
+    elif not pretty_ts:
+        raise ValueError(
+            "A timezone was specified when `pretty_ts` is `False`. Did you mean to set `pretty_ts=True`?",
+        )
+
+    if isinstance(tz, str):
+        tz = zoneinfo.ZoneInfo(tz)
+    elif not isinstance(tz, datetime.tzinfo):
+        raise ValueError(
+            f"The value {tz!r} is not a valid datetime.tzinfo",
+        )
+    return tz
+
+
+def _write_parquet(
+    batch_iter: Iterator[pa.RecordBatch],
+    file_path: Path,
+    parquet_schema: pa.Schema | None,
+    **kwargs: Any,
+) -> None:
+    writer = None
+    try:
+        for batch in batch_iter:
+            if writer is None:
+                # Initialize the writer using the first RecordBatch
+                if parquet_schema is None:
+                    parquet_schema = batch.schema
+                writer = pq.ParquetWriter(
+                    where=kwargs.pop("where", file_path),
+                    schema=parquet_schema,
+                    **kwargs,
+                )
+            table = pa.Table.from_batches([batch])
+            if not table.schema.equals(parquet_schema):
+                table = table.select(parquet_schema.names).cast(parquet_schema)
+            writer.write_table(table)
+    finally:
+        if writer is not None:
+            writer.close()
+
+
 class DataSource(abc.ABC):
     """
     Abstract base class for backing DBNStore instances with data.
@@ -212,6 +293,98 @@ class FileDataSource(DataSource):
         return self.__buffer
 
 
+class MemoryMappedDataSource(FileDataSource):
+    """
+    A memory-mapped file-backed data source for a DBNStore object.
+
+    The file is mapped read-only so uncompressed DBN records can be viewed
+    directly without copying them into memory.
+
+    Attributes
+    ----------
+    buffer : memoryview
+        A read-only view over the mapped file.
+    name : str
+        The name of the file.
+    nbytes : int
+        The size of the data in bytes; equal to the file size.
+    path : Path
+        The path of the file.
+    reader : IO[bytes]
+        A new `mmap` of this file for each access.
+
+    """
+
+    def __init__(self, source: Path):
+        super().__init__(source)
+        self.__mmap = self._map()
+
+    def __del__(self) -> None:
+        try:
+            self.close()
+        except (AttributeError, BufferError):
+            # the mapping was never created, or is released with its last view
+            pass
+
+    def close(self) -> None:
+        """
+        Close the mapping of the file.
+
+        Readers returned by `reader` have their own mappings and remain open.
+
+        Raises
+        ------
+        BufferError
+            If views of `buffer` are still in use.
+
+        """
+        self.__mmap.close()
+
+    @property
+    def buffer(self) -> memoryview:
+        """
+        Return a read-only view over the mapped file.
+
+        Returns
+        -------
+        memoryview
+
+        """
+        return memoryview(self.__mmap)
+
+    @property
+    def nbytes(self) -> int:
+        """
+        Return the size of the mapped file in bytes.
+
+        Returns
+        -------
+        int
+
+        """
+        return len(self.__mmap)
+
+    @property
+    def reader(self) -> IO[bytes]:  # type: ignore [override]
+        """
+        Return a new reader for the mapped file.
+
+        The reader begins at the start of the file and has its own mapping
+        and position, so readers can be used concurrently without copying
+        the file.
+
+        Returns
+        -------
+        IO[bytes]
+
+        """
+        return self._map()  # type: ignore [return-value]
+
+    def _map(self) -> mmap.mmap:
+        with open(self._path, "rb") as file:
+            return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+
+
 class MemoryDataSource(DataSource):
     """
     A memory-backed data source for a DBNStore object.
@@ -348,15 +521,21 @@ class DBNStore:
 
     DBN_READ_SIZE = 64 * 1024  # 64kb
 
-    def __init__(self, data_source: DataSource) -> None:
+    def __init__(self, data_source: DataSource, threads: int | None = None) -> None:
         self._data_source = data_source
+        self._threads = threads
+        self._frames: list[ZstdFrame] | None = None
+        self._executor: ThreadPoolExecutor | None = None
 
         # Check compression
         buffer = self._data_source.reader
 
         if is_zstandard(buffer):
             self._compression = Compression.ZSTD
-            buffer = zstandard.ZstdDecompressor().stream_reader(data_source.reader)
+            buffer = zstandard.ZstdDecompressor().stream_reader(
+                data_source.reader,
+                read_across_frames=True,
+            )
         elif is_dbn(buffer):
             self._compression = Compression.NONE
             buffer = data_source.reader
@@ -384,6 +563,7 @@ class DBNStore:
         )
 
         self._instrument_map = InstrumentMap()
+        self._frame_index: list[FrameIndexEntry] | None = None
 
     def __iter__(self) -> Generator[DBNRecord, None, None]:
         reader = self.reader
@@ -526,13 +706,16 @@ class DBNStore:
         return self._data_source.reader.read()
 
     @property
-    def reader(self) -> IO[bytes]:
+    def reader(self) -> IO[bytes] | ParallelZstdReader:
         """
         Return an I/O reader for the DBN records.
 
+        When the store decompresses with more than one thread, the readers
+        share one pool of threads.
+
         Returns
         -------
-        IO[bytes]
+        IO[bytes] or ParallelZstdReader
 
         See Also
         --------
@@ -540,6 +723,18 @@ class DBNStore:
 
         """
         if self.compression == Compression.ZSTD:
+            if self._threads is not None and self._threads > 1:
+                if self._frames is None:
+                    self._frames = read_frames(self._data_source.reader)
+                if sum(not frame.skippable for frame in self._frames) > 1:
+                    if self._executor is None:
+                        self._executor = create_zstd_executor(self._threads)
+                    return ParallelZstdReader(
+                        reader=self._data_source.reader,
+                        frames=self._frames,
+                        threads=self._threads,
+                        executor=self._executor,
+                    )
             return zstandard.ZstdDecompressor().stream_reader(
                 self._data_source.reader,
                 read_across_frames=True,
@@ -639,7 +834,12 @@ class DBNStore:
         return self._metadata.symbols
 
     @classmethod
-    def from_file(cls, path: PathLike[str] | str) -> DBNStore:
+    def from_file(
+        cls,
+        path: PathLike[str] | str,
+        mmap: bool = False,
+        threads: int | None = None,
+    ) -> DBNStore:
         """
         Load the data from a DBN file at the given path.
 
@@ -647,6 +847,13 @@ class DBNStore:
         ----------
         path : PathLike[str] or str
             The path to read from.
+        mmap : bool, default False
+            If the file should be memory-mapped instead of read into memory.
+            For uncompressed DBN files, `to_ndarray` will then return
+            read-only arrays backed directly by the mapped file.
+        threads : int, optional
+            The number of threads to use to decompress zstd data which consists
+            of multiple frames. If `None`, data is decompressed in the calling thread.
 
         Returns
         -------
@@ -660,10 +867,17 @@ class DBNStore:
             If an empty file is specified.
 
         """
-        return cls(FileDataSource(validate_path(path, "path")))
+        file_path = validate_path(path, "path")
+        if mmap:
+            return cls(MemoryMappedDataSource(file_path), threads=threads)
+        return cls(FileDataSource(file_path), threads=threads)
 
     @classmethod
-    def from_bytes(cls, data: BytesIO | bytes | IO[bytes]) -> DBNStore:
+    def from_bytes(
+        cls,
+        data: BytesIO | bytes | IO[bytes],
+        threads: int | None = None,
+    ) -> DBNStore:
         """
         Load the data from a raw bytes.
 
@@ -671,6 +885,9 @@ class DBNStore:
         ----------
         data : BytesIO or bytes or IO[bytes]
             The bytes to read from.
+        threads : int, optional
+            The number of threads to use to decompress zstd data which consists
+            of multiple frames. If `None`, data is decompressed in the calling thread.
 
         Returns
         -------
@@ -682,7 +899,46 @@ class DBNStore:
             If an empty buffer is specified.
 
         """
-        return cls(MemoryDataSource(data))
+        return cls(MemoryDataSource(data), threads=threads)
+
+    @classmethod
+    def merge(
+        cls,
+        paths: Iterable[PathLike[str] | str],
+        mmap: bool = False,
+        threads: int | None = None,
+    ) -> MergedDBNStore:
+        """
+        Load the data from several DBN files to be merged in timestamp order.
+
+        Parameters
+        ----------
+        paths : Iterable[PathLike[str] or str]
+            The paths to read from.
+        mmap : bool, default False
+            If the files should be memory-mapped.
+        threads : int, optional
+            The number of threads to use to decompress zstd data which consists
+            of multiple frames. If `None`, data is decompressed in the calling thread.
+
+        Returns
+        -------
+        MergedDBNStore
+
+        Raises
+        ------
+        FileNotFoundError
+            If a non-existent file is specified.
+        ValueError
+            If no paths are specified.
+            If the files cannot be merged.
+
+        See Also
+        --------
+        MergedDBNStore
+
+        """
+        return MergedDBNStore(cls.from_file(path, mmap=mmap, threads=threads) for path in paths)
 
     def insert_symbology_json(
         self,
@@ -724,6 +980,106 @@ class DBNStore:
                 )
                 raise
 
+    def replay_batches(
+        self,
+        callback: Callable[[np.ndarray[Any, Any]], None],
+        batch_size: int = REPLAY_BATCH_SIZE,
+        speed: float | None = None,
+    ) -> None:
+        """
+        Replay data by passing batches of records to the given callback as
+        numpy `ndarray`s, which is considerably faster than `DBNStore.replay`.
+
+        For DBN data with mixed record types, the records of each batch are
+        passed to the callback in one array per record type, so records of
+        different types are only in order between batches.
+
+        Parameters
+        ----------
+        callback : callable
+            The callback to the data handler.
+        batch_size : int, default 65536
+            The maximum number of records in each batch.
+        speed : float, optional
+            If set, batches are passed to the callback no sooner than their
+            index timestamp, relative to the first batch, with time scaled by
+            this factor; e.g. 1.0 replays at the pace the data was recorded.
+            The index timestamp is `ts_recv` if it exists in the schema, otherwise `ts_event`.
+
+        Raises
+        ------
+        ValueError
+            If `batch_size` is not a positive integer.
+            If `speed` is not positive.
+
+        See Also
+        --------
+        DBNStore.replay
+
+        """
+        if batch_size < 1:
+            raise ValueError("`batch_size` must be a positive integer")
+        if speed is not None and speed <= 0:
+            raise ValueError("`speed` must be positive")
+
+        replay_start = time.monotonic()
+        first_ts = None
+        for batch in self._iter_batches(batch_size):
+            if speed is not None:
+                ts = int(batch["ts_recv" if "ts_recv" in batch.dtype.names else "ts_event"][0])
+                if first_ts is None:
+                    first_ts = ts
+                delay = (ts - first_ts) / speed / 1e9 - (time.monotonic() - replay_start)
+                if delay > 0:
+                    time.sleep(delay)
+            try:
+                callback(batch)
+            except Exception:
+                logger.exception(
+                    "exception while replaying to user callback",
+                )
+                raise
+
+    def _iter_batches(
+        self,
+        batch_size: int,
+    ) -> Generator[np.ndarray[Any, Any], None, None]:
+        """
+        Yield the records in batches of at most `batch_size` records, with one
+        array per record type within each batch for mixed DBN data.
+        """
+        if self.schema is not None:
+            for batch in self.to_ndarray(count=batch_size):
+                if len(batch) > 0:
+                    yield batch.reshape(-1)
+            return
+
+        rtype_dtypes = _get_rtype_dtypes(self._metadata.ts_out)
+        if self._metadata.version == databento_dbn.DBN_VERSION:
+            # records of the latest version can be located without decoding them
+            for buffer, offsets, rtypes in self._scan_chunks():
+                for start in range(0, len(offsets), batch_size):
+                    batch_rtypes = rtypes[start : start + batch_size]
+                    batch_offsets = offsets[start : start + batch_size]
+                    for rtype in pd.unique(batch_rtypes).tolist():
+                        if rtype in rtype_dtypes:
+                            yield _gather_records(
+                                buffer,
+                                batch_offsets[batch_rtypes == rtype],
+                                rtype_dtypes[rtype],
+                            )
+            return
+
+        # older versions are upgraded by decoding each record
+        records = iter(self)
+        while decoded := list(itertools.islice(records, batch_size)):
+            grouped: dict[int, list[bytes]] = {}
+            for record in decoded:
+                if record.rtype in rtype_dtypes:
+                    grouped.setdefault(int(record.rtype), []).append(bytes(record))
+            for rtype, record_bytes in grouped.items():
+                yield np.frombuffer(b"".join(record_bytes), dtype=rtype_dtypes[rtype])
+
     def request_full_definitions(
         self,
         client: Historical,
@@ -796,137 +1152,219 @@ class DBNStore:
             end_date=end_date,
         )
 
-    def to_csv(
+    def slice(
         self,
-        path: PathLike[str] | str,
-        pretty_px: bool = True,
-        pretty_ts: bool = True,
-        map_symbols: bool = True,
-        compression: Compression | str = Compression.NONE,
-        schema: Schema | str | None = None,
-        mode: Literal["w", "x"] = "w",
-    ) -> None:
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+    ) -> np.ndarray[Any, Any]:
         """
-        Write the data to a file in CSV format.
+        Return the records within a time range as a numpy `ndarray`.
+
+        The records are located by binary search on the index timestamp,
+        `ts_recv` if it exists in the schema, otherwise `ts_event`, so only
+        the requested range is read.
+        For zstd compressed data, a sparse index of the zstd frames is built on
+        first use. For file-backed data, the index is cached in a sidecar file
+        next to the DBN file.
 
         Parameters
         ----------
-        path : PathLike[str] or str
-            The file path to write to.
-        pretty_px : bool, default True
-            If all price columns should be converted from `int` to `float` at
-            the correct scale (using the fixed-precision scalar 1e-9). Null
-            prices are replaced with an empty string.
-        pretty_ts : bool, default True
-            If all timestamp columns should be converted from UNIX nanosecond
-            `int` to tz-aware UTC `pd.Timestamp`.
-        map_symbols : bool, default True
-            If symbology mappings from the metadata should be used to create
-            a 'symbol' column, mapping the instrument ID to its requested symbol for
-            every record.
-        compression : Compression or str, default `Compression.NONE`
-            The output compression for writing.
-        schema : Schema or str, optional
-            The DBN schema for the csv.
-            This is only required when reading a DBN stream with mixed record types.
-        mode : str, default "w"
-            The file write mode to use, either "x" or "w".
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            The inclusive start of the range.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            The exclusive end of the range.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+
+        Returns
+        -------
+        np.ndarray
 
         Raises
         ------
         ValueError
-            If the schema for the array cannot be determined.
+            If the DBN data contains mixed record types.
+
+        Notes
+        -----
+        The records must be sorted by the index timestamp, which is the case for
+        data from the historical API.
 
         """
-        compression = validate_enum(compression, Compression, "compression")
-        schema = validate_maybe_enum(schema, Schema, "schema")
-        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
-        if schema is None:
-            if self.schema is None:
-                raise ValueError("a schema must be specified for mixed DBN data")
-            schema = self.schema
+        if self.schema is None:
+            raise ValueError("cannot slice mixed DBN data")
+
+        schema_struct = self._schema_struct_map[self.schema]
+        dtype = np.dtype(schema_struct._dtypes)
+        ts_field = schema_struct._ordered_fields[0]
+        start_ns = optional_datetime_to_unix_nanoseconds(start)
+        end_ns = optional_datetime_to_unix_nanoseconds(end)
+
+        if self.compression == Compression.NONE:
+            reader = self._data_source.reader
+            timestamps = _RecordTimestamps(
+                reader=reader,
+                dtype=dtype,
+                field=ts_field,
+                offset=self._metadata_length,
+                length=(self.nbytes - self._metadata_length) // dtype.itemsize,
+            )
+            lo = 0 if start_ns is None else bisect.bisect_left(timestamps, start_ns)
+            hi = len(timestamps) if end_ns is None else bisect.bisect_left(timestamps, end_ns, lo)
+            offset = self._metadata_length + lo * dtype.itemsize
 
-        with open(file_path, f"{mode}b") as output:
-            self._transcode(
-                output=output,  # type: ignore [arg-type]
-                encoding=Encoding.CSV,
-                pretty_px=pretty_px,
-                pretty_ts=pretty_ts,
-                map_symbols=map_symbols,
-                compression=compression,
-                schema=schema,
+            if isinstance(self._data_source, MemoryMappedDataSource):
+                return np.frombuffer(
+                    self._data_source.buffer,
+                    dtype=dtype,
+                    count=hi - lo,
+                    offset=offset,
+                )
+
+            reader.seek(offset)
+            return np.frombuffer(reader.read((hi - lo) * dtype.itemsize), dtype=dtype)
+
+        frame_index = self._get_frame_index(dtype, ts_field)
+        if not frame_index:
+            return np.empty([0], dtype=dtype)
+
+        position = 0
+        if start_ns is not None:
+            position = bisect.bisect_left([entry.ts for entry in frame_index], start_ns)
+        entry = frame_index[max(position - 1, 0)]
+
+        reader = self._data_source.reader
+        reader.seek(entry.offset)
+        ndarray_iter = NDArrayStreamIterator(
+            reader=zstandard.ZstdDecompressor().stream_reader(reader, read_across_frames=True),
+            dtype=schema_struct._dtypes,
+            offset=entry.record_offset - entry.decompressed_offset,
+            count=SLICE_CHUNK_SIZE,
+        )
+
+        arrays = []
+        for array in ndarray_iter:
+            chunk_ts = array[ts_field]
+            # search with the timestamp dtype to avoid a lossy promotion to float
+            lo = (
+                0
+                if start_ns is None
+                else np.searchsorted(chunk_ts, chunk_ts.dtype.type(max(start_ns, 0)), side="left")
+            )
+            hi = (
+                len(array)
+                if end_ns is None
+                else np.searchsorted(chunk_ts, chunk_ts.dtype.type(max(end_ns, 0)), side="left")
             )
+            arrays.append(array[lo:hi])
+            if hi < len(array):
+                break
 
-    @overload
-    def to_df(
-        self,
-        price_type: PriceType | str = ...,
-        pretty_ts: bool = ...,
-        map_symbols: bool = ...,
-        schema: Schema | str | None = ...,
-        tz: datetime.tzinfo | str = ...,
-        count: None = ...,
-    ) -> pd.DataFrame: ...
+        if not arrays:
+            return np.empty([0], dtype=dtype)
+        return np.concatenate(arrays)
 
-    @overload
-    def to_df(
-        self,
-        price_type: PriceType | str = ...,
-        pretty_ts: bool = ...,
-        map_symbols: bool = ...,
-        schema: Schema | str | None = ...,
-        tz: datetime.tzinfo | str = ...,
-        count: int = ...,
-    ) -> DataFrameIterator: ...
+    def split_by_schema(self) -> dict[Schema, np.ndarray[Any, Any]]:
+        """
+        Return the records of each schema as a numpy `ndarray` in a single pass
+        over the data.
 
-    def to_df(
+        The records are located by their record headers and copied into a
+        contiguous array for each record type without decoding them. This is
+        intended for DBN streams with mixed record types, such as those
+        recorded from the `Live` client.
+
+        Notes
+        -----
+        Records are returned in the DBN version of the data; they are not upgraded.
+        Records without a schema, such as `SymbolMappingMsg` and `SystemMsg`,
+        are skipped. TBBO and MBP-1 records share a record type and are returned
+        as MBP-1; trades records are returned as trades.
+
+        Returns
+        -------
+        dict[Schema, np.ndarray]
+            The records of each schema present in the data.
+
+        Raises
+        ------
+        BentoError
+            If a record has an unexpected length for its record type.
+
+        See Also
+        --------
+        to_ndarray
+
+        """
+        rtype_schemas: dict[int, Schema] = {}
+        for schema in Schema.variants():
+            rtype_schemas.setdefault(int(RType.from_schema(schema)), schema)
+
+        rtype_dtypes: dict[int, np.dtype[Any]] = {}
+        for rtype, schema in rtype_schemas.items():
+            schema_dtype = list(self._schema_struct_map[schema]._dtypes)
+            if self._metadata.ts_out:
+                schema_dtype.append(("ts_out", "u8"))
+            rtype_dtypes[rtype] = np.dtype(schema_dtype)
+
+        arrays: dict[int, list[np.ndarray[Any, Any]]] = {}
+        for buffer, offsets, rtypes in self._scan_chunks():
+            for rtype in np.unique(rtypes).tolist():
+                dtype = rtype_dtypes.get(rtype)
+                if dtype is None:
+                    continue  # no schema for this record type
+                records = _gather_records(buffer, offsets[rtypes == rtype], dtype)
+                arrays.setdefault(rtype, []).append(records)
+
+        return {
+            rtype_schemas[rtype]: _concatenate_records(rtype_arrays, rtype_dtypes[rtype])
+            for rtype, rtype_arrays in arrays.items()
+        }
+
+    def stats(
         self,
-        price_type: PriceType | str = PriceType.FLOAT,
-        pretty_ts: bool = True,
-        map_symbols: bool = True,
         schema: Schema | str | None = None,
-        tz: datetime.tzinfo | str | Default[datetime.tzinfo] = Default[datetime.tzinfo](
-            datetime.timezone.utc,
-        ),
-        count: int | None = None,
-    ) -> pd.DataFrame | DataFrameIterator:
+        gap_threshold: pd.Timedelta | datetime.timedelta | int | None = None,
+        pretty_ts: bool = True,
+    ) -> pd.DataFrame:
         """
-        Return the data as a `pd.DataFrame`.
+        Return summary statistics of the records of each instrument.
+
+        The statistics are computed over chunks of the records with numpy
+        reductions, so the records are never loaded at once.
 
         Notes
         -----
-        The DataFrame index will be set to `ts_recv` if it exists in the schema, otherwise it will be set to `ts_event`.
+        The returned `pd.DataFrame` is indexed by `instrument_id` and has the columns:
+        - `count`: the number of records
+        - `first_ts` and `last_ts`: the first and last index timestamps, where the
+          index timestamp is `ts_recv` if it exists in the schema, otherwise `ts_event`
+        - `min_price` and `max_price`: the lowest `low` and highest `high` for OHLCV
+          schemas, otherwise the lowest and highest defined `price`
+        - `volume`: the sum of `volume` for OHLCV schemas, otherwise the sum of
+          `size` of trade records for schemas with an `action` field
+        - `max_gap`: the longest time between consecutive records
+        - `num_gaps`: the number of times between consecutive records longer than
+          `gap_threshold`, if set
+
+        The price and volume columns are only present for schemas with those fields.
 
         Parameters
         ----------
-        price_type : PriceType or str, default "float"
-            The price type to use for price fields.
-            If "fixed", prices will have a type of `int` in fixed decimal format; each unit representing 1e-9 or 0.000000001.
-            If "float", prices will have a type of `float`.
-            If "decimal", prices will be instances of `decimal.Decimal`.
+        schema : Schema or str, optional
+            The DBN schema to compute statistics of.
+            This is only required when reading a DBN stream with mixed record types.
+        gap_threshold : pd.Timedelta, datetime.timedelta, or int, optional
+            If set, the times between consecutive records of an instrument longer
+            than this duration are counted as gaps.
+            If an integer is passed, then this represents nanoseconds.
         pretty_ts : bool, default True
-            If all timestamp columns should be converted from UNIX nanosecond
-            `int` to tz-aware `pd.Timestamp`. The timezone can be specified using the `tz` parameter.
-        map_symbols : bool, default True
-            If symbology mappings from the metadata should be used to create
-            a 'symbol' column, mapping the instrument ID to its requested symbol for
-            every record.
-        schema : Schema or str, optional
-            The DBN schema for the dataframe.
-            This is only required when reading a DBN stream with mixed record types.
-        tz : datetime.tzinfo or str, default UTC
-            If `pretty_ts` is `True`, all timestamps will be converted to the specified timezone.
-        count : int, optional
-            If set, instead of returning a single `DataFrame` a `DataFrameIterator`
-            instance will be returned. When iterated, this object will yield
-            a `DataFrame` with at most `count` elements until the entire contents
-            of the `DBNStore` are exhausted. This can be used to process a large
-            `DBNStore` in pieces instead of all at once.
+            If the timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `pd.Timestamp` and `pd.Timedelta`.
 
         Returns
         -------
         pd.DataFrame
-        DataFrameIterator
 
         Raises
         ------
@@ -934,202 +1372,415 @@ class DBNStore:
             If the DBN schema is unspecified and cannot be determined.
 
         """
-        price_type = validate_enum(price_type, PriceType, "price_type")
         schema = validate_maybe_enum(schema, Schema, "schema")
+        if schema is None:
+            if self.schema is None:
+                raise ValueError("a schema must be specified for mixed DBN data")
+            schema = self.schema
 
-        if isinstance(tz, Default):
-            tz = tz.value  # consume default
-        elif not pretty_ts:
-            raise ValueError(
-                "A timezone was specified when `pretty_ts` is `False`. Did you mean to set `pretty_ts=True`?",
+        threshold = None
+        if gap_threshold is not None:
+            threshold = (
+                gap_threshold
+                if isinstance(gap_threshold, int)
+                else pd.Timedelta(gap_threshold).value
             )
 
-        if isinstance(tz, str):
-            tz = zoneinfo.ZoneInfo(tz)
-        elif not isinstance(tz, datetime.tzinfo):
-            raise ValueError(
-                f"The value {tz!r} is not a valid datetime.tzinfo",
-            )
+        records_iter = self.to_ndarray(schema, STATS_CHUNK_SIZE)
+        dtype = list(self._schema_struct_map[schema]._dtypes)
+        if self._metadata.ts_out:
+            dtype.append(("ts_out", "u8"))
+        fields = {name for name, _ in dtype}
+        ts_field = self._schema_struct_map[schema]._ordered_fields[0]
+
+        stats = _reduce_stats(np.empty(0, dtype=dtype), fields, ts_field, threshold)
+        for records in records_iter:
+            chunk_stats = _reduce_stats(records.reshape(-1), fields, ts_field, threshold)
+            stats = _merge_stats(stats, chunk_stats, threshold)
+
+        instrument_ids = stats.pop("instrument_id")
+        df = pd.DataFrame(stats, index=pd.Index(instrument_ids, name="instrument_id"))
+        for column in ("min_price", "max_price"):
+            if column in df:
+                prices = df[column].to_numpy()
+                df[column] = np.where(np.isfinite(prices), prices / FIXED_PRICE_SCALE, np.nan)
+        if pretty_ts:
+            for column in ("first_ts", "last_ts"):
+                df[column] = pd.to_datetime(df[column], unit="ns", utc=True)
+            df["max_gap"] = pd.to_timedelta(df["max_gap"], unit="ns")
+
+        return df
+
+    def resample(
+        self,
+        freq: pd.Timedelta | datetime.timedelta | str | int,
+        price_field: str = "price",
+        by: str | None = "instrument_id",
+        schema: Schema | str | None = None,
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+    ) -> pd.DataFrame:
+        """
+        Return OHLCV bars with VWAP resampled from trade or quote records.
+
+        The bars are computed incrementally over chunks of the records, so the
+        records are never loaded at once; only the bars are kept in memory.
+
+        Notes
+        -----
+        Records are bucketed by their `ts_event` into intervals of `freq`,
+        and each bar is indexed by the start of its interval, as in the OHLCV schemas.
+        When `price_field` is "price", the open, high, low, and close are
+        taken from trade records. Otherwise they are taken from every record
+        with a defined `price_field`, such as "bid_px_00" for bars of the best bid.
+        The volume and VWAP are always computed from trade records.
+        Intervals without any records are omitted.
+
+        Parameters
+        ----------
+        freq : pd.Timedelta, datetime.timedelta, str, or int
+            The fixed duration of each bar, such as "1s" or "1min".
+            If an integer is passed, then this represents nanoseconds.
+        price_field : str, default "price"
+            The price field to compute the open, high, low, and close of.
+        by : str, optional
+            The integer field to compute separate bars for, such as "instrument_id".
+            If `None`, the bars are computed over all records.
+        schema : Schema or str, optional
+            The DBN schema to resample. This must be a schema with trade records,
+            such as "trades", "tbbo", or "mbp-1".
+            This is only required when reading a DBN stream with mixed record types.
+        price_type : PriceType or str, default "float"
+            The price type to use for the price columns.
+            If "fixed", prices will have a type of `int` in fixed decimal format;
+            each unit representing 1e-9 or 0.000000001.
+            If "float", prices will have a type of `float`.
+            If "decimal", prices will be instances of `decimal.Decimal`.
+        pretty_ts : bool, default True
+            If the `ts_event` index should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `pd.Timestamp`.
+        map_symbols : bool, default True
+            If symbology mappings from the metadata should be used to create
+            a 'symbol' column, mapping the instrument ID to its requested symbol for
+            every bar. Only applies when `by` is "instrument_id".
+
+        Returns
+        -------
+        pd.DataFrame
 
+        Raises
+        ------
+        ValueError
+            If an incorrect price type is specified.
+            If `freq` is not a positive fixed duration.
+            If the DBN schema is unspecified and cannot be determined.
+            If the DBN schema does not have trade records.
+            If `price_field` is not a price field of the schema.
+            If `by` is not an integer field of the schema.
+
+        """
+        price_type = validate_enum(price_type, PriceType, "price_type")
+        schema = validate_maybe_enum(schema, Schema, "schema")
         if schema is None:
             if self.schema is None:
                 raise ValueError("a schema must be specified for mixed DBN data")
             schema = self.schema
 
-        if count is None:
-            records = iter([self.to_ndarray(schema)])
-        else:
-            records = self.to_ndarray(schema, count)
+        freq_ns = freq if isinstance(freq, int) else pd.Timedelta(freq).value
+        if freq_ns <= 0:
+            raise ValueError("`freq` must be a positive duration")
+
+        struct_type = self._schema_struct_map[schema]
+        dtype = list(struct_type._dtypes)
+        if self._metadata.ts_out:
+            dtype.append(("ts_out", "u8"))
+        dtypes = dict(dtype)
+        if not {"action", "price", "size"} <= dtypes.keys():
+            raise ValueError(f"cannot resample {schema} data without trade records")
+        if price_field not in struct_type._price_fields:
+            raise ValueError(f"`{price_field}` is not a price field of {schema}")
+        if by is not None and np.dtype(dtypes.get(by, "S")).kind not in "iu":
+            raise ValueError(f"`{by}` is not an integer field of {schema}")
+
+        bars_list = [_records_to_bars(np.empty(0, dtype=dtype), freq_ns, price_field, by)]
+        pending = 0
+        for records in self.to_ndarray(schema, RESAMPLE_CHUNK_SIZE):
+            chunk_bars = _reduce_bars(
+                _records_to_bars(records.reshape(-1), freq_ns, price_field, by),
+                freq_ns,
+            )
+            bars_list.append(chunk_bars)
+            pending += len(chunk_bars["key"])
+            # compact once the pending bars outnumber the compacted bars
+            if pending >= len(bars_list[0]["key"]):
+                bars_list = [_reduce_bars(_concatenate_bars(bars_list), freq_ns)]
+                pending = 0
+        bars = _reduce_bars(_concatenate_bars(bars_list), freq_ns)
+
+        volume = bars["volume"]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            vwap = np.where(volume > 0, np.rint(bars["notional"] / volume), 0).astype(np.int64)
+        vwap[volume == 0] = UNDEF_PRICE
+
+        columns: dict[str, np.ndarray[Any, Any]] = {}
+        if by is not None:
+            columns[by] = bars["key"].astype(dtypes[by])
+        for column, values in (
+            ("open", bars["open"]),
+            ("high", bars["high"]),
+            ("low", bars["low"]),
+            ("close", bars["close"]),
+            ("volume", volume),
+            ("vwap", vwap),
+        ):
+            if column == "volume" or price_type == PriceType.FIXED:
+                columns[column] = values
+            elif price_type == PriceType.DECIMAL:
+                columns[column] = _px_to_decimal(values)
+            else:
+                columns[column] = _px_to_float(values)
 
-        if map_symbols:
+        if map_symbols and by == "instrument_id":
             self._instrument_map.insert_metadata(self.metadata)
+            columns["symbol"] = self._instrument_map.resolve_many(
+                columns[by],
+                bars["ts_event"].astype("datetime64[ns]").astype("datetime64[D]"),
+            )
 
-        df_iter = DataFrameIterator(
-            records=records,
-            count=count,
-            struct_type=self._schema_struct_map[schema],
-            instrument_map=self._instrument_map,
-            tz=tz,
-            price_type=price_type,
-            pretty_ts=pretty_ts,
-            map_symbols=map_symbols,
-        )
+        index = pd.Index(bars["ts_event"], name="ts_event")
+        if pretty_ts:
+            index = pd.DatetimeIndex(pd.to_datetime(index, unit="ns", utc=True), name="ts_event")
 
-        if count is None:
-            return next(df_iter)
+        return pd.DataFrame(columns, index=index)
 
-        return df_iter
+    def to_mbp(
+        self,
+        depth: int = 10,
+        interval: pd.Timedelta | datetime.timedelta | str | int = "100ms",
+    ) -> np.ndarray[Any, Any]:
+        """
+        Return MBP records sampled at a fixed interval by reconstructing the
+        limit order books of MBO data.
 
-    def to_parquet(
+        Notes
+        -----
+        Each record is a snapshot of the book of an instrument with the levels
+        of every MBO record with a `ts_recv` before the `ts_recv` of the snapshot,
+        which is an interval boundary. The `ts_event` and `sequence` are those of
+        the last MBO record applied to the book.
+        Snapshots do not describe an event, so they have an `action` and `side`
+        of "N", an undefined `price`, and a `size` of 0.
+        Every boundary from the first MBO record to the end of the interval of
+        the last has a snapshot of each instrument with any prior records.
+
+        Parameters
+        ----------
+        depth : int, default 10
+            The number of book levels, from 1 to 10. Levels beyond the depth
+            are undefined.
+        interval : pd.Timedelta, datetime.timedelta, str, or int, default "100ms"
+            The interval between snapshots.
+            If an integer is passed, then this represents nanoseconds.
+
+        Returns
+        -------
+        np.ndarray
+            The snapshots as MBP-1 records if `depth` is 1, otherwise as MBP-10 records.
+
+        Raises
+        ------
+        ValueError
+            If `depth` is not between 1 and 10.
+            If `interval` is not a positive fixed duration.
+            If the DBN schema is not MBO.
+
+        See Also
+        --------
+        Market.snapshots
+
+        """
+        # imported here since the book module depends on this one
+        from databento.common.book import Market
+
+        if not 1 <= depth <= 10:
+            raise ValueError("`depth` must be between 1 and 10")
+        if self.schema is not None and self.schema != Schema.MBO:
+            raise ValueError(f"cannot reconstruct MBP records from {self.schema} data")
+
+        interval_ns = interval if isinstance(interval, int) else pd.Timedelta(interval).value
+        if interval_ns <= 0:
+            raise ValueError("`interval` must be a positive duration")
+
+        schema = Schema.MBP_1 if depth == 1 else Schema.MBP_10
+        dtype = np.dtype(self._schema_struct_map[schema]._dtypes)
+
+        # the snapshots are converted in batches, since each field is copied separately
+        arrays = []
+        batch: list[np.ndarray[Any, Any]] = []
+        batch_size = 0
+        for snapshot in Market().snapshots(self, interval_ns, depth):
+            batch.append(snapshot)
+            batch_size += len(snapshot)
+            if batch_size >= MBP_BATCH_SIZE:
+                arrays.append(_snapshots_to_mbp(batch, schema, dtype, depth))
+                batch, batch_size = [], 0
+        if batch:
+            arrays.append(_snapshots_to_mbp(batch, schema, dtype, depth))
+
+        return _concatenate_records(arrays, dtype) if arrays else np.empty(0, dtype=dtype)
+
+    @overload
+    def to_arrow(
+        self,
+        price_type: PriceType | str = ...,
+        pretty_ts: bool = ...,
+        map_symbols: bool = ...,
+        schema: Schema | str | None = ...,
+        count: None = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+        columns: Iterable[str] | None = ...,
+    ) -> pa.Table: ...
+
+    @overload
+    def to_arrow(
+        self,
+        price_type: PriceType | str = ...,
+        pretty_ts: bool = ...,
+        map_symbols: bool = ...,
+        schema: Schema | str | None = ...,
+        count: int = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+        columns: Iterable[str] | None = ...,
+    ) -> pa.RecordBatchReader: ...
+
+    def to_arrow(
         self,
-        path: PathLike[str] | str,
         price_type: PriceType | str = PriceType.FLOAT,
         pretty_ts: bool = True,
         map_symbols: bool = True,
         schema: Schema | str | None = None,
-        mode: Literal["w", "x"] = "w",
-        parquet_schema: pa.Schema | None = None,
-        **kwargs: Any,
-    ) -> None:
+        count: int | None = None,
+        instrument_ids: Iterable[int] | int | None = None,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pa.Table | pa.RecordBatchReader:
         """
-        Write the data to a parquet file at the given path.
+        Return the data as a `pyarrow.Table`.
+
+        Notes
+        -----
+        The records are converted directly to Arrow without creating a `pd.DataFrame`.
+        The table includes pandas metadata, so calling `to_pandas` on it will set
+        the index to `ts_recv` if it exists in the schema, otherwise `ts_event`.
 
         Parameters
         ----------
-        path: PathLike[str] or str
-            The file path to write the data to.
-        price_type : str, default "float"
+        price_type : PriceType or str, default "float"
             The price type to use for price fields.
             If "fixed", prices will have a type of `int` in fixed decimal format; each unit representing 1e-9 or 0.000000001.
             If "float", prices will have a type of `float`.
-            The "decimal" price type is not supported at this time.
+            If "decimal", prices will have a type of `pyarrow.decimal128(19, 9)`.
         pretty_ts : bool, default True
             If all timestamp columns should be converted from UNIX nanosecond
             `int` to tz-aware UTC `pyarrow.TimestampType`.
         map_symbols : bool, default True
             If symbology mappings from the metadata should be used to create
-            a 'symbol' column, mapping the instrument ID to its requested symbol for
-            every record.
+            a dictionary encoded 'symbol' column, mapping the instrument ID
+            to its requested symbol for every record.
         schema : Schema or str, optional
-            The DBN schema for the parquet file.
+            The DBN schema for the table.
             This is only required when reading a DBN stream with mixed record types.
-        mode : str, default "w"
-            The file write mode to use, either "x" or "w".
-        parquet_schema : pyarrow.Schema, optional
-            The pyarrow parquet schema to use to write the parquet file.
-            This defaults to a detected schema based on the DataFrame representation.
-        **kwargs : Any
-            Keyword arguments to pass to the `pyarrow.parquet.ParquetWriter`.
-            These can be used to override the default behavior of the writer.
+        count : int, optional
+            If set, instead of returning a single `pyarrow.Table` a `pyarrow.RecordBatchReader`
+            instance will be returned. When iterated, this object will yield
+            a `pyarrow.RecordBatch` with at most `count` elements until the entire contents
+            of the `DBNStore` are exhausted. This can be used to process a large
+            `DBNStore` in pieces instead of all at once.
+        instrument_ids : Iterable[int] or int, optional
+            If set, only records for these instrument IDs are returned.
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp at or after `start` are returned.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp before `end` are returned.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        rtypes : Iterable[RType | int] or RType or int, optional
+            If set, only records of these record types are returned.
+        columns : Iterable[str], optional
+            If set, only these columns are extracted and formatted, in the given order.
+            The index column is always included and the 'symbol' column is
+            controlled by `map_symbols`.
+
+        Returns
+        -------
+        pyarrow.Table
+        pyarrow.RecordBatchReader
 
         Raises
         ------
         ValueError
             If an incorrect price type is specified.
             If the DBN schema is unspecified and cannot be determined.
+            If `columns` contains a field which is not in the schema.
 
         """
-        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
         price_type = validate_enum(price_type, PriceType, "price_type")
-
-        if price_type == PriceType.DECIMAL:
-            raise ValueError("the 'decimal' price type is not currently supported")
-
         schema = validate_maybe_enum(schema, Schema, "schema")
+
         if schema is None:
             if self.schema is None:
                 raise ValueError("a schema must be specified for mixed DBN data")
             schema = self.schema
 
-        dataframe_iter = self.to_df(
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+        fields = self._get_projected_fields(schema, columns, map_symbols)
+
+        filters: dict[str, Any] = {
+            "instrument_ids": instrument_ids,
+            "start": start,
+            "end": end,
+            "rtypes": rtypes,
+            "columns": fields,
+        }
+        if count is None:
+            records = iter([self.to_ndarray(schema, **filters)])
+        else:
+            records = self.to_ndarray(schema, count, **filters)
+
+        if map_symbols:
+            self._instrument_map.insert_metadata(self.metadata)
+
+        batch_iter = RecordBatchIterator(
+            records=records,
+            struct_type=self._schema_struct_map[schema],
+            instrument_map=self._instrument_map,
             price_type=price_type,
             pretty_ts=pretty_ts,
             map_symbols=map_symbols,
-            schema=schema,
-            count=PARQUET_CHUNK_SIZE,
+            columns=columns,
+            dictionary_symbols=True,
         )
 
-        writer = None
-        try:
-            for frame in dataframe_iter:
-                if writer is None:
-                    # Initialize the writer using the first DataFrame
-                    if parquet_schema is None:
-                        parquet_schema = pa.Schema.from_pandas(frame)
-                    writer = pq.ParquetWriter(
-                        where=kwargs.pop("where", file_path),
-                        schema=parquet_schema,
-                        **kwargs,
-                    )
-                writer.write_table(
-                    pa.Table.from_pandas(
-                        frame,
-                        schema=parquet_schema,
-                    ),
-                )
-        finally:
-            if writer is not None:
-                writer.close()
-
-    def to_file(
-        self,
-        path: PathLike[str] | str,
-        mode: Literal["w", "x"] = "w",
-        compression: Compression | str | None = None,
-    ) -> None:
-        """
-        Write the data to a DBN file at the given path.
-
-        Parameters
-        ----------
-        path : PathLike[str] or str
-            The file path to write to.
-        mode : str, default "w"
-            The file write mode to use, either "x" or "w".
-        compression : Compression or str, optional
-            The compression format to write. If `None`, uses the same compression as the underlying data.
-
-        Raises
-        ------
-        IsADirectoryError
-            If path is a directory.
-        FileExistsError
-            If path exists.
-        PermissionError
-            If path is not writable.
-
-        """
-        compression = validate_maybe_enum(compression, Compression, "compression")
-        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
-
-        writer: IO[bytes] | zstandard.ZstdCompressionWriter
-        if compression is None or compression == self.compression:
-            # Handle trivial case
-            with open(file_path, mode=f"{mode}b") as writer:
-                reader = self._data_source.reader
-                while chunk := reader.read(2**16):
-                    writer.write(chunk)
-            return
-
-        if compression == Compression.ZSTD:
-            writer = zstandard.ZstdCompressor(
-                write_checksum=True,
-            ).stream_writer(
-                open(file_path, mode=f"{mode}b"),
-                closefd=True,
-            )
-        else:
-            writer = open(file_path, mode=f"{mode}b")
-
-        try:
-            reader = self.reader
+        first_batch = next(batch_iter)
+        if count is None:
+            return pa.Table.from_batches([first_batch])
 
-            while chunk := reader.read(2**16):
-                writer.write(chunk)
-        finally:
-            writer.close()
+        return pa.RecordBatchReader.from_batches(
+            first_batch.schema,
+            itertools.chain([first_batch], batch_iter),
+        )
 
-    def to_json(
+    def to_csv(
         self,
         path: PathLike[str] | str,
         pretty_px: bool = True,
@@ -1140,7 +1791,7 @@ class DBNStore:
         mode: Literal["w", "x"] = "w",
     ) -> None:
         """
-        Write the data to a file in JSON format.
+        Write the data to a file in CSV format.
 
         Parameters
         ----------
@@ -1148,7 +1799,8 @@ class DBNStore:
             The file path to write to.
         pretty_px : bool, default True
             If all price columns should be converted from `int` to `float` at
-            the correct scale (using the fixed-precision scalar 1e-9).
+            the correct scale (using the fixed-precision scalar 1e-9). Null
+            prices are replaced with an empty string.
         pretty_ts : bool, default True
             If all timestamp columns should be converted from UNIX nanosecond
             `int` to tz-aware UTC `pd.Timestamp`.
@@ -1159,7 +1811,7 @@ class DBNStore:
         compression : Compression or str, default `Compression.NONE`
             The output compression for writing.
         schema : Schema or str, optional
-            The DBN schema for the json.
+            The DBN schema for the csv.
             This is only required when reading a DBN stream with mixed record types.
         mode : str, default "w"
             The file write mode to use, either "x" or "w".
@@ -1173,7 +1825,6 @@ class DBNStore:
         compression = validate_enum(compression, Compression, "compression")
         schema = validate_maybe_enum(schema, Schema, "schema")
         file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
-
         if schema is None:
             if self.schema is None:
                 raise ValueError("a schema must be specified for mixed DBN data")
@@ -1182,7 +1833,7 @@ class DBNStore:
         with open(file_path, f"{mode}b") as output:
             self._transcode(
                 output=output,  # type: ignore [arg-type]
-                encoding=Encoding.JSON,
+                encoding=Encoding.CSV,
                 pretty_px=pretty_px,
                 pretty_ts=pretty_ts,
                 map_symbols=map_symbols,
@@ -1191,154 +1842,1429 @@ class DBNStore:
             )
 
     @overload
-    def to_ndarray(  # type: ignore [misc]
+    def to_df(
         self,
+        price_type: PriceType | str = ...,
+        pretty_ts: bool = ...,
+        map_symbols: bool = ...,
         schema: Schema | str | None = ...,
+        tz: datetime.tzinfo | str = ...,
         count: None = ...,
-    ) -> np.ndarray[Any, Any]: ...
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+        columns: Iterable[str] | None = ...,
+    ) -> pd.DataFrame: ...
 
     @overload
-    def to_ndarray(
+    def to_df(
         self,
-        schema: Schema | str | None = ...,
-        count: int = ...,
-    ) -> NDArrayIterator: ...
+        price_type: PriceType | str = ...,
+        pretty_ts: bool = ...,
+        map_symbols: bool = ...,
+        schema: Schema | str | None = ...,
+        tz: datetime.tzinfo | str = ...,
+        count: int = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+        columns: Iterable[str] | None = ...,
+    ) -> DataFrameIterator: ...
 
-    def to_ndarray(
+    def to_df(
         self,
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
         schema: Schema | str | None = None,
+        tz: datetime.tzinfo | str | Default[datetime.tzinfo] = Default[datetime.tzinfo](
+            datetime.timezone.utc,
+        ),
         count: int | None = None,
-    ) -> np.ndarray[Any, Any] | NDArrayIterator:
+        instrument_ids: Iterable[int] | int | None = None,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pd.DataFrame | DataFrameIterator:
         """
-        Return the data as a numpy `ndarray`.
+        Return the data as a `pd.DataFrame`.
+
+        Notes
+        -----
+        The DataFrame index will be set to `ts_recv` if it exists in the schema, otherwise it will be set to `ts_event`.
 
         Parameters
         ----------
+        price_type : PriceType or str, default "float"
+            The price type to use for price fields.
+            If "fixed", prices will have a type of `int` in fixed decimal format; each unit representing 1e-9 or 0.000000001.
+            If "float", prices will have a type of `float`.
+            If "decimal", prices will be instances of `decimal.Decimal`.
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware `pd.Timestamp`. The timezone can be specified using the `tz` parameter.
+        map_symbols : bool, default True
+            If symbology mappings from the metadata should be used to create
+            a 'symbol' column, mapping the instrument ID to its requested symbol for
+            every record.
         schema : Schema or str, optional
-            The DBN schema for the array.
+            The DBN schema for the dataframe.
             This is only required when reading a DBN stream with mixed record types.
+        tz : datetime.tzinfo or str, default UTC
+            If `pretty_ts` is `True`, all timestamps will be converted to the specified timezone.
         count : int, optional
-            If set, instead of returning a single `np.ndarray` a `NDArrayIterator`
+            If set, instead of returning a single `DataFrame` a `DataFrameIterator`
             instance will be returned. When iterated, this object will yield
-            a `np.ndarray` with at most `count` elements until the entire contents
+            a `DataFrame` with at most `count` elements until the entire contents
             of the `DBNStore` are exhausted. This can be used to process a large
             `DBNStore` in pieces instead of all at once.
+        instrument_ids : Iterable[int] or int, optional
+            If set, only records for these instrument IDs are returned.
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp at or after `start` are returned.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp before `end` are returned.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        rtypes : Iterable[RType | int] or RType or int, optional
+            If set, only records of these record types are returned.
+        columns : Iterable[str], optional
+            If set, only these columns are extracted and formatted, in the given order.
+            The index column is always included and the 'symbol' column is
+            controlled by `map_symbols`.
 
         Returns
         -------
-        np.ndarray
-        NDArrayIterator
+        pd.DataFrame
+        DataFrameIterator
 
         Raises
         ------
         ValueError
             If the DBN schema is unspecified and cannot be determined.
+            If `columns` contains a field which is not in the schema.
 
         """
+        price_type = validate_enum(price_type, PriceType, "price_type")
         schema = validate_maybe_enum(schema, Schema, "schema")
-        ndarray_iter: NDArrayIterator
 
-        if self.schema is None:
-            # If schema is None, we're handling heterogeneous data from the live client
-            # This is less performant because the records of a given schema are not contiguous in memory
-            if schema is None:
-                raise ValueError("a schema must be specified for mixed DBN data")
+        tz = _validate_tz(tz, pretty_ts)
 
-            # Always use the latest since DBNStore iteration upgrades
-            schema_struct = SCHEMA_STRUCT_MAP[schema]
-            schema_dtype = schema_struct._dtypes
-            schema_rtype = RType.from_schema(schema)
-            schema_filter = filter(lambda r: r.rtype == schema_rtype, self)
+        if schema is None:
+            if self.schema is None:
+                raise ValueError("a schema must be specified for mixed DBN data")
+            schema = self.schema
 
-            if self._metadata.ts_out:
-                schema_dtype.append(("ts_out", "u8"))
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+        fields = self._get_projected_fields(schema, columns, map_symbols)
 
-            reader = self.reader
-            reader.seek(self._metadata_length)
-            ndarray_iter = NDArrayBytesIterator(
-                records=map(bytes, schema_filter),
-                dtype=schema_dtype,
-                count=count,
+        if count is None:
+            records = iter(
+                [
+                    self.to_ndarray(
+                        schema,
+                        instrument_ids=instrument_ids,
+                        start=start,
+                        end=end,
+                        rtypes=rtypes,
+                        columns=fields,
+                    ),
+                ],
             )
         else:
-            # If schema is set, we're handling homogeneous historical data
-            schema_struct = self._schema_struct_map[self.schema]
-            schema_dtype = schema_struct._dtypes
+            records = self.to_ndarray(
+                schema,
+                count,
+                instrument_ids=instrument_ids,
+                start=start,
+                end=end,
+                rtypes=rtypes,
+                columns=fields,
+            )
 
-            if schema is not None and schema != self.schema:
-                # This is to maintain identical behavior with NDArrayBytesIterator
-                ndarray_iter = iter([np.empty([0, 1], dtype=schema_dtype)])
-            else:
-                ndarray_iter = NDArrayStreamIterator(
-                    reader=self.reader,
-                    dtype=schema_dtype,
-                    offset=self._metadata_length,
-                    count=count,
-                )
+        if map_symbols:
+            self._instrument_map.insert_metadata(self.metadata)
+
+        df_iter = DataFrameIterator(
+            records=records,
+            count=count,
+            struct_type=self._schema_struct_map[schema],
+            instrument_map=self._instrument_map,
+            tz=tz,
+            price_type=price_type,
+            pretty_ts=pretty_ts,
+            map_symbols=map_symbols,
+            columns=columns,
+        )
 
         if count is None:
-            return next(ndarray_iter, np.empty([0, 1], dtype=schema_dtype))
+            return next(df_iter)
 
-        return ndarray_iter
+        return df_iter
 
-    def _transcode(
+    def to_parquet(
         self,
-        output: BinaryIO,
-        encoding: Encoding,
-        pretty_px: bool,
-        pretty_ts: bool,
-        map_symbols: bool,
-        compression: Compression,
-        schema: Schema,
+        path: PathLike[str] | str,
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        schema: Schema | str | None = None,
+        mode: Literal["w", "x"] = "w",
+        parquet_schema: pa.Schema | None = None,
+        columns: Iterable[str] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Write the data to a parquet file at the given path.
+
+        Parameters
+        ----------
+        path: PathLike[str] or str
+            The file path to write the data to.
+        price_type : str, default "float"
+            The price type to use for price fields.
+            If "fixed", prices will have a type of `int` in fixed decimal format; each unit representing 1e-9 or 0.000000001.
+            If "float", prices will have a type of `float`.
+            If "decimal", prices will have a type of `pyarrow.decimal128(19, 9)`.
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `pyarrow.TimestampType`.
+        map_symbols : bool, default True
+            If symbology mappings from the metadata should be used to create
+            a 'symbol' column, mapping the instrument ID to its requested symbol for
+            every record.
+        schema : Schema or str, optional
+            The DBN schema for the parquet file.
+            This is only required when reading a DBN stream with mixed record types.
+        mode : str, default "w"
+            The file write mode to use, either "x" or "w".
+        parquet_schema : pyarrow.Schema, optional
+            The pyarrow parquet schema to use to write the parquet file.
+            This defaults to a detected schema based on the DataFrame representation.
+        columns : Iterable[str], optional
+            If set, only these columns are written, in the given order.
+            The index column is always included and the 'symbol' column is
+            controlled by `map_symbols`.
+        **kwargs : Any
+            Keyword arguments to pass to the `pyarrow.parquet.ParquetWriter`.
+            These can be used to override the default behavior of the writer.
+
+        Raises
+        ------
+        ValueError
+            If an incorrect price type is specified.
+            If the DBN schema is unspecified and cannot be determined.
+            If `columns` contains a field which is not in the schema.
+
+        """
+        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
+        price_type = validate_enum(price_type, PriceType, "price_type")
+
+        schema = validate_maybe_enum(schema, Schema, "schema")
+        if schema is None:
+            if self.schema is None:
+                raise ValueError("a schema must be specified for mixed DBN data")
+            schema = self.schema
+
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+        fields = self._get_projected_fields(schema, columns, map_symbols)
+
+        if map_symbols:
+            self._instrument_map.insert_metadata(self.metadata)
+
+        batch_iter = RecordBatchIterator(
+            records=self.to_ndarray(schema, PARQUET_CHUNK_SIZE, columns=fields),
+            struct_type=self._schema_struct_map[schema],
+            instrument_map=self._instrument_map,
+            price_type=price_type,
+            pretty_ts=pretty_ts,
+            map_symbols=map_symbols,
+            columns=columns,
+        )
+
+        _write_parquet(batch_iter, file_path, parquet_schema, **kwargs)
+
+    def to_parquet_dataset(
+        self,
+        root: PathLike[str] | str,
+        partition_by: Iterable[str] = ("date",),
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        schema: Schema | str | None = None,
+        mode: Literal["w", "x"] = "w",
+        row_group_size: int = PARQUET_ROW_GROUP_SIZE,
+        columns: Iterable[str] | None = None,
+        **kwargs: Any,
     ) -> None:
+        """
+        Write the data to a Hive partitioned parquet dataset in the given
+        directory.
+
+        Each partition is written to a directory such as
+        `root/date=2020-12-28/symbol=ESH1/`, which query engines can use to
+        skip partitions outside of a filter. Records are written in their
+        original order, so the row group statistics of the index column
+        are narrow time ranges which can be pruned by time range scans.
+
+        Parameters
+        ----------
+        root : PathLike[str] or str
+            The directory to write the dataset to.
+        partition_by : Iterable[str], default ("date",)
+            The columns to partition the dataset by, in directory order.
+            "date" is the UTC date of the index column. Any other column of
+            the data, such as "symbol" or "instrument_id", can also be used.
+        price_type : str, default "float"
+            The price type to use for price fields.
+            If "fixed", prices will have a type of `int` in fixed decimal format; each unit representing 1e-9 or 0.000000001.
+            If "float", prices will have a type of `float`.
+            If "decimal", prices will have a type of `pyarrow.decimal128(19, 9)`.
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `pyarrow.TimestampType`.
+        map_symbols : bool, default True
+            If symbology mappings from the metadata should be used to create
+            a 'symbol' column, mapping the instrument ID to its requested symbol for
+            every record.
+        schema : Schema or str, optional
+            The DBN schema for the dataset.
+            This is only required when reading a DBN stream with mixed record types.
+        mode : str, default "w"
+            The write mode to use, either "x" or "w".
+            If "w", existing files in the written partitions are deleted.
+            If "x", a `FileExistsError` is raised if the directory is not empty.
+        row_group_size : int, default 131072
+            The number of rows in each parquet row group.
+        columns : Iterable[str], optional
+            If set, only these columns are written, in the given order.
+            The index column is always included and the 'symbol' column is
+            controlled by `map_symbols`.
+        **kwargs : Any
+            Keyword arguments to pass to `pyarrow.dataset.write_dataset`.
+            These can be used to override the default behavior of the writer,
+            e.g. `max_partitions`.
+
+        Raises
+        ------
+        ValueError
+            If an incorrect price type is specified.
+            If the DBN schema is unspecified and cannot be determined.
+            If `columns` contains a field which is not in the schema.
+            If `partition_by` is empty or contains a column which is not in the data.
+        FileExistsError
+            If `mode` is "x" and `root` is not empty.
+
+        See Also
+        --------
+        to_parquet
+
+        """
+        root_path = validate_path(root, "root")
+        price_type = validate_enum(price_type, PriceType, "price_type")
+        partition_by = list(dict.fromkeys(partition_by))
+        if not partition_by:
+            raise ValueError("at least one column must be specified in `partition_by`")
+        if mode == "x" and root_path.is_dir() and any(root_path.iterdir()):
+            raise FileExistsError(f"{root_path} is not empty")
+
+        schema = validate_maybe_enum(schema, Schema, "schema")
+        if schema is None:
+            if self.schema is None:
+                raise ValueError("a schema must be specified for mixed DBN data")
+            schema = self.schema
+
+        if columns is not None:
+            columns = list(dict.fromkeys(columns))
+        fields = self._get_projected_fields(schema, columns, map_symbols)
+
         if map_symbols:
             self._instrument_map.insert_metadata(self.metadata)
-            symbol_map = self._instrument_map.build_symbol_map()
-        else:
-            symbol_map = None
 
-        transcoder = Transcoder(
-            file=output,
-            encoding=encoding,
-            compression=compression,
-            pretty_px=pretty_px,
+        struct_type = self._schema_struct_map[schema]
+        index_column = struct_type._ordered_fields[0]
+        batch_iter = RecordBatchIterator(
+            records=self.to_ndarray(schema, PARQUET_CHUNK_SIZE, columns=fields),
+            struct_type=struct_type,
+            instrument_map=self._instrument_map,
+            price_type=price_type,
+            pretty_ts=pretty_ts,
+            map_symbols=map_symbols,
+            columns=columns,
+        )
+
+        def with_partition_columns(batch: pa.RecordBatch) -> pa.RecordBatch:
+            # the index column is first, as pandas metadata is not kept
+            names = [index_column, *(n for n in batch.schema.names if n != index_column)]
+            arrays = [batch.column(name) for name in names]
+            if "date" in partition_by and "date" not in names:
+                index = batch.column(index_column)
+                if not pretty_ts:
+                    index = pc.cast(index, pa.int64()).cast(pa.timestamp("ns", tz="UTC"))
+                names.append("date")
+                arrays.append(pc.cast(index, pa.date32()))
+            return pa.RecordBatch.from_arrays(arrays, names=names)
+
+        first_batch = with_partition_columns(next(batch_iter))
+        for column in partition_by:
+            if column not in first_batch.schema.names:
+                raise ValueError(f"cannot partition by `{column}`, it is not in the data")
+
+        dataset_schema = first_batch.schema
+        ds.write_dataset(
+            itertools.chain([first_batch], map(with_partition_columns, batch_iter)),
+            root_path,
+            schema=dataset_schema,
+            format="parquet",
+            partitioning=ds.partitioning(
+                pa.schema([dataset_schema.field(column) for column in partition_by]),
+                flavor="hive",
+            ),
+            preserve_order=True,
+            min_rows_per_group=row_group_size,
+            max_rows_per_group=row_group_size,
+            existing_data_behavior="delete_matching" if mode == "w" else "error",
+            **kwargs,
+        )
+
+    def to_polars(
+        self,
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        schema: Schema | str | None = None,
+        count: int | None = None,
+        lazy: bool = False,
+        instrument_ids: Iterable[int] | int | None = None,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> pl.DataFrame | pl.LazyFrame | Iterator[pl.DataFrame] | Iterator[pl.LazyFrame]:
+        """
+        Return the data as a `polars.DataFrame`.
+
+        This requires the optional `polars` dependency, which can be installed
+        with `pip install databento[polars]`.
+
+        Notes
+        -----
+        The frame is built from the Arrow representation of the records, see `to_arrow`.
+        The first column will be `ts_recv` if it exists in the schema, otherwise `ts_event`.
+
+        Parameters
+        ----------
+        price_type : PriceType or str, default "float"
+            The price type to use for price fields.
+            If "fixed", prices will have a type of `int` in fixed decimal format; each unit representing 1e-9 or 0.000000001.
+            If "float", prices will have a type of `float`.
+            If "decimal", prices will have a type of `polars.Decimal(19, 9)`.
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `polars.Datetime`.
+        map_symbols : bool, default True
+            If symbology mappings from the metadata should be used to create
+            a categorical 'symbol' column, mapping the instrument ID to its
+            requested symbol for every record.
+        schema : Schema or str, optional
+            The DBN schema for the frame.
+            This is only required when reading a DBN stream with mixed record types.
+        count : int, optional
+            If set, instead of returning a single frame an iterator will be returned.
+            When iterated, this object will yield a frame with at most `count`
+            elements until the entire contents of the `DBNStore` are exhausted.
+            This can be used to process a large `DBNStore` in pieces instead of all at once.
+        lazy : bool, default False
+            If `polars.LazyFrame` instances should be returned instead of
+            `polars.DataFrame` instances.
+        instrument_ids : Iterable[int] or int, optional
+            If set, only records for these instrument IDs are returned.
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp at or after `start` are returned.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp before `end` are returned.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        rtypes : Iterable[RType | int] or RType or int, optional
+            If set, only records of these record types are returned.
+        columns : Iterable[str], optional
+            If set, only these columns are extracted and formatted, in the given order.
+            The index column is always included and the 'symbol' column is
+            controlled by `map_symbols`.
+
+        Returns
+        -------
+        polars.DataFrame
+        polars.LazyFrame
+        Iterator[polars.DataFrame]
+        Iterator[polars.LazyFrame]
+
+        Raises
+        ------
+        ImportError
+            If `polars` is not installed.
+        ValueError
+            If an incorrect price type is specified.
+            If the DBN schema is unspecified and cannot be determined.
+            If `columns` contains a field which is not in the schema.
+
+        See Also
+        --------
+        to_arrow
+
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError(
+                "The `polars` package is required for `to_polars`. "
+                "Install it with `pip install databento[polars]`.",
+            ) from None
+
+        arrow_data = self.to_arrow(
+            price_type=price_type,
+            pretty_ts=pretty_ts,
+            map_symbols=map_symbols,
+            schema=schema,
+            count=count,
+            instrument_ids=instrument_ids,
+            start=start,
+            end=end,
+            rtypes=rtypes,
+            columns=columns,
+        )
+
+        def to_frame(data: pa.Table | pa.RecordBatch) -> pl.DataFrame | pl.LazyFrame:
+            # the index column is last in the Arrow layout for pandas
+            index_column = data.schema.names[-1]
+            # a table or record batch is always converted to a DataFrame
+            frame: pl.DataFrame = pl.from_arrow(data, rechunk=False)  # type: ignore [assignment]
+            frame = frame.select(index_column, pl.exclude(index_column))
+            return frame.lazy() if lazy else frame
+
+        if count is None:
+            return to_frame(arrow_data)
+
+        return map(to_frame, arrow_data)  # type: ignore [return-value]
+
+    def to_file(
+        self,
+        path: PathLike[str] | str,
+        mode: Literal["w", "x"] = "w",
+        compression: Compression | str | None = None,
+        frame_size: int | None = None,
+    ) -> None:
+        """
+        Write the data to a DBN file at the given path.
+
+        Parameters
+        ----------
+        path : PathLike[str] or str
+            The file path to write to.
+        mode : str, default "w"
+            The file write mode to use, either "x" or "w".
+        compression : Compression or str, optional
+            The compression format to write. If `None`, uses the same compression as the underlying data.
+        frame_size : int, optional
+            The number of uncompressed bytes to write in each zstd frame.
+            Files with multiple frames can be decompressed in parallel.
+            If `None`, the data is written as a single frame.
+
+        Raises
+        ------
+        ValueError
+            If `frame_size` is specified for uncompressed output.
+        IsADirectoryError
+            If path is a directory.
+        FileExistsError
+            If path exists.
+        PermissionError
+            If path is not writable.
+
+        """
+        compression = validate_maybe_enum(compression, Compression, "compression")
+        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
+
+        if compression is None:
+            compression = self.compression
+
+        writer: IO[bytes] | zstandard.ZstdCompressionWriter
+        if frame_size is not None:
+            if compression != Compression.ZSTD:
+                raise ValueError("a frame_size can only be specified for zstd compression")
+            if frame_size < 1:
+                raise ValueError("frame_size must be at least 1")
+
+            compressor = zstandard.ZstdCompressor(write_checksum=True)
+            with open(file_path, mode=f"{mode}b") as writer:
+                reader = self.reader
+                while chunk := reader.read(frame_size):
+                    writer.write(compressor.compress(chunk))
+            return
+
+        if compression == self.compression:
+            # Handle trivial case
+            with open(file_path, mode=f"{mode}b") as writer:
+                reader = self._data_source.reader
+                while chunk := reader.read(2**16):
+                    writer.write(chunk)
+            return
+
+        if compression == Compression.ZSTD:
+            writer = zstandard.ZstdCompressor(
+                write_checksum=True,
+            ).stream_writer(
+                open(file_path, mode=f"{mode}b"),
+                closefd=True,
+            )
+        else:
+            writer = open(file_path, mode=f"{mode}b")
+
+        try:
+            reader = self.reader
+
+            while chunk := reader.read(2**16):
+                writer.write(chunk)
+        finally:
+            writer.close()
+
+    def to_json(
+        self,
+        path: PathLike[str] | str,
+        pretty_px: bool = True,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        compression: Compression | str = Compression.NONE,
+        schema: Schema | str | None = None,
+        mode: Literal["w", "x"] = "w",
+    ) -> None:
+        """
+        Write the data to a file in JSON format.
+
+        Parameters
+        ----------
+        path : PathLike[str] or str
+            The file path to write to.
+        pretty_px : bool, default True
+            If all price columns should be converted from `int` to `float` at
+            the correct scale (using the fixed-precision scalar 1e-9).
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `pd.Timestamp`.
+        map_symbols : bool, default True
+            If symbology mappings from the metadata should be used to create
+            a 'symbol' column, mapping the instrument ID to its requested symbol for
+            every record.
+        compression : Compression or str, default `Compression.NONE`
+            The output compression for writing.
+        schema : Schema or str, optional
+            The DBN schema for the json.
+            This is only required when reading a DBN stream with mixed record types.
+        mode : str, default "w"
+            The file write mode to use, either "x" or "w".
+
+        Raises
+        ------
+        ValueError
+            If the schema for the array cannot be determined.
+
+        """
+        compression = validate_enum(compression, Compression, "compression")
+        schema = validate_maybe_enum(schema, Schema, "schema")
+        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
+
+        if schema is None:
+            if self.schema is None:
+                raise ValueError("a schema must be specified for mixed DBN data")
+            schema = self.schema
+
+        with open(file_path, f"{mode}b") as output:
+            self._transcode(
+                output=output,  # type: ignore [arg-type]
+                encoding=Encoding.JSON,
+                pretty_px=pretty_px,
+                pretty_ts=pretty_ts,
+                map_symbols=map_symbols,
+                compression=compression,
+                schema=schema,
+            )
+
+    @overload
+    def to_ndarray(  # type: ignore [misc]
+        self,
+        schema: Schema | str | None = ...,
+        count: None = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+        columns: Iterable[str] | None = ...,
+    ) -> np.ndarray[Any, Any]: ...
+
+    @overload
+    def to_ndarray(
+        self,
+        schema: Schema | str | None = ...,
+        count: int = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+        columns: Iterable[str] | None = ...,
+    ) -> NDArrayIterator: ...
+
+    def to_ndarray(
+        self,
+        schema: Schema | str | None = None,
+        count: int | None = None,
+        instrument_ids: Iterable[int] | int | None = None,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+        columns: Iterable[str] | None = None,
+    ) -> np.ndarray[Any, Any] | NDArrayIterator:
+        """
+        Return the data as a numpy `ndarray`.
+
+        Parameters
+        ----------
+        schema : Schema or str, optional
+            The DBN schema for the array.
+            This is only required when reading a DBN stream with mixed record types.
+        count : int, optional
+            If set, instead of returning a single `np.ndarray` a `NDArrayIterator`
+            instance will be returned. When iterated, this object will yield
+            a `np.ndarray` with at most `count` elements until the entire contents
+            of the `DBNStore` are exhausted. This can be used to process a large
+            `DBNStore` in pieces instead of all at once.
+        instrument_ids : Iterable[int] or int, optional
+            If set, only records for these instrument IDs are returned.
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp at or after `start` are returned.
+            The index timestamp is `ts_recv` if it exists in the schema, otherwise `ts_event`.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp before `end` are returned.
+            The index timestamp is `ts_recv` if it exists in the schema, otherwise `ts_event`.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        rtypes : Iterable[RType | int] or RType or int, optional
+            If set, only records of these record types are returned.
+        columns : Iterable[str], optional
+            If set, only these fields are returned, in the given order.
+            The arrays are views of the full records, so no data is copied.
+
+        Returns
+        -------
+        np.ndarray
+        NDArrayIterator
+
+        Raises
+        ------
+        ValueError
+            If the DBN schema is unspecified and cannot be determined.
+            If `columns` contains a field which is not in the schema.
+
+        """
+        schema = validate_maybe_enum(schema, Schema, "schema")
+        ndarray_iter: NDArrayIterator
+
+        if self.schema is None:
+            # If schema is None, we're handling heterogeneous data from the live client
+            # This is less performant because the records of a given schema are not contiguous in memory
+            if schema is None:
+                raise ValueError("a schema must be specified for mixed DBN data")
+
+            # Always use the latest since DBNStore iteration upgrades
+            schema_struct = SCHEMA_STRUCT_MAP[schema]
+            schema_dtype = schema_struct._dtypes
+            schema_rtype = RType.from_schema(schema)
+
+            if self._metadata.ts_out:
+                schema_dtype.append(("ts_out", "u8"))
+
+            if self._metadata.version == databento_dbn.DBN_VERSION:
+                # records of the latest version can be located without decoding them
+                ndarray_iter = NDArrayScanIterator(
+                    chunks=self._scan_chunks(),
+                    dtype=schema_dtype,
+                    rtype=int(schema_rtype),
+                    count=count,
+                )
+            else:
+                schema_filter = filter(lambda r: r.rtype == schema_rtype, self)
+                reader = self.reader
+                reader.seek(self._metadata_length)
+                ndarray_iter = NDArrayBytesIterator(
+                    records=map(bytes, schema_filter),
+                    dtype=schema_dtype,
+                    count=count,
+                )
+        else:
+            # If schema is set, we're handling homogeneous historical data
+            schema_struct = self._schema_struct_map[self.schema]
+            schema_dtype = schema_struct._dtypes
+
+            if schema is not None and schema != self.schema:
+                # This is to maintain identical behavior with NDArrayBytesIterator
+                ndarray_iter = iter([np.empty([0, 1], dtype=schema_dtype)])
+            elif self.compression == Compression.NONE and isinstance(
+                self._data_source,
+                MemoryMappedDataSource,
+            ):
+                ndarray_iter = NDArrayBufferIterator(
+                    buffer=self._data_source.buffer,
+                    dtype=schema_dtype,
+                    offset=self._metadata_length,
+                    count=count,
+                )
+            else:
+                ndarray_iter = NDArrayStreamIterator(
+                    reader=self.reader,
+                    dtype=schema_dtype,
+                    offset=self._metadata_length,
+                    count=count,
+                )
+
+        if any(x is not None for x in (instrument_ids, start, end, rtypes)):
+            ndarray_iter = NDArrayFilterIterator(
+                records=ndarray_iter,
+                dtype=schema_dtype,
+                ts_field=schema_struct._ordered_fields[0],
+                instrument_ids=instrument_ids,
+                start=optional_datetime_to_unix_nanoseconds(start),
+                end=optional_datetime_to_unix_nanoseconds(end),
+                rtypes=rtypes,
+            )
+
+        if columns is not None:
+            columns = list(columns)
+            unknown_columns = set(columns).difference(name for name, _ in schema_dtype)
+            if unknown_columns:
+                raise ValueError(
+                    f"The `columns` contained fields which are not in the {schema or self.schema} "
+                    f"schema, was {sorted(unknown_columns)}.",
+                )
+            ndarray_iter = NDArrayProjectionIterator(
+                records=ndarray_iter,
+                dtype=schema_dtype,
+                columns=columns,
+            )
+
+        if count is None:
+            return next(ndarray_iter, np.empty([0, 1], dtype=schema_dtype))
+
+        return ndarray_iter
+
+    def _get_frame_index(self, dtype: np.dtype[Any], ts_field: str) -> list[FrameIndexEntry]:
+        if self._frame_index is not None:
+            return self._frame_index
+
+        index_path = None
+        if isinstance(self._data_source, FileDataSource):
+            source_path = self._data_source.path
+            index_path = source_path.with_name(source_path.name + FRAME_INDEX_SUFFIX)
+            self._frame_index = read_frame_index(index_path, source_path)
+            if self._frame_index is not None:
+                return self._frame_index
+
+        ts_offset = dtype.fields[ts_field][1]  # type: ignore [index]
+        reader = self._data_source.reader
+        frame_index: list[FrameIndexEntry] = []
+        decompressed_offset = 0
+        for frame in read_frames(reader):
+            if frame.skippable:
+                continue
+
+            reader.seek(frame.offset)
+            if frame.content_size is None:
+                decompressor = zstandard.ZstdDecompressor().decompressobj()
+                frame_size = 0
+                for position in range(0, frame.size, 2**20):
+                    chunk = reader.read(min(2**20, frame.size - position))
+                    frame_size += len(decompressor.decompress(chunk))
+            else:
+                frame_size = frame.content_size
+
+            # Find the first record that begins within this frame
+            record_number = max(
+                0,
+                -(-(decompressed_offset - self._metadata_length) // dtype.itemsize),
+            )
+            record_offset = self._metadata_length + record_number * dtype.itemsize
+            if record_offset < decompressed_offset + frame_size:
+                reader.seek(frame.offset)
+                frame_reader = zstandard.ZstdDecompressor().stream_reader(
+                    reader,
+                    read_across_frames=True,
+                )
+                frame_reader.seek(record_offset - decompressed_offset + ts_offset)
+                ts_bytes = frame_reader.read(8)
+                if len(ts_bytes) == 8:
+                    frame_index.append(
+                        FrameIndexEntry(
+                            offset=frame.offset,
+                            decompressed_offset=decompressed_offset,
+                            record_offset=record_offset,
+                            ts=int.from_bytes(ts_bytes, byteorder="little"),
+                        ),
+                    )
+
+            decompressed_offset += frame_size
+
+        if index_path is not None:
+            try:
+                write_frame_index(index_path, self._data_source.path, frame_index)  # type: ignore [attr-defined]
+            except OSError:
+                logger.warning("could not write frame index to %s", index_path)
+
+        self._frame_index = frame_index
+        return frame_index
+
+    def _get_projected_fields(
+        self,
+        schema: Schema,
+        columns: list[str] | None,
+        map_symbols: bool,
+    ) -> list[str] | None:
+        if columns is None:
+            return None
+
+        struct_type = self._schema_struct_map[schema]
+        unknown_columns = set(columns).difference(struct_type._ordered_fields, ["symbol"])
+        if unknown_columns:
+            raise ValueError(
+                f"The `columns` contained fields which are not in the {schema} "
+                f"schema, was {sorted(unknown_columns)}.",
+            )
+
+        # the first ordered field will be ts_recv or ts_event when appropriate
+        index_column = struct_type._ordered_fields[0]
+        fields = [index_column]
+        fields.extend(c for c in columns if c not in (index_column, "symbol"))
+        if map_symbols and "instrument_id" not in fields:
+            fields.append("instrument_id")
+        return fields
+
+    def _transcode(
+        self,
+        output: BinaryIO,
+        encoding: Encoding,
+        pretty_px: bool,
+        pretty_ts: bool,
+        map_symbols: bool,
+        compression: Compression,
+        schema: Schema,
+    ) -> None:
+        if map_symbols:
+            self._instrument_map.insert_metadata(self.metadata)
+            symbol_map = self._instrument_map.build_symbol_map()
+        else:
+            symbol_map = None
+
+        transcoder = Transcoder(
+            file=output,
+            encoding=encoding,
+            compression=compression,
+            pretty_px=pretty_px,
+            pretty_ts=pretty_ts,
+            has_metadata=True,
+            map_symbols=map_symbols,
+            symbol_interval_map=symbol_map,
+            schema=schema,
+        )
+
+        reader = self.reader
+        transcoder.write(reader.read(self._metadata_length))
+        while byte_chunk := reader.read(2**16):
+            transcoder.write(byte_chunk)
+
+        if transcoder.buffer():
+            warnings.warn(
+                BentoWarning(
+                    "DBN file is truncated or contains an incomplete record",
+                ),
+            )
+
+        transcoder.flush()
+
+    def _scan_chunks(
+        self,
+    ) -> Generator[
+        tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]],
+        None,
+        None,
+    ]:
+        """
+        Read the DBN records in chunks, yielding each chunk with the offsets
+        and record types of its complete records.
+
+        Symbol mapping records are inserted into the instrument map, as when
+        iterating over the `DBNStore`.
+        """
+        mapping_decoder = DBNDecoder(
+            has_metadata=False,
+            ts_out=self._metadata.ts_out,
+            input_version=self._metadata.version,
+            upgrade_policy=VersionUpgradePolicy.UPGRADE_TO_V3,
+        )
+        remainder = b""
+        reader = self.reader
+        reader.seek(self._metadata_length)
+        while raw := reader.read(SCAN_READ_SIZE):
+            buffer = np.frombuffer(remainder + raw, dtype=np.uint8)
+            offsets, rtypes, consumed = _scan_records(buffer)
+
+            for offset in offsets[rtypes == RType.SYMBOL_MAPPING].tolist():
+                mapping_decoder.write(buffer[offset : offset + int(buffer[offset]) * 4].tobytes())
+            for record in mapping_decoder.decode():
+                if isinstance(record, SymbolMappingMsg):
+                    self._instrument_map.insert_symbol_mapping_msg(record)
+
+            yield buffer, offsets, rtypes
+            remainder = buffer[consumed:].tobytes()
+
+        if remainder:
+            warnings.warn(
+                BentoWarning("DBN file is truncated or contains an incomplete record"),
+            )
+
+    @property
+    def _schema_struct_map(self) -> dict[Schema, type[DBNRecord]]:
+        """
+        Return a mapping of Schema variants to DBNRecord types based on the DBN
+        metadata version.
+
+        Returns
+        -------
+        dict[Schema, type[DBNRecord]]
+
+        """
+        return schema_struct_map(self.metadata.version)
+
+
+class MergedDBNStore:
+    """
+    A merge of several `DBNStore` instances in timestamp order.
+
+    The records are merged by their index timestamp, which is `ts_recv` if it
+    exists in the schema, otherwise `ts_event`. Each store must already be in
+    timestamp order. Only a bounded number of records from each store are held
+    in memory at once, so the merged data can be written with `to_file` or
+    `to_parquet` without loading it entirely.
+
+    All stores must have the same dataset, schema, symbology types, and DBN version.
+
+    Parameters
+    ----------
+    stores : Iterable[DBNStore]
+        The stores to merge.
+
+    Raises
+    ------
+    ValueError
+        If no stores are specified.
+        If the stores cannot be merged.
+
+    See Also
+    --------
+    DBNStore.merge
+
+    """
+
+    def __init__(self, stores: Iterable[DBNStore]) -> None:
+        self._stores = list(stores)
+        if not self._stores:
+            raise ValueError("at least one DBNStore must be specified to merge")
+
+        metadatas = [store.metadata for store in self._stores]
+        first = metadatas[0]
+        if first.schema is None:
+            raise ValueError("cannot merge mixed DBN data")
+        for attr in ("dataset", "schema", "stype_in", "stype_out", "ts_out", "version"):
+            values = {getattr(metadata, attr) for metadata in metadatas}
+            if len(values) > 1:
+                raise ValueError(f"cannot merge DBN data with different {attr} values {values}")
+
+        mappings: dict[str, set[MappingInterval]] = {}
+        for metadata in metadatas:
+            for raw_symbol, intervals in metadata.mappings.items():
+                mappings.setdefault(raw_symbol, set()).update(
+                    MappingInterval(**interval) for interval in intervals
+                )
+
+        ends = [metadata.end for metadata in metadatas]
+        schema = Schema(first.schema)
+        self._metadata = Metadata(
+            dataset=first.dataset,
+            start=min(metadata.start for metadata in metadatas),
+            end=None if None in ends else max(end for end in ends if end is not None),
+            stype_in=first.stype_in,
+            stype_out=first.stype_out,
+            schema=schema,
+            symbols=list(dict.fromkeys(itertools.chain(*(m.symbols for m in metadatas)))),
+            partial=list(dict.fromkeys(itertools.chain(*(m.partial for m in metadatas)))),
+            not_found=list(dict.fromkeys(itertools.chain(*(m.not_found for m in metadatas)))),
+            mappings=[
+                SymbolMapping.from_intervals(raw_symbol, sorted(intervals))
+                for raw_symbol, intervals in mappings.items()
+            ],
+            limit=None,
+            ts_out=first.ts_out,
+            version=first.version,
+        )
+        self._struct_type = self._stores[0]._schema_struct_map[schema]
+        self._instrument_map = InstrumentMap()
+
+    def __repr__(self) -> str:
+        name = self.__class__.__name__
+        return f"<{name}(schema={self.schema}, stores={len(self._stores)})>"
+
+    @property
+    def dataset(self) -> str:
+        """
+        Return the dataset code.
+
+        Returns
+        -------
+        str
+
+        """
+        return str(self._metadata.dataset)
+
+    @property
+    def metadata(self) -> Metadata:
+        """
+        Return the merged metadata of the stores.
+
+        Returns
+        -------
+        Metadata
+
+        """
+        return self._metadata
+
+    @property
+    def schema(self) -> Schema:
+        """
+        Return the DBN record schema.
+
+        Returns
+        -------
+        Schema
+
+        """
+        return Schema(self._metadata.schema)
+
+    @property
+    def stores(self) -> list[DBNStore]:
+        """
+        Return the stores being merged.
+
+        Returns
+        -------
+        list[DBNStore]
+
+        """
+        return self._stores
+
+    def to_df(
+        self,
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        tz: datetime.tzinfo | str | Default[datetime.tzinfo] = Default[datetime.tzinfo](
+            datetime.timezone.utc,
+        ),
+        count: int | None = None,
+        instrument_ids: Iterable[int] | int | None = None,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+    ) -> pd.DataFrame | DataFrameIterator:
+        """
+        Return the merged data as a `pd.DataFrame`.
+
+        Parameters
+        ----------
+        price_type : PriceType or str, default "float"
+            The price type to use for price fields.
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware `pd.Timestamp`.
+        map_symbols : bool, default True
+            If symbology mappings from the merged metadata should be used to create
+            a 'symbol' column.
+        tz : datetime.tzinfo or str, default UTC
+            If `pretty_ts` is `True`, all timestamps will be converted to the specified timezone.
+        count : int, optional
+            If set, a `DataFrameIterator` yielding a `DataFrame` with at most
+            `count` elements will be returned instead.
+        instrument_ids : Iterable[int] or int, optional
+            If set, only records for these instrument IDs are returned.
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp at or after `start` are returned.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp before `end` are returned.
+        rtypes : Iterable[RType | int] or RType or int, optional
+            If set, only records of these record types are returned.
+
+        Returns
+        -------
+        pd.DataFrame
+        DataFrameIterator
+
+        See Also
+        --------
+        DBNStore.to_df
+
+        """
+        price_type = validate_enum(price_type, PriceType, "price_type")
+        tz = _validate_tz(tz, pretty_ts)
+
+        filters: dict[str, Any] = {
+            "instrument_ids": instrument_ids,
+            "start": start,
+            "end": end,
+            "rtypes": rtypes,
+        }
+        records: Iterator[np.ndarray[Any, Any]]
+        if count is None:
+            records = iter([self.to_ndarray(**filters)])
+        else:
+            records = self.to_ndarray(count, **filters)
+
+        if map_symbols:
+            self._instrument_map.insert_metadata(self._metadata)
+
+        df_iter = DataFrameIterator(
+            records=records,
+            count=count,
+            struct_type=self._struct_type,
+            instrument_map=self._instrument_map,
+            tz=tz,
+            price_type=price_type,
+            pretty_ts=pretty_ts,
+            map_symbols=map_symbols,
+        )
+
+        if count is None:
+            return next(df_iter)
+
+        return df_iter
+
+    def to_file(
+        self,
+        path: PathLike[str] | str,
+        mode: Literal["w", "x"] = "w",
+        compression: Compression | str = Compression.ZSTD,
+    ) -> None:
+        """
+        Write the merged data to a DBN file at the given path.
+
+        Parameters
+        ----------
+        path : PathLike[str] or str
+            The file path to write to.
+        mode : str, default "w"
+            The file write mode to use, either "x" or "w".
+        compression : Compression or str, default "zstd"
+            The compression format to write.
+
+        Raises
+        ------
+        IsADirectoryError
+            If path is a directory.
+        FileExistsError
+            If path exists.
+        PermissionError
+            If path is not writable.
+
+        """
+        compression = validate_enum(compression, Compression, "compression")
+        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
+
+        writer: IO[bytes] | zstandard.ZstdCompressionWriter
+        if compression == Compression.ZSTD:
+            writer = zstandard.ZstdCompressor(
+                write_checksum=True,
+            ).stream_writer(
+                open(file_path, mode=f"{mode}b"),
+                closefd=True,
+            )
+        else:
+            writer = open(file_path, mode=f"{mode}b")
+
+        try:
+            writer.write(self._metadata.encode())
+            for records in self.to_ndarray(count=MERGE_CHUNK_SIZE):
+                writer.write(records.tobytes())
+        finally:
+            writer.close()
+
+    @overload
+    def to_ndarray(  # type: ignore [misc]
+        self,
+        count: None = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+    ) -> np.ndarray[Any, Any]: ...
+
+    @overload
+    def to_ndarray(
+        self,
+        count: int = ...,
+        instrument_ids: Iterable[int] | int | None = ...,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = ...,
+        rtypes: Iterable[RType | int] | RType | int | None = ...,
+    ) -> NDArrayIterator: ...
+
+    def to_ndarray(
+        self,
+        count: int | None = None,
+        instrument_ids: Iterable[int] | int | None = None,
+        start: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        end: pd.Timestamp | datetime.datetime | datetime.date | str | int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+    ) -> np.ndarray[Any, Any] | NDArrayIterator:
+        """
+        Return the merged data as a numpy `ndarray`.
+
+        Parameters
+        ----------
+        count : int, optional
+            If set, a `NDArrayIterator` yielding a `np.ndarray` with at most
+            `count` elements will be returned instead.
+        instrument_ids : Iterable[int] or int, optional
+            If set, only records for these instrument IDs are returned.
+        start : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp at or after `start` are returned.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            If set, only records with an index timestamp before `end` are returned.
+        rtypes : Iterable[RType | int] or RType or int, optional
+            If set, only records of these record types are returned.
+
+        Returns
+        -------
+        np.ndarray
+        NDArrayIterator
+
+        See Also
+        --------
+        DBNStore.to_ndarray
+
+        """
+        ndarray_iter = NDArrayMergeIterator(
+            records=[
+                store.to_ndarray(
+                    count=MERGE_CHUNK_SIZE,
+                    instrument_ids=instrument_ids,
+                    start=start,
+                    end=end,
+                    rtypes=rtypes,
+                )
+                for store in self._stores
+            ],
+            dtype=self._struct_type._dtypes,
+            ts_field=self._struct_type._ordered_fields[0],
+            count=count,
+        )
+
+        if count is None:
+            return next(ndarray_iter)
+
+        return ndarray_iter
+
+    def to_parquet(
+        self,
+        path: PathLike[str] | str,
+        price_type: PriceType | str = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        mode: Literal["w", "x"] = "w",
+        parquet_schema: pa.Schema | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """
+        Write the merged data to a parquet file at the given path.
+
+        Parameters
+        ----------
+        path: PathLike[str] or str
+            The file path to write the data to.
+        price_type : str, default "float"
+            The price type to use for price fields.
+        pretty_ts : bool, default True
+            If all timestamp columns should be converted from UNIX nanosecond
+            `int` to tz-aware UTC `pyarrow.TimestampType`.
+        map_symbols : bool, default True
+            If symbology mappings from the merged metadata should be used to create
+            a 'symbol' column.
+        mode : str, default "w"
+            The file write mode to use, either "x" or "w".
+        parquet_schema : pyarrow.Schema, optional
+            The pyarrow parquet schema to use to write the parquet file.
+        **kwargs : Any
+            Keyword arguments to pass to the `pyarrow.parquet.ParquetWriter`.
+
+        See Also
+        --------
+        DBNStore.to_parquet
+
+        """
+        file_path = validate_file_write_path(path, "path", exist_ok=mode == "w")
+        price_type = validate_enum(price_type, PriceType, "price_type")
+
+        if map_symbols:
+            self._instrument_map.insert_metadata(self._metadata)
+
+        batch_iter = RecordBatchIterator(
+            records=self.to_ndarray(count=PARQUET_CHUNK_SIZE),
+            struct_type=self._struct_type,
+            instrument_map=self._instrument_map,
+            price_type=price_type,
             pretty_ts=pretty_ts,
-            has_metadata=True,
             map_symbols=map_symbols,
-            symbol_interval_map=symbol_map,
-            schema=schema,
         )
+        _write_parquet(batch_iter, file_path, parquet_schema, **kwargs)
 
-        reader = self.reader
-        transcoder.write(reader.read(self._metadata_length))
-        while byte_chunk := reader.read(2**16):
-            transcoder.write(byte_chunk)
 
-        if transcoder.buffer():
-            warnings.warn(
-                BentoWarning(
-                    "DBN file is truncated or contains an incomplete record",
-                ),
-            )
+class _RecordTimestamps(Sequence[int]):
+    """
+    A lazy sequence of the timestamps of homogeneous uncompressed DBN records.
 
-        transcoder.flush()
+    Timestamps are read from the reader on access so the records can be
+    binary searched without being read into memory.
+    """
 
-    @property
-    def _schema_struct_map(self) -> dict[Schema, type[DBNRecord]]:
-        """
-        Return a mapping of Schema variants to DBNRecord types based on the DBN
-        metadata version.
+    def __init__(
+        self,
+        reader: IO[bytes],
+        dtype: np.dtype[Any],
+        field: str,
+        offset: int,
+        length: int,
+    ) -> None:
+        self._reader = reader
+        self._itemsize = dtype.itemsize
+        self._field_offset = offset + dtype.fields[field][1]  # type: ignore [index]
+        self._length = length
 
-        Returns
-        -------
-        dict[Schema, type[DBNRecord]]
+    def __len__(self) -> int:
+        return self._length
 
-        """
-        if self.metadata.version == 1:
-            return SCHEMA_STRUCT_MAP_V1
-        if self.metadata.version == 2:
-            return SCHEMA_STRUCT_MAP_V2
-        return SCHEMA_STRUCT_MAP
+    def __getitem__(self, index: int) -> int:  # type: ignore [override]
+        if not 0 <= index < self._length:
+            raise IndexError(index)
+        self._reader.seek(self._field_offset + index * self._itemsize)
+        return int.from_bytes(self._reader.read(8), byteorder="little")
 
 
 class NDArrayIterator(Protocol):
@@ -1356,7 +3282,7 @@ class NDArrayStreamIterator(NDArrayIterator):
 
     def __init__(
         self,
-        reader: IO[bytes],
+        reader: IO[bytes] | ParallelZstdReader,
         dtype: list[tuple[str, str]],
         offset: int = 0,
         count: int | None = None,
@@ -1401,6 +3327,61 @@ class NDArrayStreamIterator(NDArrayIterator):
         raise StopIteration
 
 
+class NDArrayBufferIterator(NDArrayIterator):
+    """
+    Iterator for homogeneous buffers of DBN records.
+
+    The arrays yielded are views over the buffer; no data is copied.
+    """
+
+    def __init__(
+        self,
+        buffer: memoryview,
+        dtype: list[tuple[str, str]],
+        offset: int = 0,
+        count: int | None = None,
+    ) -> None:
+        self._buffer = buffer
+        self._dtype: np.dtype[Any] = np.dtype(dtype)
+        self._offset = offset
+        self._count = count
+
+        num_bytes = len(buffer) - offset
+        self._num_records = num_bytes // self._dtype.itemsize
+        self._position = 0
+
+        if num_bytes % self._dtype.itemsize != 0:
+            warnings.warn(
+                BentoWarning("DBN file is truncated or contains an incomplete record"),
+            )
+
+    def __iter__(self) -> NDArrayBufferIterator:
+        return self
+
+    def __next__(self) -> np.ndarray[Any, Any]:
+        remaining = self._num_records - self._position
+        if remaining <= 0:
+            raise StopIteration
+
+        if self._count is None:
+            num_records = remaining
+        else:
+            num_records = min(max(self._count, 1), remaining)
+
+        try:
+            array = np.frombuffer(
+                buffer=self._buffer,
+                dtype=self._dtype,
+                count=num_records,
+                offset=self._offset + self._position * self._dtype.itemsize,
+            )
+        except ValueError as exc:
+            raise BentoError("Cannot decode DBN stream") from exc
+
+        self._position += num_records
+        return array
+
+
 class NDArrayBytesIterator(NDArrayIterator):
     """
     Iterator for heterogeneous streams of DBN records.
@@ -1445,6 +3426,659 @@ class NDArrayBytesIterator(NDArrayIterator):
             raise BentoError("Cannot decode DBN stream") from exc
 
 
+class NDArrayScanIterator(NDArrayIterator):
+    """
+    Iterator for the records of one record type in heterogeneous streams of
+    DBN records, located by their record headers.
+    """
+
+    def __init__(
+        self,
+        chunks: Iterator[tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], np.ndarray[Any, Any]]],
+        dtype: list[tuple[str, str]],
+        rtype: int,
+        count: int | None,
+    ) -> None:
+        self._chunks = chunks
+        self._dtype: np.dtype[Any] = np.dtype(dtype)
+        self._rtype = rtype
+        self._count = count
+        self._first_next = True
+        self._pending: np.ndarray[Any, Any] = np.empty(0, dtype=self._dtype)
+
+    def __iter__(self) -> NDArrayScanIterator:
+        return self
+
+    def __next__(self) -> np.ndarray[Any, Any]:
+        parts = [self._pending]
+        size = len(self._pending)
+        while self._count is None or size < self._count:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                break
+            buffer, offsets, rtypes = chunk
+            records = _gather_records(buffer, offsets[rtypes == self._rtype], self._dtype)
+            if len(records):
+                parts.append(records)
+                size += len(records)
+
+        output = _concatenate_records(parts, self._dtype) if len(parts) > 1 else self._pending
+        if self._count is not None:
+            output, self._pending = output[: max(self._count, 1)], output[max(self._count, 1) :]
+        else:
+            self._pending = output[:0]
+
+        if self._first_next:
+            self._first_next = False
+            if len(output) == 0:
+                return np.empty([0, 1], dtype=self._dtype)
+
+        if len(output) == 0:
+            raise StopIteration
+
+        return output
+
+
+class NDArrayMergeIterator(NDArrayIterator):
+    """
+    Iterator which merges the arrays of several `NDArrayIterator` instances
+    by a timestamp field.
+
+    Each iterator must yield records in timestamp order. The relative order
+    of the records from each iterator is preserved.
+    """
+
+    def __init__(
+        self,
+        records: Sequence[Iterator[np.ndarray[Any, Any]]],
+        dtype: list[tuple[str, str]],
+        ts_field: str,
+        count: int | None = None,
+    ) -> None:
+        self._records = records
+        self._dtype = dtype
+        self._ts_field = ts_field
+        self._count = count
+        self._first_next = True
+        self._output = np.empty(0, dtype=dtype)
+
+        # heap of the last timestamp of each buffer, which is the watermark
+        # up to which records can be emitted once that buffer is consumed
+        self._buffers: list[np.ndarray[Any, Any] | None] = [None] * len(records)
+        self._heap: list[tuple[np.unsignedinteger[Any], int]] = []
+        for index in range(len(records)):
+            self._refill(index)
+
+    def __iter__(self) -> NDArrayMergeIterator:
+        return self
+
+    def __next__(self) -> np.ndarray[Any, Any]:
+        parts = [self._output]
+        size = len(self._output)
+        while self._count is None or size < self._count:
+            merged = self._merge_next()
+            if merged is None:
+                break
+            parts.append(merged)
+            size += len(merged)
+
+        output = np.concatenate(parts) if len(parts) > 1 else self._output
+        if self._count is not None:
+            output, self._output = output[: self._count], output[self._count :]
+        else:
+            self._output = output[:0]
+
+        if len(output) == 0 and not self._first_next:
+            raise StopIteration
+
+        self._first_next = False
+        return output
+
+    def _refill(self, index: int) -> None:
+        for array in self._records[index]:
+            array = array.reshape(-1)
+            if len(array):
+                self._buffers[index] = array
+                heapq.heappush(self._heap, (array[self._ts_field][-1], index))
+                return
+        self._buffers[index] = None
+
+    def _merge_next(self) -> np.ndarray[Any, Any] | None:
+        while self._heap:
+            watermark, index = heapq.heappop(self._heap)
+            buffer = self._buffers[index]
+            if buffer is None or len(buffer) == 0:
+                # consumed while merging an earlier buffer
+                self._refill(index)
+                continue
+
+            parts = []
+            for other_index, other in enumerate(self._buffers):
+                if other is None or len(other) == 0:
+                    continue
+                split = np.searchsorted(other[self._ts_field], watermark, side="right")
+                if split:
+                    parts.append(other[:split])
+                    self._buffers[other_index] = other[split:]
+
+            self._refill(index)
+
+            merged = np.concatenate(parts) if len(parts) > 1 else parts[0]
+            return merged[np.argsort(merged[self._ts_field], kind="stable")]
+
+        return None
+
+
+class NDArrayFilterIterator(NDArrayIterator):
+    """
+    Iterator which filters the arrays of another `NDArrayIterator` with
+    vectorized masks.
+    """
+
+    def __init__(
+        self,
+        records: Iterator[np.ndarray[Any, Any]],
+        dtype: list[tuple[str, str]],
+        ts_field: str,
+        instrument_ids: Iterable[int] | int | None = None,
+        start: int | None = None,
+        end: int | None = None,
+        rtypes: Iterable[RType | int] | RType | int | None = None,
+    ) -> None:
+        self._records = records
+        self._dtype = dtype
+        self._ts_field = ts_field
+        self._start = start
+        self._end = end
+        self._first_next = True
+
+        self._instrument_ids: np.ndarray[Any, Any] | None = None
+        if instrument_ids is not None:
+            if isinstance(instrument_ids, int):
+                instrument_ids = [instrument_ids]
+            self._instrument_ids = np.fromiter(instrument_ids, dtype=np.uint32)
+
+        self._rtypes: np.ndarray[Any, Any] | None = None
+        if rtypes is not None:
+            if isinstance(rtypes, (int, RType)):
+                rtypes = [rtypes]
+            self._rtypes = np.fromiter(
+                (r.value if isinstance(r, RType) else RType(r).value for r in rtypes),
+                dtype=np.uint8,
+            )
+
+    def __iter__(self) -> NDArrayFilterIterator:
+        return self
+
+    def __next__(self) -> np.ndarray[Any, Any]:
+        for array in self._records:
+            mask = np.ones(len(array), dtype=bool)
+            if self._instrument_ids is not None:
+                mask &= np.isin(array["instrument_id"], self._instrument_ids)
+            if self._rtypes is not None:
+                mask &= np.isin(array["rtype"], self._rtypes)
+            if self._start is not None:
+                mask &= array[self._ts_field] >= self._start
+            if self._end is not None:
+                mask &= array[self._ts_field] < self._end
+
+            if mask.all():
+                self._first_next = False
+                return array
+            if mask.any():
+                self._first_next = False
+                return array[mask]
+
+        if self._first_next:
+            self._first_next = False
+            return np.empty([0, 1], dtype=self._dtype)
+
+        raise StopIteration
+
+
+class NDArrayProjectionIterator(NDArrayIterator):
+    """
+    Iterator which selects a subset of the fields of the arrays of another
+    `NDArrayIterator` without copying.
+    """
+
+    def __init__(
+        self,
+        records: Iterator[np.ndarray[Any, Any]],
+        dtype: list[tuple[str, str]],
+        columns: list[str],
+    ) -> None:
+        self._records = records
+        self._dtype = dtype
+        self._columns = columns
+        self._first_next = True
+
+    def __iter__(self) -> NDArrayProjectionIterator:
+        return self
+
+    def __next__(self) -> np.ndarray[Any, Any]:
+        try:
+            array = next(self._records)
+        except StopIteration:
+            if not self._first_next:
+                raise
+            array = np.empty([0, 1], dtype=self._dtype)
+
+        self._first_next = False
+        return array[self._columns]
+
+
+def _scan_records(
+    buffer: np.ndarray[Any, Any],
+) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any], int]:
+    """
+    Locate the complete DBN records in a buffer of bytes by their record
+    headers, where the first byte is the record length in 4-byte units and
+    the second byte is the record type.
+
+    Headers are read one at a time until `SCAN_RUN_SIZE` consecutive records
+    have the same length; the headers of the rest of the run are then checked
+    with numpy, doubling the number checked at once while the lengths match.
+
+    Returns the offset and record type of each record, and the number of
+    bytes of complete records.
+    """
+    data = buffer.data
+    size = len(buffer)
+    runs: list[np.ndarray[Any, Any]] = []
+    offsets: list[int] = []
+    position = 0
+    previous_units = 0
+    run_length = 0
+    while position + 1 < size:
+        units = data[position]
+        length = units * 4
+        if length == 0:
+            raise BentoError("Cannot decode DBN stream, record length is zero")
+        if position + length > size:
+            break  # incomplete record
+
+        if units != previous_units:
+            previous_units = units
+            run_length = 0
+        elif run_length >= SCAN_RUN_SIZE:
+            runs.append(np.array(offsets, dtype=np.intp))
+            offsets.clear()
+            num_records = run_length
+            while num_records := min((size - position) // length, num_records):
+                end = position + num_records * length
+                same_length = buffer[position:end:length] == units
+                if same_length.all():
+                    runs.append(np.arange(position, end, length, dtype=np.intp))
+                    position = end
+                    num_records *= 2
+                    continue
+                end = position + int(same_length.argmin()) * length
+                runs.append(np.arange(position, end, length, dtype=np.intp))
+                position = end
+                break
+            previous_units = 0
+            continue
+
+        offsets.append(position)
+        position += length
+        run_length += 1
+
+    runs.append(np.array(offsets, dtype=np.intp))
+    record_offsets = np.concatenate(runs)
+    return record_offsets, buffer[record_offsets + 1], position
+
+
+def _get_rtype_dtypes(ts_out: bool) -> dict[int, np.dtype[Any]]:
+    """
+    Return the dtype of the records of each record type of the latest DBN
+    version.
+    """
+    rtype_structs: dict[int, type[DBNRecord]] = {
+        RType.SYMBOL_MAPPING.value: SymbolMappingMsg,
+        RType.SYSTEM.value: SystemMsg,
+        RType.ERROR.value: ErrorMsg,
+    }
+    for schema, struct in SCHEMA_STRUCT_MAP.items():
+        rtype_structs[RType.from_schema(schema).value] = struct
+
+    rtype_dtypes = {}
+    for rtype, struct in rtype_structs.items():
+        dtype = list(struct._dtypes)
+        if ts_out:
+            dtype.append(("ts_out", "u8"))
+        rtype_dtypes[rtype] = np.dtype(dtype)
+    return rtype_dtypes
+
+
+def _gather_records(
+    buffer: np.ndarray[Any, Any],
+    offsets: np.ndarray[Any, Any],
+    dtype: np.dtype[Any],
+) -> np.ndarray[Any, Any]:
+    """
+    Copy the records at the given offsets of a buffer of bytes into a
+    contiguous array.
+    """
+    if len(offsets) == 0:
+        return np.empty(0, dtype=dtype)
+    if np.any(buffer[offsets].astype(np.intp) * 4 != dtype.itemsize):
+        raise BentoError("Cannot decode DBN stream, unexpected record length")
+    windows = np.lib.stride_tricks.sliding_window_view(buffer, dtype.itemsize)
+    return windows[offsets].view(dtype).reshape(-1)
+
+
+def _reduce_stats(
+    records: np.ndarray[Any, Any],
+    fields: set[str],
+    ts_field: str,
+    gap_threshold: int | None,
+) -> dict[str, np.ndarray[Any, Any]]:
+    """
+    Reduce a chunk of records to the summary statistics of each instrument.
+    """
+    order = np.argsort(records["instrument_id"], kind="stable")
+    instrument_ids = records["instrument_id"][order]
+    ts = records[ts_field][order].astype(np.int64)
+
+    is_first = np.ones(len(records), dtype=bool)
+    is_first[1:] = instrument_ids[1:] != instrument_ids[:-1]
+    starts = np.flatnonzero(is_first)
+    ends = np.append(starts[1:], len(records))[: len(starts)]
+
+    # the time since the previous record of the same instrument
+    gaps = np.zeros(len(records), dtype=np.int64)
+    gaps[1:] = np.diff(ts)
+    gaps[is_first] = 0
+
+    stats = {
+        "instrument_id": instrument_ids[starts],
+        "count": (ends - starts).astype(np.uint64),
+        "first_ts": ts[starts],
+        "last_ts": ts[ends - 1],
+    }
+
+    if {"low", "high"} <= fields:
+        low, high = records["low"][order], records["high"][order]
+    elif "price" in fields:
+        low = high = records["price"][order]
+    else:
+        low = high = None
+    if low is not None and high is not None:
+        low = np.where(low == UNDEF_PRICE, np.inf, low)
+        high = np.where(high == UNDEF_PRICE, -np.inf, high)
+        stats["min_price"] = _reduceat(np.minimum, low, starts)
+        stats["max_price"] = _reduceat(np.maximum, high, starts)
+
+    if "volume" in fields:
+        stats["volume"] = _reduceat(np.add, records["volume"][order].astype(np.uint64), starts)
+    elif {"action", "size"} <= fields:
+        volume = np.where(records["action"][order] == b"T", records["size"][order], 0)
+        stats["volume"] = _reduceat(np.add, volume.astype(np.uint64), starts)
+
+    stats["max_gap"] = _reduceat(np.maximum, gaps, starts)
+    if gap_threshold is not None:
+        stats["num_gaps"] = _reduceat(np.add, (gaps > gap_threshold).astype(np.uint64), starts)
+
+    return stats
+
+
+def _merge_stats(
+    stats: dict[str, np.ndarray[Any, Any]],
+    other: dict[str, np.ndarray[Any, Any]],
+    gap_threshold: int | None,
+) -> dict[str, np.ndarray[Any, Any]]:
+    """
+    Merge the summary statistics of a chunk of records into the statistics of
+    the records preceding it.
+    """
+    instrument_ids = np.union1d(stats["instrument_id"], other["instrument_id"])
+    index = np.searchsorted(instrument_ids, stats["instrument_id"])
+    other_index = np.searchsorted(instrument_ids, other["instrument_id"])
+
+    merged = {"instrument_id": instrument_ids}
+    for key, values in stats.items():
+        if key == "instrument_id":
+            continue
+        merged_values = np.zeros(len(instrument_ids), dtype=values.dtype)
+        if key == "min_price":
+            merged_values[:] = np.inf
+        elif key == "max_price":
+            merged_values[:] = -np.inf
+
+        if key == "first_ts":
+            merged_values[other_index] = other[key]
+            merged_values[index] = values
+        elif key == "last_ts":
+            merged_values[index] = values
+            merged_values[other_index] = other[key]
+        else:
+            ufunc = _MERGE_STATS_UFUNCS.get(key, np.add)
+            merged_values[index] = values
+            merged_values[other_index] = ufunc(merged_values[other_index], other[key])
+        merged[key] = merged_values
+
+    # the gaps between the last record of the preceding records and the first of the chunk
+    _, common, other_common = np.intersect1d(
+        stats["instrument_id"],
+        other["instrument_id"],
+        assume_unique=True,
+        return_indices=True,
+    )
+    boundary_gaps = other["first_ts"][other_common] - stats["last_ts"][common]
+    boundary_index = index[common]
+    merged["max_gap"][boundary_index] = np.maximum(
+        merged["max_gap"][boundary_index],
+        boundary_gaps,
+    )
+    if gap_threshold is not None:
+        merged["num_gaps"][boundary_index] += (boundary_gaps > gap_threshold).astype(np.uint64)
+
+    return merged
+
+
+_MERGE_STATS_UFUNCS: Final[dict[str, np.ufunc]] = {
+    "min_price": np.minimum,
+    "max_price": np.maximum,
+    "max_gap": np.maximum,
+}
+
+
+def _reduceat(
+    ufunc: np.ufunc,
+    values: np.ndarray[Any, Any],
+    starts: np.ndarray[Any, Any],
+) -> np.ndarray[Any, Any]:
+    if len(values) == 0:
+        return values[:0]
+    return ufunc.reduceat(values, starts)
+
+
+# The fields of the partial OHLCV bars of `DBNStore.resample`, with `UNDEF_PRICE`
+# for bars without a price and the sum of trade notionals in fixed-precision units
+_BAR_FIELDS: Final = ("ts_event", "key", "open", "high", "low", "close", "volume", "notional")
+
+
+def _records_to_bars(
+    records: np.ndarray[Any, Any],
+    freq: int,
+    price_field: str,
+    by: str | None,
+) -> dict[str, np.ndarray[Any, Any]]:
+    """
+    Convert records to partial bars of a single record each.
+    """
+    is_trade = (records["action"] == b"T") & (records["price"] != UNDEF_PRICE)
+    if price_field == "price":
+        has_price = is_trade
+    else:
+        has_price = records[price_field] != UNDEF_PRICE
+    mask = has_price | is_trade
+    records, is_trade, has_price = records[mask], is_trade[mask], has_price[mask]
+
+    ts_event = records["ts_event"].astype(np.int64)
+    if by is None:
+        key = np.zeros(len(records), dtype=np.uint64)
+    else:
+        key = records[by].astype(np.uint64)
+    prices = np.where(has_price, records[price_field], UNDEF_PRICE)
+    size = np.where(is_trade, records["size"], 0).astype(np.uint64)
+    return {
+        "ts_event": ts_event - ts_event % freq,
+        "key": key,
+        "open": prices,
+        "high": prices,
+        "low": prices,
+        "close": prices,
+        "volume": size,
+        "notional": records["price"] * size.astype(np.float64),
+    }
+
+
+def _concatenate_bars(
+    bars_list: list[dict[str, np.ndarray[Any, Any]]],
+) -> dict[str, np.ndarray[Any, Any]]:
+    return {field: np.concatenate([bars[field] for bars in bars_list]) for field in _BAR_FIELDS}
+
+
+def _reduce_bars(
+    bars: dict[str, np.ndarray[Any, Any]],
+    freq: int,
+) -> dict[str, np.ndarray[Any, Any]]:
+    """
+    Combine the partial bars of each interval and key into a single bar,
+    where the open and close are taken from the first and last partial bars
+    with a price.
+    """
+    order = _argsort_bars(bars, freq)
+    ts_event = bars["ts_event"][order]
+    key = bars["key"][order]
+    is_first = np.ones(len(order), dtype=bool)
+    is_first[1:] = (ts_event[1:] != ts_event[:-1]) | (key[1:] != key[:-1])
+    starts = np.flatnonzero(is_first)
+
+    opens = bars["open"][order]
+    has_price = opens != UNDEF_PRICE
+    positions = np.arange(len(order))
+    first = _reduceat(np.minimum, np.where(has_price, positions, len(order)), starts)
+    last = _reduceat(np.maximum, np.where(has_price, positions, -1), starts)
+    has_bar_price = last >= 0
+    first = first.clip(max=len(order) - 1)
+    high = np.where(has_price, bars["high"][order], np.iinfo(np.int64).min)
+
+    return {
+        "ts_event": ts_event[starts],
+        "key": key[starts],
+        "open": np.where(has_bar_price, opens[first], UNDEF_PRICE),
+        "high": np.where(has_bar_price, _reduceat(np.maximum, high, starts), UNDEF_PRICE),
+        "low": _reduceat(np.minimum, bars["low"][order], starts),
+        "close": np.where(has_bar_price, bars["close"][order][last], UNDEF_PRICE),
+        "volume": _reduceat(np.add, bars["volume"][order], starts),
+        "notional": _reduceat(np.add, bars["notional"][order], starts),
+    }
+
+
+def _argsort_bars(bars: dict[str, np.ndarray[Any, Any]], freq: int) -> np.ndarray[Any, Any]:
+    """
+    Return the indices which stably sort bars by interval and key.
+    """
+    if len(bars["key"]) == 0:
+        return np.arange(0)
+    intervals = (bars["ts_event"] - bars["ts_event"].min()) // freq
+    num_keys = int(bars["key"].max()) + 1
+    if (int(intervals.max()) + 1) * num_keys > np.iinfo(np.uint64).max:
+        return np.lexsort((bars["key"], bars["ts_event"]))
+    # sorting a single composite key is considerably faster than a lexsort
+    keys = intervals.astype(np.uint64) * np.uint64(num_keys) + bars["key"]
+    return np.argsort(keys, kind="stable")
+
+
+def _snapshots_to_mbp(
+    snapshots: list[np.ndarray[Any, Any]],
+    schema: Schema,
+    dtype: np.dtype[Any],
+    depth: int,
+) -> np.ndarray[Any, Any]:
+    """
+    Convert `Market` snapshots to MBP records which do not describe an event.
+    """
+    snapshot = _concatenate_records(snapshots, snapshots[0].dtype)
+    records = np.zeros(len(snapshot), dtype=dtype)
+    records["length"] = dtype.itemsize // 4
+    records["rtype"] = RType.from_schema(schema)
+    records["price"] = UNDEF_PRICE
+    records["action"] = records["side"] = b"N"
+    records["flags"] = RecordFlags.F_LAST
+    for field in snapshot.dtype.names:
+        records[field] = snapshot[field]
+    # levels beyond the depth of the snapshots
+    for index in range(depth, 10):
+        if f"bid_px_{index:02d}" in dtype.names:
+            records[f"bid_px_{index:02d}"] = records[f"ask_px_{index:02d}"] = UNDEF_PRICE
+    return records
+
+
+def _concatenate_records(
+    arrays: Sequence[np.ndarray[Any, Any]],
+    dtype: np.dtype[Any],
+) -> np.ndarray[Any, Any]:
+    """
+    Concatenate arrays of records as opaque bytes, which is faster than
+    concatenating them field by field.
+    """
+    void_dtype = np.dtype((np.void, dtype.itemsize))
+    return np.concatenate([array.view(void_dtype) for array in arrays]).view(dtype)
+
+
+def _px_to_float(values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """
+    Convert fixed-precision prices to `float`, with `NaN` for `UNDEF_PRICE`.
+    """
+    prices = np.divide(values, FIXED_PRICE_SCALE, dtype=np.float64)
+    prices[values == UNDEF_PRICE] = np.nan
+    return prices
+
+
+def _px_to_decimal(values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+    """
+    Convert fixed-precision prices to `decimal.Decimal`, with `NaN` for
+    `UNDEF_PRICE`.
+
+    Each distinct price is only converted once.
+    """
+    unique_values, indices = np.unique(values, return_inverse=True)
+    decimals = np.empty(len(unique_values), dtype=object)
+    decimals[:] = [
+        (
+            decimal.Decimal("NaN")
+            if value == UNDEF_PRICE
+            else decimal.Decimal(value) / FIXED_PRICE_SCALE
+        )
+        for value in unique_values.tolist()
+    ]
+    return decimals[indices.reshape(values.shape)]
+
+
+def _px_to_decimal128(values: np.ndarray[Any, Any]) -> pa.Array:
+    """
+    Convert fixed-precision prices to an Arrow `decimal128(19, 9)` array,
+    with nulls for `UNDEF_PRICE`.
+
+    The fixed-precision integers are used as the unscaled decimal values.
+    """
+    values = np.ascontiguousarray(values, dtype=np.int64)
+    # 128-bit little-endian two's complement: the low word and its sign extension
+    unscaled = np.empty((len(values), 2), dtype=np.int64)
+    unscaled[:, 0] = values
+    unscaled[:, 1] = values >> 63
+    validity = np.packbits(values != UNDEF_PRICE, bitorder="little")
+    return pa.Array.from_buffers(
+        pa.decimal128(19, 9),
+        len(values),
+        [pa.py_buffer(validity), pa.py_buffer(unscaled)],
+    )
+
+
 class DataFrameIterator:
     """
     Iterator for DataFrames that supports batching and column formatting for
@@ -1461,23 +4095,37 @@ class DataFrameIterator:
         price_type: PriceType = PriceType.FLOAT,
         pretty_ts: bool = True,
         map_symbols: bool = True,
+        columns: list[str] | None = None,
     ):
         self._records = records
         self._count = count
         self._struct_type = struct_type
+        self._columns = columns
         self._price_type = price_type
         self._pretty_ts = pretty_ts
         self._map_symbols = map_symbols
         self._instrument_map = instrument_map
         self._tz = tz
+        self._price_fields = frozenset(struct_type._price_fields)
 
     def __iter__(self) -> DataFrameIterator:
         return self
 
     def __next__(self) -> pd.DataFrame:
+        records = next(self._records).reshape(-1)
+
+        if self._columns is None:
+            fields = self._struct_type._ordered_fields
+        else:
+            fields = list(records.dtype.names)
+
+        if len(records) == 0 and not set(fields).issubset(records.dtype.names):
+            # no records of the requested schema were found
+            records = np.empty(0, dtype=self._struct_type._dtypes)
+
         df = pd.DataFrame(
-            next(self._records),
-            columns=self._struct_type._ordered_fields,
+            {field: self._format_px(field, records[field]) for field in fields},
+            copy=False,
         )
 
         if self._struct_type in (InstrumentDefMsg, InstrumentDefMsgV1, InstrumentDefMsgV2):
@@ -1491,11 +4139,12 @@ class DataFrameIterator:
         if self._map_symbols:
             self._format_map_symbols(df)
 
+        if self._columns is not None and "instrument_id" not in self._columns:
+            df.drop(columns="instrument_id", inplace=True, errors="ignore")
+
         if self._pretty_ts:
             self._format_timezone(df)
 
-        self._format_px(df, self._price_type)
-
         self._format_set_index(df)
 
         return df
@@ -1508,7 +4157,7 @@ class DataFrameIterator:
     def _format_hidden_fields(self, df: pd.DataFrame) -> None:
         for column, dtype in self._struct_type._dtypes:
             hidden_fields = self._struct_type._hidden_fields
-            if dtype.startswith("S") and column not in hidden_fields:
+            if dtype.startswith("S") and column not in hidden_fields and column in df:
                 df[column] = df[column].str.decode("utf-8")
 
     def _format_map_symbols(self, df: pd.DataFrame) -> None:
@@ -1523,29 +4172,156 @@ class DataFrameIterator:
 
     def _format_timezone(self, df: pd.DataFrame) -> None:
         for field in self._struct_type._timestamp_fields:
-            df[field] = df[field].dt.tz_convert(self._tz)
-
-    def _format_px(
-        self,
-        df: pd.DataFrame,
-        price_type: PriceType,
-    ) -> None:
-        px_fields = self._struct_type._price_fields
-
-        if price_type == PriceType.DECIMAL:
-            df[px_fields] = (
-                df[px_fields].replace(UNDEF_PRICE, np.nan).map(decimal.Decimal) / FIXED_PRICE_SCALE
-            )
-        elif price_type == PriceType.FLOAT:
-            df[px_fields] = df[px_fields].replace(UNDEF_PRICE, np.nan) / FIXED_PRICE_SCALE
-        else:
-            return  # do nothing
+            if field in df:
+                df[field] = df[field].dt.tz_convert(self._tz)
+
+    def _format_px(self, field: str, values: np.ndarray[Any, Any]) -> np.ndarray[Any, Any]:
+        if field not in self._price_fields:
+            return values
+        if self._price_type == PriceType.DECIMAL:
+            return _px_to_decimal(values)
+        if self._price_type == PriceType.FLOAT:
+            return _px_to_float(values)
+        return values
 
     def _format_pretty_ts(self, df: pd.DataFrame) -> None:
         for field in self._struct_type._timestamp_fields:
-            df[field] = pd.to_datetime(df[field], utc=True, errors="coerce")
+            if field in df:
+                df[field] = pd.to_datetime(df[field], utc=True, errors="coerce")
 
     def _format_set_index(self, df: pd.DataFrame) -> None:
         # the first ordered field will be ts_recv or ts_event when appropriate
         index_column = self._struct_type._ordered_fields[0]
         df.set_index(index_column, inplace=True)
+
+
+class RecordBatchIterator:
+    """
+    Iterator for Arrow record batches that supports batching and column
+    formatting for DBN records.
+
+    Columns are converted directly from the numpy arrays, producing the same
+    values and column layout as `DataFrameIterator` without creating a
+    `pd.DataFrame`. If `dictionary_symbols` is set, the 'symbol' column is
+    dictionary encoded.
+    """
+
+    def __init__(
+        self,
+        records: Iterator[np.ndarray[Any, Any]],
+        struct_type: type[DBNRecord],
+        instrument_map: InstrumentMap,
+        price_type: PriceType = PriceType.FLOAT,
+        pretty_ts: bool = True,
+        map_symbols: bool = True,
+        columns: list[str] | None = None,
+        dictionary_symbols: bool = False,
+    ):
+        self._records = records
+        self._struct_type = struct_type
+        self._price_type = price_type
+        self._pretty_ts = pretty_ts
+        self._map_symbols = map_symbols
+        self._instrument_map = instrument_map
+        self._columns = columns
+        self._dictionary_symbols = dictionary_symbols
+        self._schema: pa.Schema | None = None
+
+        # the first ordered field will be ts_recv or ts_event when appropriate
+        self._index_column = struct_type._ordered_fields[0]
+        self._price_fields = frozenset(struct_type._price_fields)
+        self._timestamp_fields = frozenset(struct_type._timestamp_fields)
+        if struct_type in (InstrumentDefMsg, InstrumentDefMsgV1, InstrumentDefMsgV2):
+            self._type_max_map = DEFINITION_TYPE_MAX_MAP
+        else:
+            self._type_max_map = {}
+
+    def __iter__(self) -> RecordBatchIterator:
+        return self
+
+    def __next__(self) -> pa.RecordBatch:
+        records = next(self._records).reshape(-1)
+
+        if self._columns is None:
+            fields = self._struct_type._ordered_fields
+        else:
+            fields = list(records.dtype.names)
+
+        if len(records) == 0 and not set(fields).issubset(records.dtype.names):
+            # no records of the requested schema were found
+            records = np.empty(0, dtype=self._struct_type._dtypes)
+
+        names: list[str] = []
+        arrays: list[pa.Array] = []
+        for field in fields:
+            if field == self._index_column:
+                continue
+            if (
+                field == "instrument_id"
+                and self._columns is not None
+                and "instrument_id" not in self._columns
+            ):
+                continue
+            names.append(field)
+            arrays.append(self._format_field(field, records[field]))
+
+        if self._map_symbols:
+            names.append("symbol")
+            arrays.append(self._format_map_symbols(records))
+
+        # the index column is stored last, as pandas does
+        names.append(self._index_column)
+        arrays.append(self._format_field(self._index_column, records[self._index_column]))
+
+        if self._schema is None:
+            self._schema = self._pandas_schema(pa.schema(zip(names, (a.type for a in arrays))))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+
+    def _format_field(self, field: str, values: np.ndarray[Any, Any]) -> pa.Array:
+        if field in self._price_fields:
+            if self._price_type == PriceType.DECIMAL:
+                return _px_to_decimal128(values)
+            if self._price_type == PriceType.FLOAT:
+                return pa.array(
+                    np.divide(values, FIXED_PRICE_SCALE, dtype=np.float64),
+                    mask=values == UNDEF_PRICE,
+                )
+            return pa.array(values)
+        if field in self._timestamp_fields and self._pretty_ts:
+            nanos = values.astype(np.int64)
+            return pa.array(nanos, type=pa.timestamp("ns", tz="UTC"), mask=nanos < 0)
+        if values.dtype.kind == "S":
+            return pa.array(values).cast(pa.string())
+        if field in self._type_max_map:
+            return pa.array(
+                values.astype(np.float64),
+                mask=values == self._type_max_map[field],
+            )
+        return pa.array(values)
+
+    def _format_map_symbols(self, records: np.ndarray[Any, Any]) -> pa.Array:
+        instrument_ids = records["instrument_id"]
+        nanos = records[self._index_column].astype(np.int64)
+        dates = np.where(nanos < 0, np.iinfo(np.int64).min, nanos).view("datetime64[ns]")
+        dates = dates.astype("datetime64[D]")
+
+        # resolve each unique instrument ID and date pair once as a dictionary
+        days = np.maximum(dates.view(np.int64), np.iinfo(np.int32).min)
+        keys = instrument_ids.astype(np.uint64) << np.uint64(32)
+        keys |= days.astype(np.uint64) & np.uint64(0xFFFFFFFF)
+        _, first, indices = np.unique(keys, return_index=True, return_inverse=True)
+        symbols = self._instrument_map.resolve_many(instrument_ids[first], dates[first])
+
+        symbol_array = pa.DictionaryArray.from_arrays(
+            indices.astype(np.int32),
+            pa.array(symbols, type=pa.string()),
+        )
+        if self._dictionary_symbols:
+            return symbol_array
+        return symbol_array.cast(pa.string())
+
+    def _pandas_schema(self, schema: pa.Schema) -> pa.Schema:
+        # attach pandas metadata so the index column is restored when read
+        frame = schema.empty_table().to_pandas().set_index(self._index_column)
+        return schema.with_metadata(pa.Schema.from_pandas(frame).metadata)
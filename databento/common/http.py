@@ -1,9 +1,17 @@
 from __future__ import annotations
 
+import asyncio
 import json
+import threading
 import warnings
+import weakref
+from collections.abc import AsyncGenerator
+from collections.abc import Generator
 from collections.abc import Iterable
 from collections.abc import Mapping
+from collections.abc import Sequence
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
 from io import BytesIO
 from os import PathLike
 from typing import IO
@@ -16,6 +24,7 @@ from aiohttp import ClientResponse
 from aiohttp import ContentTypeError
 from requests import JSONDecodeError
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.auth import HTTPBasicAuth
 
 from databento.common.constants import HTTP_STREAMING_READ_SIZE
@@ -25,10 +34,165 @@ from databento.common.error import BentoDeprecationWarning
 from databento.common.error import BentoError
 from databento.common.error import BentoServerError
 from databento.common.error import BentoWarning
+from databento.common.iterator import chunk
+from databento.common.stream import DBNStream
 from databento.common.system import USER_AGENT
 
 
 WARNING_HEADER_FIELD: Final = "X-Warning"
+HTTP_POOL_SIZE: Final = 10
+SYMBOL_LIST_BATCH_SIZE: Final = 2000
+
+
+class BentoHttpSession:
+    """
+    The HTTP connections shared by the endpoints of a client.
+
+    Connections are kept alive between requests, so only the first request
+    to each host pays for the TCP and TLS handshakes.
+
+    Asynchronous requests share one session per event loop, which is closed
+    when the loop shuts down its asynchronous generators, as `asyncio.run`
+    does on exit, or by `aclose`.
+
+    Parameters
+    ----------
+    pool_size : int, default 10
+        The maximum number of idle connections kept alive to each host by
+        synchronous requests.
+
+    Raises
+    ------
+    ValueError
+        If `pool_size` is not a positive integer.
+
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE):
+        if pool_size < 1:
+            raise ValueError("`pool_size` must be a positive integer")
+
+        self._pool_size = pool_size
+        self._pool_lock = threading.Lock()
+        self._session = requests.Session()
+        self._mount_adapter()
+        self._async_sessions: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop,
+            tuple[aiohttp.ClientSession, AsyncGenerator[None, None]],
+        ] = weakref.WeakKeyDictionary()
+        self._closing: set[Future[None]] = set()
+
+    @property
+    def pool_size(self) -> int:
+        """
+        Return the maximum number of idle connections kept alive to each host
+        by synchronous requests.
+
+        Returns
+        -------
+        int
+
+        """
+        return self._pool_size
+
+    def ensure_pool_size(self, pool_size: int) -> None:
+        """
+        Increase the maximum number of idle connections kept alive to each
+        host by synchronous requests to at least `pool_size`, so that many
+        concurrent requests do not discard their connections.
+
+        Parameters
+        ----------
+        pool_size : int
+            The minimum number of idle connections.
+
+        """
+        with self._pool_lock:
+            if pool_size > self._pool_size:
+                self._pool_size = pool_size
+                self._mount_adapter()
+
+    @property
+    def session(self) -> requests.Session:
+        """
+        Return the session for synchronous requests.
+
+        Returns
+        -------
+        requests.Session
+
+        """
+        return self._session
+
+    async def get_async_session(self) -> aiohttp.ClientSession:
+        """
+        Return the session for asynchronous requests in the running event
+        loop, which is created on first use in each event loop.
+
+        Returns
+        -------
+        aiohttp.ClientSession
+
+        """
+        loop = asyncio.get_running_loop()
+        entry = self._async_sessions.get(loop)
+        if entry is None or entry[0].closed:
+            # Requests previously opened a session each, so the number of
+            # concurrent connections is not limited
+            session = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=0))
+            closer = _close_at_shutdown(session)
+            self._async_sessions[loop] = (session, closer)
+            # Starting the generator registers it with the loop, which closes
+            # it, and so the session, on `loop.shutdown_asyncgens()`
+            await anext(closer)
+            return session
+        return entry[0]
+
+    def close(self) -> None:
+        """
+        Close the connections of the session.
+
+        The asynchronous sessions of running event loops are closed in the
+        background; use `aclose` within an event loop to wait for them.
+        The session remains usable and reconnects on the next request.
+
+        """
+        self._session.close()
+        for loop, (session, closer) in list(self._async_sessions.items()):
+            if session.closed or loop.is_closed():
+                continue
+            if loop.is_running():
+                future = asyncio.run_coroutine_threadsafe(closer.aclose(), loop)
+                self._closing.add(future)
+                future.add_done_callback(self._closing.discard)
+            else:
+                loop.run_until_complete(closer.aclose())
+        self._async_sessions.clear()
+
+    async def aclose(self) -> None:
+        """
+        Close the connections of the session, waiting for the asynchronous
+        session of the running event loop to close.
+
+        The session remains usable and reconnects on the next request.
+
+        """
+        entry = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if entry is not None:
+            await entry[1].aclose()
+        self.close()
+
+    def _mount_adapter(self) -> None:
+        adapter = HTTPAdapter(pool_connections=self._pool_size, pool_maxsize=self._pool_size)
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+
+async def _close_at_shutdown(session: aiohttp.ClientSession) -> AsyncGenerator[None, None]:
+    try:
+        yield
+    finally:
+        await session.close()
 
 
 class BentoHttpAPI:
@@ -38,10 +202,11 @@ class BentoHttpAPI:
 
     TIMEOUT = 100
 
-    def __init__(self, key: str, gateway: str):
+    def __init__(self, key: str, gateway: str, session: BentoHttpSession | None = None):
         self._key = key
         self._gateway = gateway
         self._headers = {"accept": "application/json", "user-agent": USER_AGENT}
+        self._session = BentoHttpSession() if session is None else session
 
     def _check_api_key(self) -> None:
         if self._key == "YOUR_API_KEY":
@@ -58,7 +223,7 @@ class BentoHttpAPI:
     ) -> Response:
         self._check_api_key()
 
-        with requests.get(
+        with self._session.session.get(
             url=url,
             params=params,
             headers=self._headers,
@@ -76,21 +241,20 @@ class BentoHttpAPI:
         basic_auth: bool = False,
     ) -> Any:
         self._check_api_key()
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
-                url=url,
-                params=params,
-                headers=self._headers,
-                auth=(
-                    aiohttp.BasicAuth(login=self._key, password="", encoding="utf-8")
-                    if basic_auth
-                    else None
-                ),
-                timeout=self.TIMEOUT,
-            ) as response:
-                check_backend_warnings(response)
-                await check_http_error_async(response)
-                return await response.json()
+        async with (await self._session.get_async_session()).get(
+            url=url,
+            params=params,
+            headers=self._headers,
+            auth=(
+                aiohttp.BasicAuth(login=self._key, password="", encoding="utf-8")
+                if basic_auth
+                else None
+            ),
+            timeout=self.TIMEOUT,
+        ) as response:
+            check_backend_warnings(response)
+            await check_http_error_async(response)
+            return await response.json()
 
     def _post(
         self,
@@ -101,7 +265,7 @@ class BentoHttpAPI:
     ) -> Response:
         self._check_api_key()
 
-        with requests.post(
+        with self._session.session.post(
             url=url,
             data=data,
             params=params,
@@ -113,6 +277,31 @@ class BentoHttpAPI:
             check_http_error(response)
             return response
 
+    def _post_symbol_batches(
+        self,
+        url: str,
+        data: Mapping[str, object | None],
+        symbols: Sequence[str],
+        basic_auth: bool = False,
+    ) -> list[Response]:
+        batches = batch_symbols(symbols)
+        if len(batches) == 1:
+            return [
+                self._post(url=url, data={**data, "symbols": batches[0]}, basic_auth=basic_auth),
+            ]
+
+        with ThreadPoolExecutor(max_workers=self._session.pool_size) as executor:
+            return list(
+                executor.map(
+                    lambda batch: self._post(
+                        url=url,
+                        data={**data, "symbols": batch},
+                        basic_auth=basic_auth,
+                    ),
+                    batches,
+                ),
+            )
+
     def _stream(
         self,
         url: str,
@@ -122,7 +311,7 @@ class BentoHttpAPI:
     ) -> DBNStore:
         self._check_api_key()
 
-        with requests.post(
+        with self._session.session.post(
             url=url,
             data=data,
             headers=self._headers,
@@ -151,6 +340,31 @@ class BentoHttpAPI:
             writer.close()
             return DBNStore.from_file(path)
 
+    def _stream_records(
+        self,
+        url: str,
+        data: dict[str, object | None],
+        basic_auth: bool,
+    ) -> DBNStream:
+        self._check_api_key()
+
+        response = self._session.session.post(
+            url=url,
+            data=data,
+            headers=self._headers,
+            auth=HTTPBasicAuth(username=self._key, password="") if basic_auth else None,
+            timeout=(self.TIMEOUT, self.TIMEOUT),
+            stream=True,
+        )
+        try:
+            check_backend_warnings(response)
+            check_http_error(response)
+        except BaseException:
+            response.close()
+            raise
+
+        return DBNStream(_iter_content(response))
+
     async def _stream_async(
         self,
         url: str,
@@ -160,38 +374,64 @@ class BentoHttpAPI:
     ) -> DBNStore:
         self._check_api_key()
 
-        async with aiohttp.ClientSession() as session:
-            async with session.post(
-                url=url,
-                data=data,
-                headers=self._headers,
-                auth=(
-                    aiohttp.BasicAuth(login=self._key, password="", encoding="utf-8")
-                    if basic_auth
-                    else None
-                ),
-                timeout=self.TIMEOUT,
-            ) as response:
-                check_backend_warnings(response)
-                await check_http_error_async(response)
-
-                if path is None:
-                    writer: IO[bytes] = BytesIO()
-                else:
-                    writer = open(path, "x+b")
-
-                try:
-                    async for chunk in response.content.iter_chunks():
-                        writer.write(chunk[0])
-                except Exception as exc:
-                    raise BentoError(f"Error streaming response: {exc}") from None
-
-                if path is None:
-                    writer.seek(0)
-                    return DBNStore.from_bytes(writer)
-
-                writer.close()
-                return DBNStore.from_file(path)
+        async with (await self._session.get_async_session()).post(
+            url=url,
+            data=data,
+            headers=self._headers,
+            auth=(
+                aiohttp.BasicAuth(login=self._key, password="", encoding="utf-8")
+                if basic_auth
+                else None
+            ),
+            timeout=self.TIMEOUT,
+        ) as response:
+            check_backend_warnings(response)
+            await check_http_error_async(response)
+
+            if path is None:
+                writer: IO[bytes] = BytesIO()
+            else:
+                writer = open(path, "x+b")
+
+            try:
+                async for chunk in response.content.iter_chunks():
+                    writer.write(chunk[0])
+            except Exception as exc:
+                raise BentoError(f"Error streaming response: {exc}") from None
+
+            if path is None:
+                writer.seek(0)
+                return DBNStore.from_bytes(writer)
+
+            writer.close()
+            return DBNStore.from_file(path)
+
+
+def batch_symbols(symbols: Sequence[str]) -> list[str]:
+    """
+    Join the symbols of a request into comma-separated batches of at most
+    `SYMBOL_LIST_BATCH_SIZE` symbols, the most accepted by each request.
+
+    Parameters
+    ----------
+    symbols : Sequence[str]
+        The symbols to batch.
+
+    Returns
+    -------
+    list[str]
+        The batches, of which there is at least one.
+
+    """
+    return [",".join(batch) for batch in chunk(symbols, SYMBOL_LIST_BATCH_SIZE)] or [""]
+
+
+def _iter_content(response: Response) -> Generator[bytes, None, None]:
+    with response:
+        try:
+            yield from response.iter_content(chunk_size=HTTP_STREAMING_READ_SIZE)
+        except Exception as exc:
+            raise BentoError(f"Error streaming response: {exc}") from None
 
 
 def is_400_series_error(status: int) -> bool:
@@ -0,0 +1,301 @@
+from __future__ import annotations
+
+import datetime
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Final
+
+import numpy as np
+import pandas as pd
+from databento_dbn import UNDEF_PRICE
+from databento_dbn import UNDEF_TIMESTAMP
+from databento_dbn import Schema
+
+from databento.common.dbnstore import DBNStore
+from databento.common.validation import validate_maybe_enum
+
+
+# The number of records of each store decoded at once
+JOIN_CHUNK_SIZE: Final = 2**16
+
+# The header fields which are not joined from the right records by default
+_HEADER_FIELDS: Final = ("length", "rtype")
+
+
+def asof_join(
+    left: DBNStore,
+    right: DBNStore,
+    by: str | None = "instrument_id",
+    on: str | None = None,
+    left_schema: Schema | str | None = None,
+    right_schema: Schema | str | None = None,
+    right_columns: Iterable[str] | None = None,
+    tolerance: pd.Timedelta | datetime.timedelta | int | None = None,
+    allow_exact_matches: bool = True,
+    right_suffix: str = "_right",
+    count: int | None = None,
+) -> np.ndarray[Any, Any] | Iterator[np.ndarray[Any, Any]]:
+    """
+    Join each record of `left`, such as a trade, with the last record of
+    `right` at or before it, such as the prevailing quote.
+
+    Both stores are read in chunks and joined with vectorized searches, so
+    neither is loaded at once. The records of each store must be in timestamp
+    order, as in DBN data.
+
+    Notes
+    -----
+    The joined records have every field of the left records, followed by the
+    joined fields of the right records. Right fields with the same name as a
+    left field are renamed with `right_suffix`.
+    When there is no right record to join, the joined fields have undefined
+    prices and timestamps, and zero otherwise.
+
+    Parameters
+    ----------
+    left : DBNStore
+        The records to join to, such as trades.
+    right : DBNStore
+        The records to join, such as quotes.
+    by : str, optional
+        The field which must match between joined records, such as "instrument_id".
+        If `None`, records are joined regardless of their fields.
+    on : str, optional
+        The timestamp field to join on, which must be in both schemas.
+        If unspecified, `ts_recv` is used if it is in both schemas, otherwise `ts_event`.
+    left_schema : Schema or str, optional
+        The DBN schema of the left records.
+        This is only required when reading a DBN stream with mixed record types.
+    right_schema : Schema or str, optional
+        The DBN schema of the right records.
+        This is only required when reading a DBN stream with mixed record types.
+    right_columns : Iterable[str], optional
+        The fields of the right records to join.
+        If unspecified, every field other than `length`, `rtype`, and `by` is joined.
+    tolerance : pd.Timedelta, datetime.timedelta, or int, optional
+        The maximum time between joined records.
+        If an integer is passed, then this represents nanoseconds.
+    allow_exact_matches : bool, default True
+        If right records with the same timestamp as a left record can be joined.
+        If False, only right records strictly before each left record are joined.
+    right_suffix : str, default "_right"
+        The suffix of right fields with the same name as a left field.
+    count : int, optional
+        If set, instead of returning a single `np.ndarray` an iterator will be
+        returned. When iterated, this object will yield a `np.ndarray` with at
+        most `count` elements until the left records are exhausted.
+
+    Returns
+    -------
+    np.ndarray | Iterator[np.ndarray]
+
+    Raises
+    ------
+    ValueError
+        If the DBN schema of either store is unspecified and cannot be determined.
+        If `by`, `on`, or any of `right_columns` is not a field of the schemas.
+        If `tolerance` is negative.
+
+    """
+    left_schema = _get_schema(left, left_schema)
+    right_schema = _get_schema(right, right_schema)
+    left_dtype = _get_dtype(left, left_schema)
+    right_dtype = _get_dtype(right, right_schema)
+
+    if on is None:
+        on = "ts_event"
+        if "ts_recv" in left_dtype.names and "ts_recv" in right_dtype.names:
+            on = "ts_recv"
+    for field in (on, by):
+        if field is None:
+            continue
+        if field not in left_dtype.names or field not in right_dtype.names:
+            raise ValueError(f"`{field}` is not a field of both {left_schema} and {right_schema}")
+
+    if right_columns is None:
+        right_columns = [field for field in right_dtype.names if field not in (*_HEADER_FIELDS, by)]
+    else:
+        right_columns = list(dict.fromkeys(right_columns))
+        for field in right_columns:
+            if field not in right_dtype.names:
+                raise ValueError(f"`{field}` is not a field of {right_schema}")
+
+    tolerance_ns = None
+    if tolerance is not None:
+        tolerance_ns = tolerance if isinstance(tolerance, int) else pd.Timedelta(tolerance).value
+        if tolerance_ns < 0:
+            raise ValueError("`tolerance` must not be negative")
+
+    right_struct = right._schema_struct_map[right_schema]
+    joined_fields = {}
+    fill_values: dict[str, Any] = {}
+    for field in right_columns:
+        joined_fields[field] = field + right_suffix if field in left_dtype.names else field
+        if field in right_struct._price_fields:
+            fill_values[field] = UNDEF_PRICE
+        elif field in right_struct._timestamp_fields:
+            fill_values[field] = UNDEF_TIMESTAMP
+        else:
+            fill_values[field] = np.zeros((), dtype=right_dtype[field])
+    # the left records are copied whole to the start of the joined records
+    out_names = list(left_dtype.names)
+    out_formats = [left_dtype.fields[name][0] for name in out_names]
+    out_offsets = [left_dtype.fields[name][1] for name in out_names]
+    offset = left_dtype.itemsize
+    for field in right_columns:
+        out_names.append(joined_fields[field])
+        out_formats.append(right_dtype[field])
+        out_offsets.append(offset)
+        offset += right_dtype[field].itemsize
+    out_dtype = np.dtype(
+        {"names": out_names, "formats": out_formats, "offsets": out_offsets, "itemsize": offset},
+    )
+
+    joined = _iter_asof_join(
+        left_chunks=left.to_ndarray(left_schema, count or JOIN_CHUNK_SIZE),
+        right_chunks=right.to_ndarray(right_schema, JOIN_CHUNK_SIZE),
+        right_dtype=right_dtype,
+        out_dtype=out_dtype,
+        joined_fields=joined_fields,
+        fill_values=fill_values,
+        on=on,
+        by=by,
+        tolerance=tolerance_ns,
+        allow_exact_matches=allow_exact_matches,
+    )
+
+    if count is not None:
+        return joined
+    arrays = list(joined)
+    if not arrays:
+        return np.empty(0, dtype=out_dtype)
+    return np.concatenate(arrays)
+
+
+def _get_schema(store: DBNStore, schema: Schema | str | None) -> Schema:
+    schema = validate_maybe_enum(schema, Schema, "schema")
+    if schema is None:
+        if store.schema is None:
+            raise ValueError("a schema must be specified for mixed DBN data")
+        schema = store.schema
+    return schema
+
+
+def _get_dtype(store: DBNStore, schema: Schema) -> np.dtype[Any]:
+    dtype = list(store._schema_struct_map[schema]._dtypes)
+    if store.metadata.ts_out:
+        dtype.append(("ts_out", "u8"))
+    return np.dtype(dtype)
+
+
+def _iter_asof_join(
+    left_chunks: Iterator[np.ndarray[Any, Any]],
+    right_chunks: Iterator[np.ndarray[Any, Any]],
+    right_dtype: np.dtype[Any],
+    out_dtype: np.dtype[Any],
+    joined_fields: dict[str, str],
+    fill_values: dict[str, Any],
+    on: str,
+    by: str | None,
+    tolerance: int | None,
+    allow_exact_matches: bool,
+) -> Iterator[np.ndarray[Any, Any]]:
+    # right records are moved as opaque bytes, which is faster than field by field
+    void_dtype = np.dtype((np.void, right_dtype.itemsize))
+    # the last right record of each key before the current window
+    carry = np.empty(0, dtype=void_dtype)
+    # the right records read after the current window
+    pending: np.ndarray[Any, Any] = np.empty(0, dtype=void_dtype)
+    right_exhausted = False
+
+    for left_records in left_chunks:
+        left_records = left_records.reshape(-1)
+        if len(left_records) == 0:
+            continue
+        max_ts = left_records[on].max()
+
+        buffers = [pending]
+        while not right_exhausted and (
+            len(buffers[-1]) == 0 or buffers[-1].view(right_dtype)[on][-1] <= max_ts
+        ):
+            try:
+                buffers.append(next(right_chunks).reshape(-1).view(void_dtype))
+            except StopIteration:
+                right_exhausted = True
+        pending = np.concatenate(buffers) if len(buffers) > 1 else pending
+        in_window = pending.view(right_dtype)[on] <= max_ts
+        candidates = np.concatenate([carry, pending[in_window]]).view(right_dtype)
+        pending = pending[~in_window]
+
+        matches, last_index = _match_asof(
+            left_records,
+            candidates,
+            on,
+            by,
+            tolerance,
+            allow_exact_matches,
+        )
+        carry = candidates.view(void_dtype)[last_index]
+
+        joined = np.empty(len(left_records), dtype=out_dtype)
+        joined_bytes = joined.view(np.uint8).reshape(len(joined), out_dtype.itemsize)
+        joined_bytes[:, : left_records.itemsize] = left_records.view(np.uint8).reshape(
+            len(left_records),
+            left_records.itemsize,
+        )
+        is_matched = matches >= 0
+        match_index = matches[is_matched]
+        for field, name in joined_fields.items():
+            joined[name] = fill_values[field]
+            joined[name][is_matched] = candidates[field][match_index]
+        yield joined
+
+
+def _match_asof(
+    left_records: np.ndarray[Any, Any],
+    right_records: np.ndarray[Any, Any],
+    on: str,
+    by: str | None,
+    tolerance: int | None,
+    allow_exact_matches: bool,
+) -> tuple[np.ndarray[Any, Any], np.ndarray[Any, Any]]:
+    """
+    Return the index of the right record joined to each left record, or -1,
+    and the indices of the last right record of each key.
+    """
+    num_right = len(right_records)
+    if by is None:
+        keys = np.zeros(num_right + len(left_records), dtype=np.uint64)
+    else:
+        keys = np.concatenate([right_records[by], left_records[by]]).astype(np.uint64)
+    ts = np.concatenate([right_records[on], left_records[on]]).astype(np.uint64)
+    is_left = np.zeros(len(keys), dtype=bool)
+    is_left[num_right:] = True
+
+    # sort by key, then timestamp, then right records before left records at
+    # the same timestamp for exact matches; the sorts are stable, so later
+    # right records remain after earlier ones. The timestamps of each store
+    # are already sorted, so two stable sorts are faster than a lexsort
+    tiebreak = is_left if allow_exact_matches else ~is_left
+    order = np.argsort(ts * np.uint64(2) + tiebreak, kind="stable")
+    order = order[np.argsort(keys[order], kind="stable")]
+    is_left_sorted = is_left[order]
+    positions = np.arange(len(order))
+    last_right = np.maximum.accumulate(np.where(is_left_sorted, -1, positions))
+
+    left_positions = np.flatnonzero(is_left_sorted)
+    left_index = order[left_positions]
+    match_positions = last_right[left_positions]
+    match_index = order[match_positions.clip(min=0)]
+    is_match = (match_positions >= 0) & (keys[match_index] == keys[left_index])
+    if tolerance is not None:
+        is_match &= ts[left_index] - ts[match_index] <= tolerance
+
+    matches = np.full(len(left_records), -1, dtype=np.int64)
+    matches[left_index - num_right] = np.where(is_match, match_index, -1)
+
+    right_order = order[~is_left_sorted]
+    is_last = np.ones(len(right_order), dtype=bool)
+    is_last[:-1] = keys[right_order[1:]] != keys[right_order[:-1]]
+    return matches, right_order[is_last]
@@ -0,0 +1,305 @@
+from __future__ import annotations
+
+import datetime
+from collections.abc import Sequence
+from io import BytesIO
+from os import PathLike
+from typing import IO
+from typing import Final
+
+import pandas as pd
+import zstandard
+from databento_dbn import Metadata
+from databento_dbn import Schema
+
+from databento.common.dbnstore import MERGE_CHUNK_SIZE
+from databento.common.dbnstore import DBNStore
+from databento.common.dbnstore import MergedDBNStore
+from databento.common.error import BentoError
+from databento.common.symbology import MappingInterval
+from databento.common.symbology import SymbolMapping
+
+
+# The size of the decompressed records of each zstd frame of stitched data
+SHARD_FRAME_SIZE: Final = 2**22
+
+
+def shard_range(
+    start: int,
+    end: int,
+    parallel: int = 1,
+    shard: pd.Timedelta | datetime.timedelta | str | None = None,
+) -> list[tuple[int, int]]:
+    """
+    Split the range `[start, end)` in UNIX nanoseconds into consecutive
+    sub-ranges.
+
+    Parameters
+    ----------
+    start : int
+        The inclusive start of the range.
+    end : int
+        The exclusive end of the range.
+    parallel : int, default 1
+        The number of sub-ranges of equal length to split the range into
+        when `shard` is `None`.
+    shard : pd.Timedelta, datetime.timedelta, or str, optional
+        The length of each sub-range. Sub-ranges are aligned to multiples of
+        `shard` since the UNIX epoch, so the first and last can be shorter.
+
+    Returns
+    -------
+    list[tuple[int, int]]
+
+    Raises
+    ------
+    ValueError
+        If the range is empty.
+        If `parallel` or `shard` is not positive.
+
+    """
+    if end <= start:
+        raise ValueError("`end` must be after `start`")
+    if parallel < 1:
+        raise ValueError("`parallel` must be a positive integer")
+
+    if shard is None:
+        step = -(-(end - start) // parallel)
+        bounds = list(range(start, end, step))
+    else:
+        step = pd.Timedelta(shard).value
+        if step <= 0:
+            raise ValueError("`shard` must be a positive duration")
+        bounds = [start, *range(start - start % step + step, end, step)]
+
+    return list(zip(bounds, [*bounds[1:], end]))
+
+
+def merge_metadata(metadatas: Sequence[Metadata]) -> Metadata:
+    """
+    Merge the metadata of consecutive sub-ranges of the same request into the
+    metadata of the whole request.
+
+    Symbols are not found only if they are not found in every sub-range, and
+    are partially resolved if they are partially resolved or not found in
+    any sub-range. Adjacent symbol mapping intervals with the same symbol are
+    joined.
+
+    Parameters
+    ----------
+    metadatas : Sequence[Metadata]
+        The metadata of each sub-range, in order.
+
+    Returns
+    -------
+    Metadata
+
+    Raises
+    ------
+    BentoError
+        If the metadata have different DBN versions or `ts_out` values.
+
+    """
+    first, last = metadatas[0], metadatas[-1]
+    if any(m.version != first.version or m.ts_out != first.ts_out for m in metadatas):
+        raise BentoError("Cannot merge DBN data with different versions or `ts_out`")
+
+    symbols: dict[str, None] = {}
+    partial: dict[str, None] = {}
+    not_found = dict.fromkeys(first.not_found)
+    maybe_found: dict[str, None] = {}
+    mappings: dict[str, list[MappingInterval]] = {}
+    for metadata in metadatas:
+        symbols.update(dict.fromkeys(metadata.symbols))
+        partial.update(dict.fromkeys(metadata.partial))
+        maybe_found.update(dict.fromkeys(metadata.not_found))
+        not_found = {s: None for s in not_found if s in metadata.not_found}
+        for raw_symbol, intervals in metadata.mappings.items():
+            mappings.setdefault(raw_symbol, []).extend(
+                MappingInterval(i["start_date"], i["end_date"], i["symbol"]) for i in intervals
+            )
+    partial.update(dict.fromkeys(s for s in maybe_found if s not in not_found))
+
+    return Metadata(
+        dataset=first.dataset,
+        start=first.start,
+        stype_in=first.stype_in,
+        stype_out=first.stype_out,
+        schema=None if first.schema is None else Schema(first.schema),
+        symbols=list(symbols),
+        partial=list(partial),
+        not_found=list(not_found),
+        mappings=[
+            SymbolMapping.from_intervals(raw_symbol, _coalesce_intervals(intervals))
+            for raw_symbol, intervals in mappings.items()
+        ],
+        end=last.end,
+        limit=None,
+        ts_out=first.ts_out,
+        version=first.version,
+    )
+
+
+def concat_stores(
+    stores: Sequence[DBNStore],
+    path: PathLike[str] | str | None = None,
+) -> DBNStore:
+    """
+    Stitch the DBN data of consecutive sub-ranges of the same request into
+    one zstd compressed `DBNStore` with merged metadata.
+
+    The records of each store are compressed in frames of at most
+    `SHARD_FRAME_SIZE` bytes, so the result can be decompressed in parallel.
+
+    Parameters
+    ----------
+    stores : Sequence[DBNStore]
+        The data of each sub-range, in order.
+    path : PathLike[str] or str, optional
+        The file path to write the stitched data to.
+        If `None`, the data is kept in memory.
+
+    Returns
+    -------
+    DBNStore
+
+    See Also
+    --------
+    merge_metadata
+
+    """
+    metadata = merge_metadata([store.metadata for store in stores])
+    compressor = zstandard.ZstdCompressor(write_checksum=True)
+
+    if path is None:
+        writer: IO[bytes] = BytesIO()
+    else:
+        writer = open(path, "x+b")
+
+    writer.write(compressor.compress(metadata.encode()))
+    for store in stores:
+        reader = store.reader
+        reader.seek(store._metadata_length)
+        while chunk := reader.read(SHARD_FRAME_SIZE):
+            writer.write(compressor.compress(chunk))
+
+    if path is None:
+        writer.seek(0)
+        return DBNStore.from_bytes(writer)
+
+    writer.close()
+    return DBNStore.from_file(path)
+
+
+def merge_stores(
+    stores: Sequence[DBNStore],
+    path: PathLike[str] | str | None = None,
+    limit: int | None = None,
+) -> DBNStore:
+    """
+    Merge the DBN data of requests for disjoint symbols over the same range
+    into one zstd compressed `DBNStore`, in timestamp order.
+
+    Parameters
+    ----------
+    stores : Sequence[DBNStore]
+        The data of each request.
+    path : PathLike[str] or str, optional
+        The file path to write the merged data to.
+        If `None`, the data is kept in memory.
+    limit : int, optional
+        The maximum number of merged records.
+
+    Returns
+    -------
+    DBNStore
+
+    See Also
+    --------
+    MergedDBNStore
+
+    """
+    merged = MergedDBNStore(stores)
+
+    if path is None:
+        writer: IO[bytes] = BytesIO()
+    else:
+        writer = open(path, "x+b")
+
+    with zstandard.ZstdCompressor(write_checksum=True).stream_writer(
+        writer,
+        closefd=False,
+    ) as compressor:
+        compressor.write(merged.metadata.encode())
+        for records in merged.to_ndarray(count=MERGE_CHUNK_SIZE):
+            if limit is not None:
+                records = records[:limit]
+                limit -= len(records)
+            compressor.write(records.tobytes())
+            if limit == 0:
+                break
+
+    if path is None:
+        writer.seek(0)
+        return DBNStore.from_bytes(writer)
+
+    writer.close()
+    return DBNStore.from_file(path)
+
+
+def stitch_stores(
+    stores: Sequence[Sequence[DBNStore]],
+    path: PathLike[str] | str | None = None,
+    limit: int | None = None,
+) -> DBNStore:
+    """
+    Stitch the DBN data of requests split by time and by symbols into one
+    zstd compressed `DBNStore`.
+
+    The sub-ranges of each batch of symbols are concatenated in order, and
+    then the batches are merged in timestamp order.
+
+    Parameters
+    ----------
+    stores : Sequence[Sequence[DBNStore]]
+        The data of each sub-range, in order, of each batch of symbols.
+    path : PathLike[str] or str, optional
+        The file path to write the stitched data to.
+        If `None`, the data is kept in memory.
+    limit : int, optional
+        The maximum number of records when there are several batches of symbols.
+
+    Returns
+    -------
+    DBNStore
+
+    See Also
+    --------
+    concat_stores
+    merge_stores
+
+    """
+    if len(stores) == 1:
+        return concat_stores(stores[0], path=path)
+
+    return merge_stores(
+        [batch[0] if len(batch) == 1 else concat_stores(batch) for batch in stores],
+        path=path,
+        limit=limit,
+    )
+
+
+def _coalesce_intervals(intervals: list[MappingInterval]) -> list[MappingInterval]:
+    coalesced: list[MappingInterval] = []
+    for interval in sorted(intervals):
+        previous = coalesced[-1] if coalesced else None
+        if (
+            previous is not None
+            and previous.symbol == interval.symbol
+            and interval.start_date <= previous.end_date
+        ):
+            end_date = max(previous.end_date, interval.end_date)
+            coalesced[-1] = previous._replace(end_date=end_date)
+        else:
+            coalesced.append(interval)
+    return coalesced
@@ -0,0 +1,234 @@
+from __future__ import annotations
+
+import io
+import warnings
+from collections.abc import Generator
+from collections.abc import Iterable
+from collections.abc import Iterator
+from typing import Any
+from typing import Final
+
+import numpy as np
+import zstandard
+from databento_dbn import DBNDecoder
+from databento_dbn import DBNRecord
+from databento_dbn import Metadata
+from databento_dbn import Schema
+from databento_dbn import VersionUpgradePolicy
+
+from databento.common.constants import schema_struct_map
+from databento.common.error import BentoError
+from databento.common.error import BentoWarning
+
+
+DBN_PREFIX: Final = b"DBN"
+STREAM_READ_SIZE: Final = 2**16
+
+
+class DBNStream:
+    """
+    A stream of DBN data, such as the body of an HTTP response, which is
+    decoded as it arrives rather than once it is complete.
+
+    Records can be consumed once, either by iterating over the stream or with
+    `DBNStream.iter_ndarray`. Closing the stream releases the underlying
+    connection before the data is exhausted.
+
+    Parameters
+    ----------
+    chunks : Iterable[bytes]
+        The chunks of zstd compressed or uncompressed DBN data.
+
+    """
+
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks = iter(chunks)
+        self._reader: io.BufferedIOBase | zstandard.ZstdDecompressionReader | None = None
+        self._metadata: Metadata | None = None
+        self._pending = b""
+        self._consumed = False
+
+    def __enter__(self) -> DBNStream:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
+    def __iter__(self) -> Generator[DBNRecord, None, None]:
+        metadata = self.metadata
+        decoder = DBNDecoder(
+            has_metadata=False,
+            ts_out=metadata.ts_out,
+            input_version=metadata.version,
+            upgrade_policy=VersionUpgradePolicy.UPGRADE_TO_V3,
+        )
+        for raw in self._iter_raw():
+            decoder.write(raw)
+            for record in decoder.decode():
+                if isinstance(record, Metadata):
+                    continue
+                yield record
+
+        if decoder.buffer():
+            warnings.warn(
+                BentoWarning("DBN stream is truncated or contains an incomplete record"),
+            )
+
+    def __repr__(self) -> str:
+        name = self.__class__.__name__
+        schema = None if self._metadata is None else self._metadata.schema
+        return f"<{name}(schema={schema})>"
+
+    @property
+    def metadata(self) -> Metadata:
+        """
+        Return the metadata of the stream, reading it from the stream if it
+        has not arrived yet.
+
+        Returns
+        -------
+        Metadata
+
+        Raises
+        ------
+        BentoError
+            If the stream ends before its metadata.
+
+        """
+        if self._metadata is None:
+            buffer = self._pending
+            while len(buffer) < 8 or len(buffer) < 8 + _metadata_length(buffer):
+                raw = self._read()
+                if not raw:
+                    raise BentoError("DBN stream ended before its metadata")
+                buffer += raw
+            metadata_end = 8 + _metadata_length(buffer)
+            self._metadata = Metadata.decode(
+                buffer[:metadata_end],
+                upgrade_policy=VersionUpgradePolicy.AS_IS,
+            )
+            self._pending = buffer[metadata_end:]
+        return self._metadata
+
+    def close(self) -> None:
+        """
+        Close the stream, discarding any data which has not been read.
+        """
+        self._consumed = True
+        close = getattr(self._chunks, "close", None)
+        if close is not None:
+            close()
+
+    def iter_ndarray(self, count: int | None = None) -> Generator[np.ndarray[Any, Any], None, None]:
+        """
+        Yield the records of the stream as numpy `ndarray`s as soon as they
+        arrive.
+
+        Parameters
+        ----------
+        count : int, optional
+            The maximum number of records in each array.
+            If `None`, each array has the complete records of each chunk of data
+            which arrives.
+
+        Yields
+        ------
+        np.ndarray
+
+        Raises
+        ------
+        ValueError
+            If `count` is not a positive integer.
+            If the stream contains mixed record types.
+
+        """
+        if count is not None and count < 1:
+            raise ValueError("`count` must be a positive integer")
+
+        metadata = self.metadata
+        if metadata.schema is None:
+            raise ValueError("a DBN stream with mixed record types cannot be read as an ndarray")
+
+        dtype = list(schema_struct_map(metadata.version)[Schema(metadata.schema)]._dtypes)
+        if metadata.ts_out:
+            dtype.append(("ts_out", "u8"))
+        record_dtype = np.dtype(dtype)
+
+        buffer = b""
+        for raw in self._iter_raw():
+            buffer += raw
+            size = len(buffer) - len(buffer) % record_dtype.itemsize
+            step = max(size, 1) if count is None else count * record_dtype.itemsize
+            for start in range(0, size, step):
+                records = buffer[start : min(start + step, size)]
+                yield np.frombuffer(records, dtype=record_dtype)
+            buffer = buffer[size:]
+
+        if buffer:
+            warnings.warn(
+                BentoWarning("DBN stream is truncated or contains an incomplete record"),
+            )
+
+    def _iter_raw(self) -> Generator[bytes, None, None]:
+        """
+        Yield the decompressed record data of the stream, once.
+        """
+        if self._consumed:
+            raise BentoError("The records of a DBN stream can only be read once")
+        self._consumed = True
+        if self._pending:
+            yield self._pending
+            self._pending = b""
+        while raw := self._read():
+            yield raw
+
+    def _read(self) -> bytes:
+        if self._reader is None:
+            # enough bytes to tell DBN data from a zstd frame
+            first = b""
+            while len(first) < 4:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    break
+                first += chunk
+            if not first:
+                return b""
+            source = _ChunkReader(first, self._chunks)
+            if first.startswith(DBN_PREFIX):
+                self._reader = io.BufferedReader(source, STREAM_READ_SIZE)
+            else:
+                self._reader = zstandard.ZstdDecompressor().stream_reader(
+                    source,  # type: ignore [arg-type]
+                    read_size=STREAM_READ_SIZE,
+                    read_across_frames=True,
+                )
+        return self._reader.read1(STREAM_READ_SIZE)
+
+
+class _ChunkReader(io.RawIOBase):
+    """
+    A readable file over an iterator of chunks of bytes, which returns the
+    bytes of each chunk as soon as it arrives.
+    """
+
+    def __init__(self, first: bytes, chunks: Iterator[bytes]) -> None:
+        self._chunks = chunks
+        self._chunk = memoryview(first)
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: Any) -> int:
+        while not self._chunk:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._chunk = memoryview(chunk)
+        size = min(len(buffer), len(self._chunk))
+        buffer[:size] = self._chunk[:size]
+        self._chunk = self._chunk[size:]
+        return size
+
+
+def _metadata_length(buffer: bytes) -> int:
+    return int.from_bytes(buffer[4:8], byteorder="little")
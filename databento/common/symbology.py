@@ -4,7 +4,10 @@ import csv
 import datetime as dt
 import functools
 import json
+from collections.abc import Iterable
 from collections.abc import Mapping
+from collections.abc import Sequence
+from dataclasses import dataclass
 from io import TextIOWrapper
 from os import PathLike
 from pathlib import Path
@@ -20,6 +23,7 @@ from databento_dbn import Metadata
 from databento_dbn import SType
 from databento_dbn import SymbolMappingMsg
 from databento_dbn import SymbolMappingMsgV1
+from databento_dbn.metadata import MappingInterval as DBNMappingInterval
 from numpy.typing import NDArray
 
 from databento.common.parsing import datetime_to_unix_nanoseconds
@@ -46,6 +50,54 @@ class MappingInterval(NamedTuple):
     symbol: str
 
 
+@dataclass
+class SymbolMapping:
+    """
+    The mapping intervals for a requested symbol, as stored in DBN metadata.
+
+    Attributes
+    ----------
+    raw_symbol: str
+        The requested symbol.
+    intervals: Sequence[databento_dbn.metadata.MappingInterval]
+        The intervals inside which the symbol is defined.
+
+    """
+
+    raw_symbol: str
+    intervals: Sequence[DBNMappingInterval]
+
+    @classmethod
+    def from_intervals(
+        cls,
+        raw_symbol: str,
+        intervals: Iterable[MappingInterval],
+    ) -> SymbolMapping:
+        """
+        Create the mapping of a requested symbol from its intervals.
+
+        Parameters
+        ----------
+        raw_symbol: str
+            The requested symbol.
+        intervals: Iterable[MappingInterval]
+            The intervals inside which the symbol is defined.
+
+        Returns
+        -------
+        SymbolMapping
+
+        """
+        return cls(raw_symbol, [_MetadataMappingInterval(*interval) for interval in intervals])
+
+
+@dataclass
+class _MetadataMappingInterval:
+    start_date: dt.date
+    end_date: dt.date
+    symbol: str
+
+
 def _validate_path_pair(
     in_file: PathLike[str] | str,
     out_file: PathLike[str] | str | None,
@@ -0,0 +1,348 @@
+from __future__ import annotations
+
+import io
+import json
+from collections import deque
+from concurrent.futures import Future
+from concurrent.futures import ThreadPoolExecutor
+from os import PathLike
+from pathlib import Path
+from typing import IO
+from typing import Final
+from typing import NamedTuple
+
+import zstandard
+
+
+ZSTD_MAGIC_NUMBER: Final = 0xFD2FB528
+ZSTD_SKIPPABLE_MAGIC_MASK: Final = 0xFFFFFFF0
+ZSTD_SKIPPABLE_MAGIC_NUMBER: Final = 0x184D2A50
+ZSTD_BLOCK_HEADER_SIZE: Final = 3
+ZSTD_CHECKSUM_SIZE: Final = 4
+
+FRAME_INDEX_SUFFIX: Final = ".idx"
+FRAME_INDEX_VERSION: Final = 1
+
+
+class ZstdFrame(NamedTuple):
+    """
+    The location of a zstd frame within a compressed stream.
+
+    Attributes
+    ----------
+    offset : int
+        The position of the first byte of the frame.
+    size : int
+        The compressed size of the frame in bytes, including the header.
+    content_size : int | None
+        The decompressed size of the frame, if it is stored in the frame header.
+    skippable : bool
+        If the frame is a skippable frame, which produces no decompressed data.
+
+    """
+
+    offset: int
+    size: int
+    content_size: int | None
+    skippable: bool
+
+
+class FrameIndexEntry(NamedTuple):
+    """
+    A sparse index entry for a zstd frame of DBN records.
+
+    Attributes
+    ----------
+    offset : int
+        The compressed position of the frame.
+    decompressed_offset : int
+        The decompressed position of the start of the frame.
+    record_offset : int
+        The decompressed position of the first record which begins within the frame.
+    ts : int
+        The index timestamp of the first record which begins within the frame.
+
+    """
+
+    offset: int
+    decompressed_offset: int
+    record_offset: int
+    ts: int
+
+
+def read_frames(reader: IO[bytes]) -> list[ZstdFrame]:
+    """
+    Read the locations of all zstd frames in a compressed stream.
+
+    Only the frame and block headers are read; no data is decompressed.
+
+    Parameters
+    ----------
+    reader : IO[bytes]
+        A seekable reader positioned at the start of the compressed stream.
+
+    Returns
+    -------
+    list[ZstdFrame]
+
+    Raises
+    ------
+    ValueError
+        If the stream contains an invalid zstd frame.
+
+    """
+    frames: list[ZstdFrame] = []
+    position = reader.tell()
+
+    while magic_bytes := reader.read(4):
+        if len(magic_bytes) < 4:
+            raise ValueError(f"Truncated zstd frame at offset {position}")
+
+        magic = int.from_bytes(magic_bytes, byteorder="little")
+        if magic & ZSTD_SKIPPABLE_MAGIC_MASK == ZSTD_SKIPPABLE_MAGIC_NUMBER:
+            size = 8 + int.from_bytes(reader.read(4), byteorder="little")
+            frames.append(ZstdFrame(position, size, 0, True))
+        elif magic == ZSTD_MAGIC_NUMBER:
+            reader.seek(position)
+            header = reader.read(18)  # the maximum frame header size
+            params = zstandard.get_frame_parameters(header)
+            size = zstandard.frame_header_size(header)
+
+            reader.seek(position + size)
+            while True:
+                block_header_bytes = reader.read(ZSTD_BLOCK_HEADER_SIZE)
+                if len(block_header_bytes) < ZSTD_BLOCK_HEADER_SIZE:
+                    raise ValueError(f"Truncated zstd frame at offset {position}")
+
+                block_header = int.from_bytes(block_header_bytes, byteorder="little")
+                block_type = (block_header >> 1) & 0b11
+                if block_type == 3:
+                    raise ValueError(f"Reserved zstd block type at offset {position}")
+                block_size = 1 if block_type == 1 else block_header >> 3
+                size += ZSTD_BLOCK_HEADER_SIZE + block_size
+                reader.seek(position + size)
+                if block_header & 1:  # last block
+                    break
+
+            if params.has_checksum:
+                size += ZSTD_CHECKSUM_SIZE
+
+            content_size = params.content_size
+            if content_size == zstandard.CONTENTSIZE_UNKNOWN:
+                content_size = None
+            frames.append(ZstdFrame(position, size, content_size, False))
+        else:
+            raise ValueError(f"Invalid zstd frame magic number at offset {position}")
+
+        position += frames[-1].size
+        reader.seek(position)
+
+    return frames
+
+
+def create_zstd_executor(threads: int) -> ThreadPoolExecutor:
+    """
+    Create a pool of threads for decompressing zstd frames.
+
+    Parameters
+    ----------
+    threads : int
+        The number of threads.
+
+    Returns
+    -------
+    ThreadPoolExecutor
+
+    See Also
+    --------
+    ParallelZstdReader
+
+    """
+    return ThreadPoolExecutor(max_workers=threads, thread_name_prefix="databento_zstd")
+
+
+class ParallelZstdReader(io.RawIOBase):
+    """
+    A reader which decompresses the frames of a multi-frame zstd stream
+    concurrently using a pool of threads.
+
+    Decompressed data is returned in order. Only forward seeking is supported.
+
+    Parameters
+    ----------
+    reader : IO[bytes]
+        The seekable compressed stream.
+    frames : list[ZstdFrame]
+        The locations of the frames within `reader`.
+    threads : int
+        The number of threads to decompress with.
+    executor : ThreadPoolExecutor, optional
+        A shared pool of `threads` threads to decompress with, which is left
+        running when the reader is closed.
+        If `None`, the reader creates its own pool.
+
+    See Also
+    --------
+    read_frames
+
+    """
+
+    def __init__(
+        self,
+        reader: IO[bytes],
+        frames: list[ZstdFrame],
+        threads: int,
+        executor: ThreadPoolExecutor | None = None,
+    ) -> None:
+        if threads < 1:
+            raise ValueError("threads must be at least 1")
+
+        self._reader = reader
+        self._frames = deque(frame for frame in frames if not frame.skippable)
+        self._owns_executor = executor is None
+        self._executor = executor or create_zstd_executor(threads)
+        self._max_pending = 2 * threads
+        self._pending: deque[Future[bytes]] = deque()
+        self._frame = memoryview(b"")
+        self._frame_position = 0
+        self._position = 0
+
+    def close(self) -> None:
+        if not self.closed:
+            if self._owns_executor:
+                self._executor.shutdown(wait=False, cancel_futures=True)
+            for future in self._pending:
+                future.cancel()
+            self._pending.clear()
+            self._frame = memoryview(b"")
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: int | None = -1) -> bytes:
+        if size is None or size < 0:
+            size = -1
+
+        parts: list[memoryview] = []
+        remaining = size
+        while remaining != 0:
+            if self._frame_position >= len(self._frame) and not self._next_frame():
+                break
+            if remaining < 0:
+                end = len(self._frame)
+            else:
+                end = min(len(self._frame), self._frame_position + remaining)
+                remaining -= end - self._frame_position
+            parts.append(self._frame[self._frame_position : end])
+            self._frame_position = end
+
+        data = b"".join(parts)
+        self._position += len(data)
+        return data
+
+    def readall(self) -> bytes:
+        return self.read(-1)
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_CUR:
+            offset += self._position
+        elif whence != io.SEEK_SET:
+            raise io.UnsupportedOperation("only SEEK_SET and SEEK_CUR are supported")
+
+        if offset < self._position:
+            raise io.UnsupportedOperation("cannot seek backwards")
+
+        while self._position < offset and self.read(min(offset - self._position, 2**20)):
+            pass
+        return self._position
+
+    def seekable(self) -> bool:
+        return False
+
+    def tell(self) -> int:
+        return self._position
+
+    def _next_frame(self) -> bool:
+        while self._frames and len(self._pending) < self._max_pending:
+            frame = self._frames.popleft()
+            self._reader.seek(frame.offset)
+            self._pending.append(
+                self._executor.submit(_decompress_frame, self._reader.read(frame.size)),
+            )
+
+        if not self._pending:
+            return False
+
+        self._frame = memoryview(self._pending.popleft().result())
+        self._frame_position = 0
+        return True
+
+
+def _decompress_frame(data: bytes) -> bytes:
+    return zstandard.ZstdDecompressor().decompressobj().decompress(data)
+
+
+def read_frame_index(path: PathLike[str] | str, source: Path) -> list[FrameIndexEntry] | None:
+    """
+    Read a sparse frame index for `source` from the sidecar file at `path`.
+
+    Parameters
+    ----------
+    path : PathLike[str] or str
+        The path of the index file.
+    source : Path
+        The path of the indexed DBN file.
+
+    Returns
+    -------
+    list[FrameIndexEntry] or None
+        The index entries or `None` if the index is missing or stale.
+
+    """
+    try:
+        with open(path) as index_file:
+            index = json.load(index_file)
+    except (OSError, ValueError):
+        return None
+
+    stat = source.stat()
+    if (
+        index.get("version") != FRAME_INDEX_VERSION
+        or index.get("size") != stat.st_size
+        or index.get("mtime_ns") != stat.st_mtime_ns
+    ):
+        return None
+
+    return [FrameIndexEntry(*entry) for entry in index["entries"]]
+
+
+def write_frame_index(
+    path: PathLike[str] | str,
+    source: Path,
+    entries: list[FrameIndexEntry],
+) -> None:
+    """
+    Write a sparse frame index for `source` to the sidecar file at `path`.
+
+    Parameters
+    ----------
+    path : PathLike[str] or str
+        The path of the index file.
+    source : Path
+        The path of the indexed DBN file.
+    entries : list[FrameIndexEntry]
+        The index entries.
+
+    """
+    stat = source.stat()
+    with open(path, "w") as index_file:
+        json.dump(
+            {
+                "version": FRAME_INDEX_VERSION,
+                "size": stat.st_size,
+                "mtime_ns": stat.st_mtime_ns,
+                "entries": entries,
+            },
+            index_file,
+        )
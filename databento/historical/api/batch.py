@@ -19,7 +19,6 @@ from typing import ClassVar
 from typing import Final
 
 import pandas as pd
-import requests
 from databento_dbn import Compression
 from databento_dbn import Encoding
 from databento_dbn import Schema
@@ -35,6 +34,7 @@ from databento.common.error import BentoError
 from databento.common.error import BentoHttpError
 from databento.common.error import BentoWarning
 from databento.common.http import BentoHttpAPI
+from databento.common.http import BentoHttpSession
 from databento.common.http import check_http_error
 from databento.common.parsing import datetime_to_string
 from databento.common.parsing import optional_datetime_to_string
@@ -56,8 +56,13 @@ class BatchHttpAPI(BentoHttpAPI):
     Provides request methods for the batch HTTP API endpoints.
     """
 
-    def __init__(self, key: str, gateway: str) -> None:
-        super().__init__(key=key, gateway=gateway)
+    def __init__(
+        self,
+        key: str,
+        gateway: str,
+        session: BentoHttpSession | None = None,
+    ) -> None:
+        super().__init__(key=key, gateway=gateway, session=session)
         self._base_url = gateway + f"/v{API_VERSION}/batch"
 
     def submit_job(
@@ -509,7 +514,7 @@ class BatchHttpAPI(BentoHttpAPI):
             else:
                 mode = "wb"
             try:
-                with requests.get(
+                with self._session.session.get(
                     url=batch_download_file.https_url,
                     headers=headers,
                     auth=HTTPBasicAuth(username=self._key, password=""),
@@ -601,7 +606,7 @@ class BatchHttpAPI(BentoHttpAPI):
             headers: dict[str, str] = self._headers.copy()
 
             try:
-                with requests.get(
+                with self._session.session.get(
                     url=f"{self._base_url}.download",
                     params={"job_id": job_id},
                     headers=headers,
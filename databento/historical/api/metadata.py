@@ -14,7 +14,9 @@ from requests import Response
 
 from databento.common import API_VERSION
 from databento.common.enums import FeedMode
+from databento.common.http import SYMBOL_LIST_BATCH_SIZE
 from databento.common.http import BentoHttpAPI
+from databento.common.http import BentoHttpSession
 from databento.common.parsing import datetime_to_string
 from databento.common.parsing import optional_date_to_string
 from databento.common.parsing import optional_datetime_to_string
@@ -30,8 +32,13 @@ class MetadataHttpAPI(BentoHttpAPI):
     Provides request methods for the metadata HTTP API endpoints.
     """
 
-    def __init__(self, key: str, gateway: str) -> None:
-        super().__init__(key=key, gateway=gateway)
+    def __init__(
+        self,
+        key: str,
+        gateway: str,
+        session: BentoHttpSession | None = None,
+    ) -> None:
+        super().__init__(key=key, gateway=gateway, session=session)
         self._base_url = gateway + f"/v{API_VERSION}/metadata"
 
     def list_publishers(self) -> list[dict[str, int | str]]:
@@ -290,7 +297,8 @@ class MetadataHttpAPI(BentoHttpAPI):
             If an integer is passed, then this represents nanoseconds since the UNIX epoch.
             Defaults to the forward filled value of `start` based on the resolution provided.
         symbols : Iterable[str | int] or str or int, optional
-            The instrument symbols to filter for. Takes up to 2,000 symbols per request.
+            The instrument symbols to filter for. More than 2,000 symbols are split into
+            concurrent requests of up to 2,000 symbols each, of which the results are summed.
             If 'ALL_SYMBOLS' or `None` then will select **all** symbols.
         schema : Schema or str {'mbo', 'mbp-1', 'mbp-10', 'trades', 'tbbo', 'ohlcv-1s', 'ohlcv-1m', 'ohlcv-1h', 'ohlcv-1d', 'definition', 'statistics', 'status'}, default 'trades'  # noqa
             The data record schema for the request.
@@ -320,13 +328,18 @@ class MetadataHttpAPI(BentoHttpAPI):
         if limit is not None:
             data["limit"] = str(limit)
 
-        response: Response = self._post(
+        responses = self._post_symbol_batches(
             url=self._base_url + ".get_record_count",
             data=data,
+            symbols=symbols_list,
             basic_auth=True,
         )
 
-        return response.json()
+        counts = [response.json() for response in responses]
+        count = sum(counts[1:], counts[0])
+        if limit is not None and len(counts) > 1:
+            return min(count, limit)
+        return count
 
     def get_billable_size(
         self,
@@ -358,7 +371,8 @@ class MetadataHttpAPI(BentoHttpAPI):
             If an integer is passed, then this represents nanoseconds since the UNIX epoch.
             Defaults to the forward filled value of `start` based on the resolution provided.
         symbols : Iterable[str | int] or str, or int, optional
-            The instrument symbols to filter for. Takes up to 2,000 symbols per request.
+            The instrument symbols to filter for. More than 2,000 symbols are split into
+            concurrent requests of up to 2,000 symbols each, of which the results are summed.
             If 'ALL_SYMBOLS' or `None` then will select **all** symbols.
         schema : Schema or str {'mbo', 'mbp-1', 'mbp-10', 'trades', 'tbbo', 'ohlcv-1s', 'ohlcv-1m', 'ohlcv-1h', 'ohlcv-1d', 'definition', 'statistics', 'status'}, default 'trades'  # noqa
             The data record schema for the request.
@@ -366,6 +380,7 @@ class MetadataHttpAPI(BentoHttpAPI):
             The input symbology type to resolve from.
         limit : int, optional
             The maximum number of records to return. If `None` then no limit.
+            Cannot be specified for more than 2,000 symbols.
 
         Returns
         -------
@@ -386,15 +401,21 @@ class MetadataHttpAPI(BentoHttpAPI):
         }
 
         if limit is not None:
+            if len(symbols_list) > SYMBOL_LIST_BATCH_SIZE:
+                raise ValueError(
+                    f"`limit` cannot be specified for more than {SYMBOL_LIST_BATCH_SIZE} symbols",
+                )
             data["limit"] = str(limit)
 
-        response: Response = self._post(
+        responses = self._post_symbol_batches(
             url=self._base_url + ".get_billable_size",
             data=data,
+            symbols=symbols_list,
             basic_auth=True,
         )
 
-        return response.json()
+        results = [response.json() for response in responses]
+        return sum(results[1:], results[0])
 
     def get_cost(
         self,
@@ -430,7 +451,8 @@ class MetadataHttpAPI(BentoHttpAPI):
         mode : FeedMode or str {'live', 'historical-streaming', 'historical'}, default `None`
             The data feed mode for the request. This parameter has been deprecated.
         symbols : Iterable[str | int] or str or int, optional
-            The instrument symbols to filter for. Takes up to 2,000 symbols per request.
+            The instrument symbols to filter for. More than 2,000 symbols are split into
+            concurrent requests of up to 2,000 symbols each, of which the results are summed.
             If 'ALL_SYMBOLS' or `None` then will select **all** symbols.
         schema : Schema or str {'mbo', 'mbp-1', 'mbp-10', 'trades', 'tbbo', 'ohlcv-1s', 'ohlcv-1m', 'ohlcv-1h', 'ohlcv-1d', 'definition', 'statistics', 'status'}, default 'trades'  # noqa
             The data record schema for the request.
@@ -438,6 +460,7 @@ class MetadataHttpAPI(BentoHttpAPI):
             The input symbology type to resolve from.
         limit : int, optional
             The maximum number of records to return. If `None` then no limit.
+            Cannot be specified for more than 2,000 symbols.
 
         Returns
         -------
@@ -465,12 +488,18 @@ class MetadataHttpAPI(BentoHttpAPI):
         }
 
         if limit is not None:
+            if len(symbols_list) > SYMBOL_LIST_BATCH_SIZE:
+                raise ValueError(
+                    f"`limit` cannot be specified for more than {SYMBOL_LIST_BATCH_SIZE} symbols",
+                )
             data["limit"] = str(limit)
 
-        response: Response = self._post(
+        responses = self._post_symbol_batches(
             url=self._base_url + ".get_cost",
             data=data,
+            symbols=symbols_list,
             basic_auth=True,
         )
 
-        return response.json()
+        results = [response.json() for response in responses]
+        return sum(results[1:], results[0])
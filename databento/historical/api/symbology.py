@@ -5,10 +5,10 @@ from datetime import date
 from typing import Any
 
 from databento_dbn import SType
-from requests import Response
 
 from databento.common import API_VERSION
 from databento.common.http import BentoHttpAPI
+from databento.common.http import BentoHttpSession
 from databento.common.parsing import date_to_string
 from databento.common.parsing import optional_date_to_string
 from databento.common.parsing import optional_symbols_list_to_list
@@ -22,8 +22,13 @@ class SymbologyHttpAPI(BentoHttpAPI):
     Provides request methods for the symbology HTTP API endpoints.
     """
 
-    def __init__(self, key: str, gateway: str) -> None:
-        super().__init__(key=key, gateway=gateway)
+    def __init__(
+        self,
+        key: str,
+        gateway: str,
+        session: BentoHttpSession | None = None,
+    ) -> None:
+        super().__init__(key=key, gateway=gateway, session=session)
         self._base_url = gateway + f"/v{API_VERSION}/symbology"
 
     def resolve(
@@ -45,7 +50,8 @@ class SymbologyHttpAPI(BentoHttpAPI):
         dataset : Dataset or str
             The dataset code (string identifier) for the request.
         symbols : Iterable[str | int] or str or int
-            The symbols to resolve. Takes up to 2,000 symbols per request.
+            The symbols to resolve. More than 2,000 symbols are split into concurrent
+            requests of up to 2,000 symbols each, of which the results are merged.
         stype_in : SType or str, default 'raw_symbol'
             The input symbology type to resolve from.
         stype_out : SType or str, default 'instrument_id'
@@ -76,10 +82,23 @@ class SymbologyHttpAPI(BentoHttpAPI):
             "end_date": optional_date_to_string(end_date),
         }
 
-        response: Response = self._post(
+        responses = self._post_symbol_batches(
             url=self._base_url + ".resolve",
             data=data,
+            symbols=symbols_list,
             basic_auth=True,
         )
 
-        return response.json()
+        return _merge_resolve_results([response.json() for response in responses])
+
+
+def _merge_resolve_results(results: list[dict[str, Any]]) -> dict[str, Any]:
+    merged = results[0]
+    for result in results[1:]:
+        merged["result"].update(result["result"])
+        for key in ("symbols", "partial", "not_found"):
+            merged[key].extend(result[key])
+        if result["status"] > merged["status"]:
+            merged["status"] = result["status"]
+            merged["message"] = result["message"]
+    return merged
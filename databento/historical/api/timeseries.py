@@ -1,9 +1,14 @@
 from __future__ import annotations
 
+import asyncio
+import shutil
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
 from datetime import date
 from datetime import datetime
+from datetime import timedelta
 from os import PathLike
+from pathlib import Path
 
 import pandas as pd
 from databento_dbn import Compression
@@ -12,12 +17,19 @@ from databento_dbn import Schema
 from databento_dbn import SType
 
 from databento.common import API_VERSION
+from databento.common.cache import DBNCache
 from databento.common.dbnstore import DBNStore
 from databento.common.http import BentoHttpAPI
+from databento.common.http import BentoHttpSession
+from databento.common.http import batch_symbols
 from databento.common.parsing import datetime_to_string
+from databento.common.parsing import datetime_to_unix_nanoseconds
 from databento.common.parsing import optional_datetime_to_string
 from databento.common.parsing import optional_symbols_list_to_list
 from databento.common.publishers import Dataset
+from databento.common.shard import shard_range
+from databento.common.shard import stitch_stores
+from databento.common.stream import DBNStream
 from databento.common.validation import validate_enum
 from databento.common.validation import validate_file_write_path
 from databento.common.validation import validate_semantic_string
@@ -28,9 +40,28 @@ class TimeseriesHttpAPI(BentoHttpAPI):
     Provides request methods for the time series HTTP API endpoints.
     """
 
-    def __init__(self, key: str, gateway: str) -> None:
-        super().__init__(key=key, gateway=gateway)
+    def __init__(
+        self,
+        key: str,
+        gateway: str,
+        session: BentoHttpSession | None = None,
+        cache: DBNCache | None = None,
+    ) -> None:
+        super().__init__(key=key, gateway=gateway, session=session)
         self._base_url = gateway + f"/v{API_VERSION}/timeseries"
+        self._cache = cache
+
+    @property
+    def cache(self) -> DBNCache | None:
+        """
+        Return the cache of `get_range` responses, if it is enabled.
+
+        Returns
+        -------
+        DBNCache or None
+
+        """
+        return self._cache
 
     def get_range(
         self,
@@ -43,6 +74,8 @@ class TimeseriesHttpAPI(BentoHttpAPI):
         stype_out: SType | str = "instrument_id",
         limit: int | None = None,
         path: PathLike[str] | str | None = None,
+        parallel: int = 1,
+        shard: pd.Timedelta | timedelta | str | None = None,
     ) -> DBNStore:
         """
         Request a historical time series data stream from Databento.
@@ -71,7 +104,8 @@ class TimeseriesHttpAPI(BentoHttpAPI):
             If an integer is passed, then this represents nanoseconds since the UNIX epoch.
             Defaults to the forward filled value of `start` based on the resolution provided.
         symbols : Iterable[str | int], or str, or int, optional
-            The instrument symbols to filter for. Takes up to 2,000 symbols per request.
+            The instrument symbols to filter for. More than 2,000 symbols are split into
+            concurrent requests of up to 2,000 symbols each.
             If more than 1 symbol is specified, the data is merged and sorted by time.
             If 'ALL_SYMBOLS' or `None` then will select **all** symbols.
         schema : Schema or str {'mbo', 'mbp-1', 'mbp-10', 'trades', 'tbbo', 'ohlcv-1s', 'ohlcv-1m', 'ohlcv-1h', 'ohlcv-1d', 'definition', 'statistics', 'status'}, default 'trades'
@@ -86,6 +120,15 @@ class TimeseriesHttpAPI(BentoHttpAPI):
             The maximum number of records to return. If `None` then no limit.
         path : PathLike[str] or str, optional
             The file path to stream the data to on disk (will then return a `DBNStore`).
+        parallel : int, default 1
+            The number of sub-ranges to download concurrently.
+            If greater than 1 and `shard` is `None`, the request range is split
+            into `parallel` sub-ranges of equal length. The sub-ranges of a
+            `shard` are downloaded one at a time unless greater than 1.
+        shard : pd.Timedelta, timedelta, or str, optional
+            The length of the sub-ranges to split the request range into, such
+            as '1h'. Sub-ranges are aligned to multiples of `shard` since the
+            UNIX epoch.
 
         Returns
         -------
@@ -94,6 +137,13 @@ class TimeseriesHttpAPI(BentoHttpAPI):
         Notes
         -----
         The Databento Binary Encoding (DBN) will be streamed.
+        When the request is sharded, the data of each sub-range is stitched in
+        order into one `DBNStore` with merged metadata. Sharding requires an
+        `end` and cannot be combined with a `limit`.
+        When the client has a `cache_dir`, responses are cached per sub-range,
+        so a request which overlaps a previous request on the same aligned
+        sub-ranges, such as a window extended by a day with `shard='1D'`, only
+        downloads the sub-ranges which are not cached.
 
         Warnings
         --------
@@ -124,11 +174,112 @@ class TimeseriesHttpAPI(BentoHttpAPI):
         if path is not None:
             path = validate_file_write_path(path, "path")
 
-        return self._stream(
+        requests_data = self._split_data(data, symbols_list, start, end, limit, parallel, shard)
+        if len(requests_data) > 1 or len(requests_data[0]) > 1:
+            with ThreadPoolExecutor(max_workers=self._concurrency(parallel, shard)) as executor:
+                futures = [
+                    [
+                        executor.submit(self._get_range_store, shard_data)
+                        for shard_data in batch_data
+                    ]
+                    for batch_data in requests_data
+                ]
+                stores = [[future.result() for future in batch] for batch in futures]
+            return stitch_stores(stores, path=path, limit=limit)
+
+        return self._get_range_store(requests_data[0][0], path=path)
+
+    def get_range_stream(
+        self,
+        dataset: Dataset | str,
+        start: pd.Timestamp | datetime | date | str | int,
+        end: pd.Timestamp | datetime | date | str | int | None = None,
+        symbols: Iterable[str | int] | str | int | None = None,
+        schema: Schema | str = "trades",
+        stype_in: SType | str = "raw_symbol",
+        stype_out: SType | str = "instrument_id",
+        limit: int | None = None,
+    ) -> DBNStream:
+        """
+        Request a historical time series data stream from Databento, which is
+        decoded while it downloads.
+
+        Makes a `POST /timeseries.get_range` HTTP request.
+
+        Unlike `get_range`, this method returns once the response starts, and
+        the records can be processed as they arrive in constant memory, either
+        by iterating over the `DBNStream` or with `DBNStream.iter_ndarray`.
+
+        Parameters
+        ----------
+        dataset : Dataset or str
+            The dataset code (string identifier) for the request.
+        start : pd.Timestamp, datetime, date, str, or int
+            The inclusive start of the request range.
+            Filters on `ts_recv` if it exists in the schema, otherwise `ts_event`.
+            Assumes UTC as timezone unless passed a tz-aware object.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+        end : pd.Timestamp, datetime, date, str, or int, optional
+            The exclusive end of the request range.
+            Filters on `ts_recv` if it exists in the schema, otherwise `ts_event`.
+            Assumes UTC as timezone unless passed a tz-aware object.
+            If an integer is passed, then this represents nanoseconds since the UNIX epoch.
+            Defaults to the forward filled value of `start` based on the resolution provided.
+        symbols : Iterable[str | int], or str, or int, optional
+            The instrument symbols to filter for. Takes up to 2,000 symbols per request.
+            If more than 1 symbol is specified, the data is merged and sorted by time.
+            If 'ALL_SYMBOLS' or `None` then will select **all** symbols.
+        schema : Schema or str {'mbo', 'mbp-1', 'mbp-10', 'trades', 'tbbo', 'ohlcv-1s', 'ohlcv-1m', 'ohlcv-1h', 'ohlcv-1d', 'definition', 'statistics', 'status'}, default 'trades'  # noqa
+            The data record schema for the request.
+        stype_in : SType or str, default 'raw_symbol'
+            The input symbology type to resolve from.
+        stype_out : SType or str, default 'instrument_id'
+            The output symbology type to resolve to.
+            Must be a valid symbology combination with `stype_in`.
+            See `symbology combinations`. https://www.databento.com/docs/standards-and-conventions/symbology#supported-symbology-combinations
+        limit : int, optional
+            The maximum number of records to return. If `None` then no limit.
+
+        Returns
+        -------
+        DBNStream
+
+        Notes
+        -----
+        The Databento Binary Encoding (DBN) will be streamed.
+        The connection is held until the stream is exhausted or closed.
+
+        Warnings
+        --------
+        Calling this method will incur a cost.
+
+        """
+        stype_in_valid = validate_enum(stype_in, SType, "stype_in")
+        symbols_list = optional_symbols_list_to_list(symbols, stype_in_valid)
+        schema_valid = validate_enum(schema, Schema, "schema")
+        start_valid = datetime_to_string(start)
+        end_valid = optional_datetime_to_string(end)
+        data: dict[str, object | None] = {
+            "dataset": validate_semantic_string(dataset, "dataset"),
+            "start": start_valid,
+            "symbols": ",".join(symbols_list),
+            "schema": str(schema_valid),
+            "stype_in": str(stype_in_valid),
+            "stype_out": str(validate_enum(stype_out, SType, "stype_out")),
+            "encoding": str(Encoding.DBN),  # Always request dbn
+            "compression": str(Compression.ZSTD),  # Always request zstd
+        }
+
+        # Optional Parameters
+        if limit is not None:
+            data["limit"] = str(limit)
+        if end is not None:
+            data["end"] = end_valid
+
+        return self._stream_records(
             url=self._base_url + ".get_range",
             data=data,
             basic_auth=True,
-            path=path,
         )
 
     async def get_range_async(
@@ -142,6 +293,8 @@ class TimeseriesHttpAPI(BentoHttpAPI):
         stype_out: SType | str = "instrument_id",
         limit: int | None = None,
         path: PathLike[str] | str | None = None,
+        parallel: int = 1,
+        shard: pd.Timedelta | timedelta | str | None = None,
     ) -> DBNStore:
         """
         Asynchronously request a historical time series data stream from
@@ -171,7 +324,8 @@ class TimeseriesHttpAPI(BentoHttpAPI):
             If an integer is passed, then this represents nanoseconds since the UNIX epoch.
             Defaults to the forward filled value of `start` based on the resolution provided.
         symbols : Iterable[str | int] or str or int, optional
-            The instrument symbols to filter for. Takes up to 2,000 symbols per request.
+            The instrument symbols to filter for. More than 2,000 symbols are split into
+            concurrent requests of up to 2,000 symbols each.
             If more than 1 symbol is specified, the data is merged and sorted by time.
             If 'ALL_SYMBOLS' or `None` then will select **all** symbols.
         schema : Schema or str {'mbo', 'mbp-1', 'mbp-10', 'trades', 'tbbo', 'ohlcv-1s', 'ohlcv-1m', 'ohlcv-1h', 'ohlcv-1d', 'definition', 'statistics', 'status'}, default 'trades'  # noqa
@@ -186,6 +340,15 @@ class TimeseriesHttpAPI(BentoHttpAPI):
             The maximum number of records to return. If `None` then no limit.
         path : PathLike[str] or str, optional
             The file path to stream the data to on disk (will then return a `DBNStore`).
+        parallel : int, default 1
+            The number of sub-ranges to download concurrently.
+            If greater than 1 and `shard` is `None`, the request range is split
+            into `parallel` sub-ranges of equal length. The sub-ranges of a
+            `shard` are downloaded one at a time unless greater than 1.
+        shard : pd.Timedelta, timedelta, or str, optional
+            The length of the sub-ranges to split the request range into, such
+            as '1h'. Sub-ranges are aligned to multiples of `shard` since the
+            UNIX epoch.
 
         Returns
         -------
@@ -194,6 +357,13 @@ class TimeseriesHttpAPI(BentoHttpAPI):
         Notes
         -----
         The Databento Binary Encoding (DBN) will be streamed.
+        When the request is sharded, the data of each sub-range is stitched in
+        order into one `DBNStore` with merged metadata. Sharding requires an
+        `end` and cannot be combined with a `limit`.
+        When the client has a `cache_dir`, responses are cached per sub-range,
+        so a request which overlaps a previous request on the same aligned
+        sub-ranges, such as a window extended by a day with `shard='1D'`, only
+        downloads the sub-ranges which are not cached.
 
         Warnings
         --------
@@ -224,9 +394,148 @@ class TimeseriesHttpAPI(BentoHttpAPI):
         if path is not None:
             path = validate_file_write_path(path, "path")
 
-        return await self._stream_async(
-            url=self._base_url + ".get_range",
-            data=data,
-            basic_auth=True,
-            path=path,
-        )
+        requests_data = self._split_data(data, symbols_list, start, end, limit, parallel, shard)
+        if len(requests_data) > 1 or len(requests_data[0]) > 1:
+            semaphore = asyncio.Semaphore(self._concurrency(parallel, shard))
+
+            async def stream_shard(shard_data: dict[str, object | None]) -> DBNStore:
+                async with semaphore:
+                    return await self._get_range_store_async(shard_data)
+
+            stores = await asyncio.gather(
+                *(asyncio.gather(*map(stream_shard, batch_data)) for batch_data in requests_data),
+            )
+            return stitch_stores(stores, path=path, limit=limit)
+
+        return await self._get_range_store_async(requests_data[0][0], path=path)
+
+    def _get_range_store(
+        self,
+        data: dict[str, object | None],
+        path: PathLike[str] | str | None = None,
+    ) -> DBNStore:
+        """
+        Request the data of a single request, from the cache if it is
+        enabled.
+        """
+        url = self._base_url + ".get_range"
+        key = self._cache_key(data)
+        if self._cache is None or key is None:
+            return self._stream(url=url, data=data, basic_auth=True, path=path)
+
+        store = _load_cached(self._cache, key, path)
+        if store is None:
+            with self._cache.write(key) as entry_path:
+                self._stream(url=url, data=data, basic_auth=True, path=entry_path)
+                store = _load_entry(entry_path, path)
+        return store
+
+    async def _get_range_store_async(
+        self,
+        data: dict[str, object | None],
+        path: PathLike[str] | str | None = None,
+    ) -> DBNStore:
+        """
+        Asynchronously request the data of a single request, from the cache
+        if it is enabled.
+        """
+        url = self._base_url + ".get_range"
+        key = self._cache_key(data)
+        if self._cache is None or key is None:
+            return await self._stream_async(url=url, data=data, basic_auth=True, path=path)
+
+        store = _load_cached(self._cache, key, path)
+        if store is None:
+            with self._cache.write(key) as entry_path:
+                await self._stream_async(url=url, data=data, basic_auth=True, path=entry_path)
+                store = _load_entry(entry_path, path)
+        return store
+
+    def _cache_key(self, data: dict[str, object | None]) -> str | None:
+        """
+        Return the cache key of a request, or `None` if its data could still
+        change because it ends in the future or has no end.
+        """
+        if self._cache is None or data.get("end") is None:
+            return None
+        end = datetime_to_unix_nanoseconds(str(data["end"]))
+        if end > pd.Timestamp.now(tz="UTC").value:
+            return None
+        return self._cache.key(self._base_url + ".get_range", data)
+
+    def _concurrency(
+        self,
+        parallel: int,
+        shard: pd.Timedelta | timedelta | str | None,
+    ) -> int:
+        """
+        Return the number of requests to make concurrently, which is
+        `parallel` for a request split by time and the pool size for a request
+        split only into batches of symbols.
+        """
+        if parallel == 1 and shard is None:
+            return self._session.pool_size
+        self._session.ensure_pool_size(parallel)
+        return parallel
+
+    def _split_data(
+        self,
+        data: dict[str, object | None],
+        symbols: list[str],
+        start: pd.Timestamp | datetime | date | str | int,
+        end: pd.Timestamp | datetime | date | str | int | None,
+        limit: int | None,
+        parallel: int,
+        shard: pd.Timedelta | timedelta | str | None,
+    ) -> list[list[dict[str, object | None]]]:
+        """
+        Split a request into the sub-ranges of each batch of symbols.
+        """
+        shards = [data]
+        if parallel != 1 or shard is not None:
+            if end is None:
+                raise ValueError("`end` must be specified to shard a request")
+            if limit is not None:
+                raise ValueError("`limit` cannot be specified to shard a request")
+
+            shards = [
+                {
+                    **data,
+                    "start": datetime_to_string(pd.Timestamp(shard_start, tz="UTC")),
+                    "end": datetime_to_string(pd.Timestamp(shard_end, tz="UTC")),
+                }
+                for shard_start, shard_end in shard_range(
+                    datetime_to_unix_nanoseconds(start),
+                    datetime_to_unix_nanoseconds(end),
+                    parallel=parallel,
+                    shard=shard,
+                )
+            ]
+
+        return [
+            [{**shard_data, "symbols": batch} for shard_data in shards]
+            for batch in batch_symbols(symbols)
+        ]
+
+
+def _load_cached(
+    cache: DBNCache,
+    key: str,
+    path: PathLike[str] | str | None,
+) -> DBNStore | None:
+    # The entry is read or copied under the lock of the cache, so it cannot be
+    # evicted in the meantime, and the store remains usable after eviction
+    if path is None:
+        data = cache.read(key)
+        return None if data is None else DBNStore.from_bytes(data)
+    if not cache.copy(key, path):
+        return None
+    return DBNStore.from_file(path)
+
+
+def _load_entry(entry_path: Path, path: PathLike[str] | str | None) -> DBNStore:
+    # A new entry is read or copied before it is added to the cache
+    if path is None:
+        return DBNStore.from_bytes(entry_path.read_bytes())
+    shutil.copyfile(entry_path, path)
+    return DBNStore.from_file(path)
@@ -2,8 +2,13 @@ from __future__ import annotations
 
 import logging
 import os
+from os import PathLike
 
+from databento.common.cache import CACHE_MAX_SIZE
+from databento.common.cache import DBNCache
 from databento.common.enums import HistoricalGateway
+from databento.common.http import HTTP_POOL_SIZE
+from databento.common.http import BentoHttpSession
 from databento.common.validation import validate_gateway
 from databento.historical.api.batch import BatchHttpAPI
 from databento.historical.api.metadata import MetadataHttpAPI
@@ -27,6 +32,16 @@ class Historical:
     gateway : HistoricalGateway or str, default HistoricalGateway.BO1
         The API server gateway.
         If `None` then the default gateway is used.
+    pool_size : int, default 10
+        The maximum number of idle HTTP connections kept alive to each host,
+        which are shared by every request of the client.
+    cache_dir : PathLike[str] or str, optional
+        The directory to cache the responses of `timeseries.get_range` in.
+        Identical requests which have ended are then read from the cache
+        instead of being downloaded again. If `None`, responses are not cached.
+    cache_size : int, default 8 GiB
+        The maximum size of the cache in bytes, beyond which the least
+        recently used responses are evicted.
 
     Examples
     --------
@@ -39,6 +54,9 @@ class Historical:
         self,
         key: str | None = None,
         gateway: HistoricalGateway | str = HistoricalGateway.BO1,
+        pool_size: int = HTTP_POOL_SIZE,
+        cache_dir: PathLike[str] | str | None = None,
+        cache_size: int = CACHE_MAX_SIZE,
     ):
         if key is None:
             key = os.environ.get("DATABENTO_API_KEY")
@@ -52,15 +70,39 @@ class Historical:
 
         self._key = key
         self._gateway = gateway
-
-        self.batch = BatchHttpAPI(key=key, gateway=gateway)
-        self.metadata = MetadataHttpAPI(key=key, gateway=gateway)
-        self.symbology = SymbologyHttpAPI(key=key, gateway=gateway)
-        self.timeseries = TimeseriesHttpAPI(key=key, gateway=gateway)
+        self._session = BentoHttpSession(pool_size=pool_size)
+
+        self.batch = BatchHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+        )
+        self.metadata = MetadataHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+        )
+        self.symbology = SymbologyHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+        )
+        self.timeseries = TimeseriesHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+            cache=None if cache_dir is None else DBNCache(cache_dir, max_size=cache_size),
+        )
 
         # Not logging security sensitive `key`
         logger.info("Initialized %s(gateway=%s)", type(self).__name__, self.gateway)
 
+    def __enter__(self) -> Historical:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
     @property
     def key(self) -> str:
         """
@@ -84,3 +126,22 @@ class Historical:
 
         """
         return self._gateway
+
+    def close(self) -> None:
+        """
+        Close the HTTP connections of the client.
+
+        The client remains usable and reconnects on the next request.
+
+        """
+        self._session.close()
+
+    async def aclose(self) -> None:
+        """
+        Close the HTTP connections of the client, waiting for the connections
+        of asynchronous requests in the running event loop to close.
+
+        The client remains usable and reconnects on the next request.
+
+        """
+        await self._session.aclose()
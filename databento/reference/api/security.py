@@ -12,6 +12,7 @@ from databento.common import API_VERSION
 from databento.common.constants import SECURITY_MASTER_DATE_COLUMNS
 from databento.common.constants import SECURITY_MASTER_DATETIME_COLUMNS
 from databento.common.http import BentoHttpAPI
+from databento.common.http import BentoHttpSession
 from databento.common.parsing import convert_date_columns
 from databento.common.parsing import convert_datetime_columns
 from databento.common.parsing import convert_jsonl_to_df
@@ -26,8 +27,13 @@ class SecurityMasterHttpAPI(BentoHttpAPI):
     Provides request methods for the security master HTTP API endpoints.
     """
 
-    def __init__(self, key: str, gateway: str) -> None:
-        super().__init__(key=key, gateway=gateway)
+    def __init__(
+        self,
+        key: str,
+        gateway: str,
+        session: BentoHttpSession | None = None,
+    ) -> None:
+        super().__init__(key=key, gateway=gateway, session=session)
         self._base_url = gateway + f"/v{API_VERSION}/security_master"
 
     def get_range(
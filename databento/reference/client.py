@@ -4,6 +4,8 @@ import logging
 import os
 
 from databento.common.enums import HistoricalGateway
+from databento.common.http import HTTP_POOL_SIZE
+from databento.common.http import BentoHttpSession
 from databento.common.validation import validate_gateway
 from databento.reference.api.adjustment import AdjustmentFactorsHttpAPI
 from databento.reference.api.corporate import CorporateActionsHttpAPI
@@ -26,6 +28,9 @@ class Reference:
     gateway : HistoricalGateway or str, default HistoricalGateway.BO1
         The API server gateway.
         If `None` then the default gateway is used.
+    pool_size : int, default 10
+        The maximum number of idle HTTP connections kept alive to each host,
+        which are shared by every request of the client.
 
     Examples
     --------
@@ -38,6 +43,7 @@ class Reference:
         self,
         key: str | None = None,
         gateway: HistoricalGateway | str = HistoricalGateway.BO1,
+        pool_size: int = HTTP_POOL_SIZE,
     ):
         if key is None:
             key = os.environ.get("DATABENTO_API_KEY")
@@ -51,14 +57,33 @@ class Reference:
 
         self._key = key
         self._gateway = gateway
-
-        self.adjustment_factors = AdjustmentFactorsHttpAPI(key=key, gateway=gateway)
-        self.corporate_actions = CorporateActionsHttpAPI(key=key, gateway=gateway)
-        self.security_master = SecurityMasterHttpAPI(key=key, gateway=gateway)
+        self._session = BentoHttpSession(pool_size=pool_size)
+
+        self.adjustment_factors = AdjustmentFactorsHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+        )
+        self.corporate_actions = CorporateActionsHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+        )
+        self.security_master = SecurityMasterHttpAPI(
+            key=key,
+            gateway=gateway,
+            session=self._session,
+        )
 
         # Not logging security sensitive `key`
         logger.info("Initialized %s(gateway=%s)", type(self).__name__, self.gateway)
 
+    def __enter__(self) -> Reference:
+        return self
+
+    def __exit__(self, *args: object) -> None:
+        self.close()
+
     @property
     def key(self) -> str:
         """
@@ -82,3 +107,12 @@ class Reference:
 
         """
         return self._gateway
+
+    def close(self) -> None:
+        """
+        Close the HTTP connections of the client.
+
+        The client remains usable and reconnects on the next request.
+
+        """
+        self._session.close()
@@ -5,6 +5,7 @@ import pytest
 from databento_dbn import Schema
 
 from databento.common.dbnstore import FileDataSource
+from databento.common.dbnstore import MemoryMappedDataSource
 from databento.common.dbnstore import MemoryDataSource
 from databento.common.publishers import Dataset
 
@@ -65,3 +66,59 @@ def test_file_data_source(
     # Assert
     assert path.stat().st_size == data_source.nbytes
     assert path.name == data_source.name
+
+
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        Dataset.GLBX_MDP3,
+        Dataset.XNAS_ITCH,
+        Dataset.OPRA_PILLAR,
+        Dataset.EQUS_MINI,
+        Dataset.IFEU_IMPACT,
+        Dataset.NDEX_IMPACT,
+    ],
+)
+@pytest.mark.parametrize("schema", [pytest.param(x) for x in Schema.variants()])
+def test_memory_mapped_data_source(
+    test_data_path: Callable[[Dataset, Schema], pathlib.Path],
+    dataset: Dataset,
+    schema: Schema,
+) -> None:
+    """
+    Test create of MemoryMappedDataSource.
+    """
+    # Arrange, Act
+    path = test_data_path(dataset, schema)
+    data_source = MemoryMappedDataSource(path)
+
+    # Assert
+    assert path.stat().st_size == data_source.nbytes
+    assert path.name == data_source.name
+    assert path.read_bytes() == data_source.reader.read()
+    assert data_source.buffer.readonly
+
+
+def test_memory_mapped_data_source_readers(
+    test_data_path: Callable[[Dataset, Schema], pathlib.Path],
+) -> None:
+    """
+    Test that each MemoryMappedDataSource reader has its own position, and
+    that readers remain usable after the source is closed.
+    """
+    # Arrange
+    path = test_data_path(Dataset.GLBX_MDP3, Schema.MBO)
+    data_source = MemoryMappedDataSource(path)
+    first = data_source.reader
+    second = data_source.reader
+
+    # Act
+    head = first.read(8)
+    data_source.close()
+
+    # Assert
+    assert first is not second
+    assert second.read(8) == head
+    assert first.read() == path.read_bytes()[8:]
+    with pytest.raises(ValueError):
+        data_source.buffer
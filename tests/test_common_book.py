@@ -0,0 +1,362 @@
+"""
+Unit tests for MBO order book reconstruction.
+"""
+
+from __future__ import annotations
+
+import collections
+from collections.abc import Callable
+from pathlib import Path
+
+import numpy as np
+import pytest
+import zstandard
+from databento_dbn import UNDEF_PRICE
+from databento_dbn import Action
+from databento_dbn import MBOMsg
+from databento_dbn import Schema
+from databento_dbn import Side
+
+import databento
+import databento.common.book
+from databento.common.book import Market
+from databento.common.book import Order
+from databento.common.book import OrderBook
+from databento.common.book import PriceLevel
+from databento.common.dbnstore import DBNStore
+from databento.common.enums import RecordFlags
+from databento.common.publishers import Dataset
+
+
+def create_mbo_msg(
+    action: Action,
+    side: Side,
+    order_id: int,
+    price: int,
+    size: int,
+    instrument_id: int = 1,
+    ts_recv: int = 0,
+    flags: int = 0,
+    publisher_id: int = 1,
+) -> MBOMsg:
+    return MBOMsg(
+        publisher_id=publisher_id,
+        instrument_id=instrument_id,
+        ts_event=ts_recv,
+        order_id=order_id,
+        price=price,
+        size=size,
+        action=action,
+        side=side,
+        ts_recv=ts_recv,
+        flags=flags,
+    )
+
+
+@pytest.fixture(name="mbo_records")
+def fixture_mbo_records(
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> tuple[bytes, np.ndarray]:
+    """
+    Fixture for DBN metadata and a random sequence of valid MBO records for
+    three instruments.
+    """
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    rng = np.random.default_rng(seed=42)
+    orders: dict[int, tuple[int, bytes, int, int]] = {}
+    rows = []
+    for order_id in range(2000):
+        roll = rng.random()
+        if orders and roll < 0.3:
+            key = list(orders)[rng.integers(len(orders))]
+            instrument_id, side, price, size = orders[key]
+            cancel_size = int(rng.integers(1, size + 1))
+            rows.append((instrument_id, b"C", side, key, price, cancel_size))
+            if cancel_size == size:
+                del orders[key]
+            else:
+                orders[key] = (instrument_id, side, price, size - cancel_size)
+        elif orders and roll < 0.5:
+            key = list(orders)[rng.integers(len(orders))]
+            instrument_id, side, _, _ = orders[key]
+            price, size = int(rng.integers(90, 110)), int(rng.integers(1, 10))
+            rows.append((instrument_id, b"M", side, key, price, size))
+            orders[key] = (instrument_id, side, price, size)
+        elif roll < 0.55:
+            rows.append((int(rng.integers(3)), b"T", b"N", 0, int(rng.integers(90, 110)), 1))
+        else:
+            instrument_id = int(rng.integers(3))
+            side = b"B" if rng.random() < 0.5 else b"A"
+            price, size = int(rng.integers(90, 110)), int(rng.integers(1, 10))
+            rows.append((instrument_id, b"A", side, order_id, price, size))
+            orders[order_id] = (instrument_id, side, price, size)
+
+    records = np.resize(stub_store.to_ndarray(), len(rows))
+    records["instrument_id"] = [row[0] for row in rows]
+    records["action"] = [row[1] for row in rows]
+    records["side"] = [row[2] for row in rows]
+    records["order_id"] = [row[3] for row in rows]
+    records["price"] = [row[4] * databento.FIXED_PRICE_SCALE for row in rows]
+    records["size"] = [row[5] for row in rows]
+    records["flags"] = 0
+    records["ts_recv"] = stub_store.metadata.start + np.arange(len(rows)) * 1000
+    records["ts_event"] = records["ts_recv"]
+    records["sequence"] = np.arange(len(rows))
+    return dbn_stub_data[: stub_store._metadata_length], records
+
+
+def reference_levels(
+    records: np.ndarray,
+    instrument_id: int,
+) -> dict[bytes, list[tuple[int, int, int]]]:
+    """
+    Return the price levels of an instrument after applying records to a
+    dict of orders.
+    """
+    orders: dict[int, tuple[bytes, int, int]] = {}
+    for record in records[records["instrument_id"] == instrument_id]:
+        action, order_id = record["action"], int(record["order_id"])
+        if action == b"A" or action == b"M":
+            orders[order_id] = (record["side"], int(record["price"]), int(record["size"]))
+        elif action == b"C":
+            side, price, size = orders[order_id]
+            if size > record["size"]:
+                orders[order_id] = (side, price, size - int(record["size"]))
+            else:
+                del orders[order_id]
+
+    levels: dict[bytes, dict[int, list[int]]] = {
+        b"B": collections.defaultdict(lambda: [0, 0]),
+        b"A": collections.defaultdict(lambda: [0, 0]),
+    }
+    for side, price, size in orders.values():
+        levels[side][price][0] += size
+        levels[side][price][1] += 1
+    return {
+        side: sorted(
+            ((price, size, count) for price, (size, count) in side_levels.items()),
+            reverse=side == b"B",
+        )
+        for side, side_levels in levels.items()
+    }
+
+
+def test_order_book_add_cancel_modify() -> None:
+    """
+    Test that adds, partial and full cancels, and modifies update the
+    aggregated levels.
+    """
+    # Arrange
+    book = OrderBook()
+
+    # Act
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 1, 100, 5))
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 2, 100, 3))
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 3, 99, 1))
+    book.apply(create_mbo_msg(Action.ADD, Side.ASK, 4, 101, 2))
+    book.apply(create_mbo_msg(Action.CANCEL, Side.BID, 1, 100, 2))
+    book.apply(create_mbo_msg(Action.CANCEL, Side.BID, 3, 99, 1))
+    book.apply(create_mbo_msg(Action.MODIFY, Side.ASK, 4, 102, 7))
+    book.apply(create_mbo_msg(Action.TRADE, Side.NONE, 0, 100, 1))
+
+    # Assert
+    assert len(book) == 3
+    assert book.get_order(1) == Order(1, "B", 100, 3)
+    assert book.get_order(3) is None
+    assert book.bbo() == (PriceLevel(100, 6, 2), PriceLevel(102, 7, 1))
+    assert book.levels(Side.BID).tolist() == [(100, 6, 2)]
+    assert book.levels("A").tolist() == [(102, 7, 1)]
+
+
+def test_order_book_clear_and_top_of_book() -> None:
+    """
+    Test that a clear action empties the book and that top-of-book records
+    replace the levels of their side.
+    """
+    # Arrange
+    book = OrderBook()
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 1, 100, 5))
+    book.apply(create_mbo_msg(Action.ADD, Side.ASK, 2, 101, 5))
+
+    # Act
+    book.apply(create_mbo_msg(Action.CLEAR, Side.NONE, 0, UNDEF_PRICE, 0))
+    cleared = book.bbo()
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 0, 98, 4, flags=RecordFlags.F_TOB))
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 0, 99, 3, flags=RecordFlags.F_TOB))
+
+    # Assert
+    assert cleared == (None, None)
+    assert len(book) == 0
+    assert book.bbo() == (PriceLevel(99, 3, 1), None)
+
+
+def test_order_book_snapshot() -> None:
+    """
+    Test that a snapshot has the MBP level layout with undefined levels
+    beyond the depth of the book.
+    """
+    # Arrange
+    book = OrderBook()
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 1, 100, 5))
+    book.apply(create_mbo_msg(Action.ADD, Side.BID, 2, 99, 3))
+    book.apply(create_mbo_msg(Action.ADD, Side.ASK, 3, 101, 2))
+
+    # Act
+    snapshot = book.snapshot(depth=3)
+
+    # Assert
+    assert snapshot.tolist() == [
+        (100, 101, 5, 2, 1, 1),
+        (99, UNDEF_PRICE, 3, 0, 1, 0),
+        (UNDEF_PRICE, UNDEF_PRICE, 0, 0, 0, 0),
+    ]
+
+
+def test_order_book_levels_invalid_side() -> None:
+    """
+    Test that requesting the levels of an invalid side raises a ValueError.
+    """
+    # Arrange
+    book = OrderBook()
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        book.levels(Side.NONE)
+
+
+def test_market_apply_ndarray(
+    mbo_records: tuple[bytes, np.ndarray],
+) -> None:
+    """
+    Test that the books built from an array of records match a reference
+    book and the books built from each `MBOMsg`.
+    """
+    # Arrange
+    metadata, records = mbo_records
+    dbnstore = DBNStore.from_bytes(metadata + records.tobytes())
+    market = Market()
+    record_market = Market()
+
+    # Act
+    market.apply_ndarray(records)
+    for record in dbnstore:
+        record_market.apply(record)
+
+    # Assert
+    assert sorted(instrument_id for instrument_id, _ in market) == [0, 1, 2]
+    for key in market:
+        expected = reference_levels(records, key[0])
+        for side in (b"B", b"A"):
+            assert market[key].levels(side.decode()).tolist() == expected[side]
+            assert record_market[key].levels(side.decode()).tolist() == expected[side]
+    assert np.array_equal(market.snapshot(), record_market.snapshot())
+
+
+@pytest.mark.parametrize(
+    "chunk_size",
+    [
+        1,
+        7,
+        10000,
+    ],
+)
+def test_market_snapshots(
+    monkeypatch: pytest.MonkeyPatch,
+    mbo_records: tuple[bytes, np.ndarray],
+    chunk_size: int,
+) -> None:
+    """
+    Test that a snapshot is yielded at every interval boundary, reflecting
+    every record before it.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.book, "BOOK_CHUNK_SIZE", chunk_size)
+    metadata, records = mbo_records
+    dbnstore = DBNStore.from_bytes(metadata + records.tobytes())
+    interval = 150_000
+    start = int(records["ts_recv"][0])
+
+    # Act
+    snapshots = list(Market().snapshots(dbnstore, interval, depth=5))
+
+    # Assert
+    boundaries = [snapshot["ts_recv"][0] for snapshot in snapshots]
+    assert boundaries == list(
+        range(
+            start - start % interval + interval,
+            int(records["ts_recv"][-1]) + interval + 1,
+            interval,
+        ),
+    )
+    for snapshot in snapshots[::10]:
+        market = Market()
+        market.apply_ndarray(records[records["ts_recv"] < snapshot["ts_recv"][0]])
+        expected = market.snapshot(depth=5)
+        expected["ts_recv"] = snapshot["ts_recv"][0]
+        assert np.array_equal(snapshot, expected)
+    assert np.array_equal(
+        list(Market().snapshots(iter(dbnstore), interval, depth=5))[-1],
+        snapshots[-1],
+    )
+
+
+def test_market_ignores_other_records(
+    live_test_data_path: Path,
+) -> None:
+    """
+    Test that applying mixed records only builds books from MBO records.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(live_test_data_path)
+    market = Market()
+
+    # Act
+    for record in dbnstore:
+        market.apply(record)
+
+    # Assert
+    mbo_records = dbnstore.to_ndarray(Schema.MBO)
+    assert set(market) == set(
+        zip(mbo_records["instrument_id"].tolist(), mbo_records["publisher_id"].tolist()),
+    )
+
+
+def test_market_books_by_publisher() -> None:
+    """
+    Test that the same instrument has a separate book for each publisher.
+    """
+    # Arrange
+    records = [
+        create_mbo_msg(Action.ADD, Side.BID, 1, 100, 5, publisher_id=1),
+        create_mbo_msg(Action.ADD, Side.BID, 1, 99, 3, publisher_id=2),
+        create_mbo_msg(Action.CANCEL, Side.BID, 1, 100, 5, publisher_id=1),
+    ]
+    market = Market()
+
+    # Act
+    for record in records:
+        market.apply(record)
+
+    # Assert
+    assert sorted(market) == [(1, 1), (1, 2)]
+    assert market[(1, 1)].bbo() == (None, None)
+    assert market[(1, 2)].bbo() == (PriceLevel(99, 3, 1), None)
+    assert market.snapshot(depth=1)[["publisher_id", "bid_px_00"]].tolist() == [
+        (1, UNDEF_PRICE),
+        (2, 99),
+    ]
+
+
+def test_market_snapshots_invalid_interval() -> None:
+    """
+    Test that a non-positive interval raises a ValueError.
+    """
+    # Arrange
+    market = Market()
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        next(market.snapshots([], 0))
@@ -0,0 +1,166 @@
+"""
+Unit tests for the cache of DBN responses.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+
+import pytest
+
+from databento.common.cache import DBNCache
+
+
+URL = "https://hist.databento.com/v0/timeseries.get_range"
+
+
+@pytest.mark.parametrize(
+    "data, other, expected",
+    [
+        [
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28", "end": "2020-12-29"},
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28T00:00:00+00:00", "end": "2020-12-29"},
+            True,
+        ],
+        [
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28", "limit": None},
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28"},
+            True,
+        ],
+        [
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28", "symbols": "ESH1"},
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28", "symbols": "NQH1"},
+            False,
+        ],
+        [
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28", "end": "2020-12-29"},
+            {"dataset": "GLBX.MDP3", "start": "2020-12-28", "end": "2020-12-30"},
+            False,
+        ],
+    ],
+)
+def test_cache_key(
+    data: dict[str, object | None],
+    other: dict[str, object | None],
+    expected: bool,
+) -> None:
+    """
+    Test that requests share a key only if they request the same data.
+    """
+    # Arrange, Act, Assert
+    assert (DBNCache.key(URL, data) == DBNCache.key(URL, other)) is expected
+
+
+def test_cache_write_and_get(tmp_path: pathlib.Path) -> None:
+    """
+    Test that a written entry can be read, and that an entry whose write
+    fails is not cached.
+    """
+    # Arrange
+    cache = DBNCache(tmp_path / "cache")
+
+    # Act
+    with cache.write("a") as path:
+        path.write_bytes(b"data")
+    with pytest.raises(RuntimeError):
+        with cache.write("b") as path:
+            path.write_bytes(b"partial")
+            raise RuntimeError
+
+    # Assert
+    entry = cache.get("a")
+    assert entry is not None
+    assert entry.read_bytes() == b"data"
+    assert cache.get("b") is None
+    assert sorted(p.name for p in cache.directory.iterdir()) == [entry.name]
+
+
+def test_cache_read_and_copy(tmp_path: pathlib.Path) -> None:
+    """
+    Test that the contents of an entry can be read or copied, and that
+    missing entries are neither read nor copied.
+    """
+    # Arrange
+    cache = DBNCache(tmp_path / "cache")
+    with cache.write("a") as path:
+        path.write_bytes(b"data")
+
+    # Act
+    data = cache.read("a")
+    copied = cache.copy("a", tmp_path / "a.dbn.zst")
+    missing_data = cache.read("b")
+    missing_copied = cache.copy("b", tmp_path / "b.dbn.zst")
+
+    # Assert
+    assert data == b"data"
+    assert copied
+    assert (tmp_path / "a.dbn.zst").read_bytes() == b"data"
+    assert missing_data is None
+    assert not missing_copied
+    assert not (tmp_path / "b.dbn.zst").exists()
+
+
+def test_cache_evicts_least_recently_used(tmp_path: pathlib.Path) -> None:
+    """
+    Test that the least recently used entries are evicted once the entries
+    exceed the maximum size.
+    """
+    # Arrange
+    cache = DBNCache(tmp_path, max_size=25)
+    for i, key in enumerate(("a", "b")):
+        with cache.write(key) as path:
+            path.write_bytes(b"0" * 10)
+        os.utime(cache.path(key), ns=(i, i))
+    cache.get("a")
+
+    # Act
+    with cache.write("c") as path:
+        path.write_bytes(b"0" * 10)
+
+    # Assert
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+    assert cache.size == 20
+
+
+def test_cache_keeps_new_entry_larger_than_max_size(tmp_path: pathlib.Path) -> None:
+    """
+    Test that a new entry is kept even if it alone exceeds the maximum size.
+    """
+    # Arrange
+    cache = DBNCache(tmp_path, max_size=5)
+
+    # Act
+    with cache.write("a") as path:
+        path.write_bytes(b"0" * 10)
+
+    # Assert
+    assert cache.get("a") is not None
+
+
+def test_cache_clear(tmp_path: pathlib.Path) -> None:
+    """
+    Test that clearing the cache removes every entry.
+    """
+    # Arrange
+    cache = DBNCache(tmp_path)
+    with cache.write("a") as path:
+        path.write_bytes(b"data")
+
+    # Act
+    cache.clear()
+
+    # Assert
+    assert cache.get("a") is None
+    assert cache.size == 0
+
+
+def test_cache_invalid_max_size(tmp_path: pathlib.Path) -> None:
+    """
+    Test that a non-positive `max_size` raises a ValueError.
+    """
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        DBNCache(tmp_path, max_size=0)
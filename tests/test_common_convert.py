@@ -0,0 +1,200 @@
+"""
+Unit tests for bulk DBN file conversion.
+"""
+
+from __future__ import annotations
+
+import json
+import shutil
+from collections.abc import Callable
+from pathlib import Path
+
+import pandas as pd
+import pytest
+from databento_dbn import Schema
+
+import databento
+from databento.common.convert import ConversionResult
+from databento.common.dbnstore import DBNStore
+from databento.common.publishers import Dataset
+from tests.test_common_symbology import create_symbology_response
+
+
+@pytest.fixture(name="convert_paths")
+def fixture_convert_paths(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    tmp_path: Path,
+) -> list[Path]:
+    """
+    Fixture for copies of stub DBN files in a temporary directory.
+    """
+    paths = []
+    for schema in (Schema.MBO, Schema.TRADES, Schema.OHLCV_1M):
+        path = tmp_path / test_data_path(Dataset.GLBX_MDP3, schema).name
+        shutil.copy(test_data_path(Dataset.GLBX_MDP3, schema), path)
+        paths.append(path)
+    return paths
+
+
+@pytest.mark.parametrize(
+    "workers",
+    [
+        1,
+        2,
+    ],
+)
+def test_convert_many_parquet(
+    convert_paths: list[Path],
+    tmp_path: Path,
+    workers: int,
+) -> None:
+    """
+    Test that each DBN file is converted to a parquet file.
+    """
+    # Arrange, Act
+    results = databento.convert_many(
+        convert_paths,
+        out_dir=tmp_path / "out",
+        workers=workers,
+    )
+
+    # Assert
+    assert [result.path for result in results] == convert_paths
+    for path, result in zip(convert_paths, results):
+        assert isinstance(result, ConversionResult)
+        assert result.out_path == tmp_path / "out" / path.name.replace(".dbn.zst", ".parquet")
+        assert result.nbytes == path.stat().st_size
+        assert result.throughput > 0
+        pd.testing.assert_frame_equal(
+            pd.read_parquet(result.out_path),
+            DBNStore.from_file(path).to_df(),
+        )
+
+
+@pytest.mark.parametrize(
+    "fmt",
+    [
+        "csv",
+        "json",
+    ],
+)
+def test_convert_many_text(
+    convert_paths: list[Path],
+    fmt: str,
+) -> None:
+    """
+    Test that each DBN file is converted next to the input file and that
+    keyword arguments are passed through.
+    """
+    # Arrange, Act
+    results = databento.convert_many(convert_paths, fmt=fmt, workers=2, map_symbols=False)
+
+    # Assert
+    for path, result in zip(convert_paths, results):
+        expected = path.with_name(path.name.replace(".dbn.zst", f".{fmt}"))
+        assert result.out_path == expected
+        assert "symbol" not in expected.read_text().splitlines()[0]
+
+
+def test_convert_many_symbology_file(
+    monkeypatch: pytest.MonkeyPatch,
+    convert_paths: list[Path],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the mappings of a `symbology.json` file are given to every file.
+    """
+    # Arrange
+    stores = [DBNStore.from_file(path) for path in convert_paths]
+    start_date = min(store.start for store in stores).date()
+    end_date = (max(store.end for store in stores) + pd.Timedelta(days=1)).date()
+    symbology_file = tmp_path / "symbology.json"
+    symbology_file.write_text(
+        json.dumps(
+            create_symbology_response(
+                result={
+                    "TEST": [
+                        {"d0": start_date.isoformat(), "d1": end_date.isoformat(), "s": "1234"},
+                    ],
+                },
+                symbols=["TEST"],
+                start_date=start_date,
+                end_date=end_date,
+            ),
+        ),
+    )
+
+    resolved = []
+
+    def to_parquet(self: DBNStore, *args: object, **kwargs: object) -> None:
+        resolved.append(self._instrument_map.resolve(1234, start_date))
+        self._instrument_map.insert_metadata(self.metadata)
+
+    monkeypatch.setattr(DBNStore, "to_parquet", to_parquet)
+
+    # Act
+    databento.convert_many(
+        convert_paths,
+        symbology_file=symbology_file,
+        workers=1,
+    )
+
+    # Assert
+    assert resolved == ["TEST"] * len(convert_paths)
+
+
+def test_convert_many_invalid_fmt(
+    convert_paths: list[Path],
+) -> None:
+    """
+    Test that an invalid format raises a ValueError.
+    """
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        databento.convert_many(convert_paths, fmt="xlsx")
+
+
+def test_convert_many_missing_file(
+    tmp_path: Path,
+) -> None:
+    """
+    Test that a non-existent file raises a FileNotFoundError.
+    """
+    # Arrange, Act, Assert
+    with pytest.raises(FileNotFoundError):
+        databento.convert_many([tmp_path / "missing.dbn.zst"])
+
+
+def test_convert_many_duplicate_out_path(
+    convert_paths: list[Path],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that files which would be converted to the same path raise a
+    ValueError.
+    """
+    # Arrange
+    other_dir = tmp_path / "other"
+    other_dir.mkdir()
+    other_path = other_dir / convert_paths[0].name
+    shutil.copy(convert_paths[0], other_path)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        databento.convert_many([convert_paths[0], other_path], out_dir=tmp_path / "out")
+
+
+def test_convert_many_out_path_is_dir(
+    convert_paths: list[Path],
+) -> None:
+    """
+    Test that a file which would be converted to the path of a directory
+    raises an IsADirectoryError naming the `paths` parameter.
+    """
+    # Arrange
+    name = convert_paths[0].name.removesuffix(".dbn.zst")
+    (convert_paths[0].parent / f"{name}.parquet").mkdir()
+
+    # Act, Assert
+    with pytest.raises(IsADirectoryError, match="`paths`"):
+        databento.convert_many(convert_paths)
@@ -0,0 +1,230 @@
+"""
+Unit tests for joining DBN records as of their timestamps.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+import pytest
+import zstandard
+from databento_dbn import UNDEF_PRICE
+from databento_dbn import UNDEF_TIMESTAMP
+from databento_dbn import Schema
+
+import databento
+import databento.common.join
+from databento.common.dbnstore import DBNStore
+from databento.common.publishers import Dataset
+
+
+def create_store(
+    test_data: Callable[[Dataset, Schema], bytes],
+    schema: Schema,
+    ts_recv: np.ndarray,
+    instrument_id: np.ndarray,
+) -> DBNStore:
+    """
+    Create a store of the stub records of a schema with the given
+    timestamps and instrument IDs.
+    """
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, schema)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    records = np.resize(stub_store.to_ndarray(), len(ts_recv))
+    records["ts_recv"] = ts_recv
+    records["ts_event"] = ts_recv
+    records["instrument_id"] = instrument_id
+    records["sequence"] = np.arange(len(ts_recv))
+    return DBNStore.from_bytes(dbn_stub_data[: stub_store._metadata_length] + records.tobytes())
+
+
+@pytest.fixture(name="trades_quotes")
+def fixture_trades_quotes(
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> tuple[DBNStore, DBNStore]:
+    """
+    Fixture for stores of random trades and quotes of three instruments,
+    with some timestamps shared between them.
+    """
+    rng = np.random.default_rng(seed=42)
+    start = 1_700_000_000_000_000_000
+    trades = create_store(
+        test_data,
+        Schema.TRADES,
+        start + np.sort(rng.integers(0, 2000, 500)) * 1000,
+        rng.integers(0, 3, 500),
+    )
+    quotes = create_store(
+        test_data,
+        Schema.MBP_1,
+        start + np.sort(rng.integers(100, 2000, 1500)) * 1000,
+        rng.integers(0, 3, 1500),
+    )
+    return trades, quotes
+
+
+def reference_asof_join(
+    trades: DBNStore,
+    quotes: DBNStore,
+    **kwargs: object,
+) -> pd.DataFrame:
+    """
+    Return the join of trades and quotes with `pd.merge_asof`.
+    """
+    left = pd.DataFrame(trades.to_ndarray())
+    right = pd.DataFrame(quotes.to_ndarray()).drop(columns=["length", "rtype"])
+    right["_row"] = np.arange(len(right))
+    right = right.sort_values(["ts_recv", "_row"], kind="stable")
+    return pd.merge_asof(
+        left,
+        right,
+        on="ts_recv",
+        by="instrument_id",
+        suffixes=("", "_right"),
+        **kwargs,
+    )
+
+
+@pytest.mark.parametrize(
+    "chunk_size",
+    [
+        1,
+        7,
+        10000,
+    ],
+)
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        13,
+    ],
+)
+def test_asof_join(
+    monkeypatch: pytest.MonkeyPatch,
+    trades_quotes: tuple[DBNStore, DBNStore],
+    chunk_size: int,
+    count: int | None,
+) -> None:
+    """
+    Test that each trade is joined with the prevailing quote of its
+    instrument, as with `pd.merge_asof`.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.join, "JOIN_CHUNK_SIZE", chunk_size)
+    trades, quotes = trades_quotes
+
+    # Act
+    joined = databento.asof_join(trades, quotes, count=count)
+    if count is not None:
+        chunks = list(joined)
+        assert all(len(chunk) <= count for chunk in chunks)
+        joined = np.concatenate(chunks)
+
+    # Assert
+    expected = reference_asof_join(trades, quotes)
+    assert len(joined) == len(expected)
+    is_matched = expected["ts_event_right"].notna().to_numpy()
+    assert not is_matched.all()
+    for name in ("ts_recv", "price", "size", "bid_px_00", "ask_sz_00", "sequence_right"):
+        assert np.array_equal(
+            joined[name][is_matched],
+            expected[name][is_matched].astype(joined.dtype[name]),
+        )
+    assert (joined["bid_px_00"][~is_matched] == UNDEF_PRICE).all()
+    assert (joined["ts_event_right"][~is_matched] == UNDEF_TIMESTAMP).all()
+    assert (joined["ask_sz_00"][~is_matched] == 0).all()
+
+
+@pytest.mark.parametrize(
+    "allow_exact_matches",
+    [
+        True,
+        False,
+    ],
+)
+def test_asof_join_tolerance(
+    monkeypatch: pytest.MonkeyPatch,
+    trades_quotes: tuple[DBNStore, DBNStore],
+    allow_exact_matches: bool,
+) -> None:
+    """
+    Test that quotes beyond the tolerance and, if exact matches are not
+    allowed, quotes at the time of the trade are not joined.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.join, "JOIN_CHUNK_SIZE", 50)
+    trades, quotes = trades_quotes
+
+    # Act
+    joined = databento.asof_join(
+        trades,
+        quotes,
+        right_columns=["sequence", "bid_px_00"],
+        tolerance=pd.Timedelta(microseconds=20),
+        allow_exact_matches=allow_exact_matches,
+    )
+
+    # Assert
+    expected = reference_asof_join(
+        trades,
+        quotes,
+        tolerance=20_000,
+        allow_exact_matches=allow_exact_matches,
+    )
+    assert joined.dtype.names[-2:] == ("sequence_right", "bid_px_00")
+    is_matched = expected["sequence_right"].notna().to_numpy()
+    assert np.array_equal(
+        joined["sequence_right"][is_matched],
+        expected["sequence_right"][is_matched].astype(np.uint32),
+    )
+    assert (joined["bid_px_00"][~is_matched] == UNDEF_PRICE).all()
+
+
+def test_asof_join_by_none(
+    trades_quotes: tuple[DBNStore, DBNStore],
+) -> None:
+    """
+    Test that without `by`, each trade is joined with the last quote of any
+    instrument.
+    """
+    # Arrange
+    trades, quotes = trades_quotes
+    quote_records = quotes.to_ndarray()
+
+    # Act
+    joined = databento.asof_join(trades, quotes, by=None, right_columns=["sequence"])
+
+    # Assert
+    index = np.searchsorted(quote_records["ts_recv"], joined["ts_recv"], side="right") - 1
+    expected = np.where(index >= 0, quote_records["sequence"][index.clip(min=0)], 0)
+    assert np.array_equal(joined["sequence_right"], expected)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"on": "ts_out"},
+        {"by": "bid_px_00"},
+        {"right_columns": ["order_id"]},
+        {"tolerance": -1},
+        {"left_schema": "invalid"},
+    ],
+)
+def test_asof_join_invalid(
+    trades_quotes: tuple[DBNStore, DBNStore],
+    kwargs: dict[str, object],
+) -> None:
+    """
+    Test that invalid fields, tolerances, and schemas raise a ValueError.
+    """
+    # Arrange
+    trades, quotes = trades_quotes
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        databento.asof_join(trades, quotes, **kwargs)
@@ -0,0 +1,215 @@
+"""
+Unit tests for splitting requests into sub-ranges and stitching their data.
+"""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+from collections.abc import Callable
+
+import pandas as pd
+import pytest
+from databento_dbn import Metadata
+from databento_dbn import Schema
+from databento_dbn import SType
+
+from databento.common.dbnstore import DBNStore
+from databento.common.error import BentoError
+from databento.common.publishers import Dataset
+from databento.common.shard import concat_stores
+from databento.common.shard import merge_metadata
+from databento.common.shard import shard_range
+from databento.common.symbology import MappingInterval
+from databento.common.symbology import SymbolMapping
+
+
+HOUR = pd.Timedelta(hours=1).value
+
+
+def make_metadata(
+    start: int,
+    end: int,
+    not_found: list[str] | None = None,
+    mappings: list[SymbolMapping] | None = None,
+    version: int = 3,
+    schema: Schema = Schema.TRADES,
+) -> Metadata:
+    return Metadata(
+        dataset="GLBX.MDP3",
+        start=start,
+        stype_in=SType.RAW_SYMBOL,
+        stype_out=SType.INSTRUMENT_ID,
+        schema=schema,
+        symbols=["ESH1", "NQH1"],
+        partial=[],
+        not_found=not_found or [],
+        mappings=mappings or [],
+        end=end,
+        limit=None,
+        ts_out=False,
+        version=version,
+    )
+
+
+@pytest.mark.parametrize(
+    "start, end, parallel, shard, expected",
+    [
+        [0, 10, 1, None, [(0, 10)]],
+        [0, 10, 3, None, [(0, 4), (4, 8), (8, 10)]],
+        [0, 2, 4, None, [(0, 1), (1, 2)]],
+        [0, 2 * HOUR, 1, "1h", [(0, HOUR), (HOUR, 2 * HOUR)]],
+        [HOUR // 2, 2 * HOUR, 1, "1h", [(HOUR // 2, HOUR), (HOUR, 2 * HOUR)]],
+        [0, HOUR + 1, 1, datetime.timedelta(hours=1), [(0, HOUR), (HOUR, HOUR + 1)]],
+        [5, 6, 1, pd.Timedelta(hours=1), [(5, 6)]],
+    ],
+)
+def test_shard_range(
+    start: int,
+    end: int,
+    parallel: int,
+    shard: pd.Timedelta | datetime.timedelta | str | None,
+    expected: list[tuple[int, int]],
+) -> None:
+    """
+    Test that a range is split into consecutive sub-ranges, aligned to
+    `shard` when it is specified.
+    """
+    # Arrange, Act
+    ranges = shard_range(start, end, parallel=parallel, shard=shard)
+
+    # Assert
+    assert ranges == expected
+
+
+@pytest.mark.parametrize(
+    "start, end, parallel, shard",
+    [
+        [10, 10, 1, None],
+        [0, 10, 0, None],
+        [0, 10, 1, "-1h"],
+        [0, 10, 1, "0s"],
+    ],
+)
+def test_shard_range_invalid(
+    start: int,
+    end: int,
+    parallel: int,
+    shard: str | None,
+) -> None:
+    """
+    Test that an empty range or a non-positive `parallel` or `shard` raises a
+    ValueError.
+    """
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        shard_range(start, end, parallel=parallel, shard=shard)
+
+
+def test_merge_metadata() -> None:
+    """
+    Test that metadata of sub-ranges is merged into the metadata of the whole
+    range.
+    """
+    # Arrange
+    day = datetime.date(2020, 12, 28)
+    next_day = datetime.date(2020, 12, 29)
+    metadatas = [
+        make_metadata(
+            0,
+            HOUR,
+            not_found=["NQH1"],
+            mappings=[SymbolMapping("ESH1", [MappingInterval(day, next_day, "5482")])],
+        ),
+        make_metadata(
+            HOUR,
+            2 * HOUR,
+            mappings=[
+                SymbolMapping("ESH1", [MappingInterval(day, next_day, "5482")]),
+                SymbolMapping("NQH1", [MappingInterval(day, next_day, "1234")]),
+            ],
+        ),
+        make_metadata(
+            2 * HOUR,
+            3 * HOUR,
+            mappings=[
+                SymbolMapping(
+                    "ESH1",
+                    [MappingInterval(next_day, datetime.date(2020, 12, 30), "5482")],
+                ),
+            ],
+        ),
+    ]
+
+    # Act
+    metadata = merge_metadata(metadatas)
+
+    # Assert
+    assert metadata.schema == Schema.TRADES
+    assert metadata.start == 0
+    assert metadata.end == 3 * HOUR
+    assert metadata.symbols == ["ESH1", "NQH1"]
+    assert metadata.not_found == []
+    assert metadata.partial == ["NQH1"]
+    assert metadata.mappings == {
+        "ESH1": [
+            {"start_date": day, "end_date": datetime.date(2020, 12, 30), "symbol": "5482"},
+        ],
+        "NQH1": [
+            {"start_date": day, "end_date": next_day, "symbol": "1234"},
+        ],
+    }
+
+
+def test_merge_metadata_different_versions() -> None:
+    """
+    Test that merging metadata of different DBN versions raises a BentoError.
+    """
+    # Arrange
+    metadatas = [make_metadata(0, HOUR, version=2), make_metadata(HOUR, 2 * HOUR)]
+
+    # Act, Assert
+    with pytest.raises(BentoError):
+        merge_metadata(metadatas)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.MBO,
+        Schema.TRADES,
+    ],
+)
+def test_concat_stores(
+    test_data: Callable[[Dataset, Schema], bytes],
+    schema: Schema,
+    tmp_path: pathlib.Path,
+) -> None:
+    """
+    Test that the stores of sub-ranges are stitched into one store, in memory
+    or on disk.
+    """
+    # Arrange
+    store = DBNStore.from_bytes(test_data(Dataset.GLBX_MDP3, schema))
+    records = store.to_ndarray()
+    middle = int(records["ts_recv"][len(records) // 2])
+    stores = [
+        DBNStore.from_bytes(
+            make_metadata(store.metadata.start, middle, schema=schema).encode()
+            + records[records["ts_recv"] < middle].tobytes(),
+        ),
+        DBNStore.from_bytes(
+            make_metadata(middle, store.metadata.end, schema=schema).encode()
+            + records[records["ts_recv"] >= middle].tobytes(),
+        ),
+    ]
+
+    # Act
+    in_memory = concat_stores(stores)
+    on_disk = concat_stores(stores, path=tmp_path / "stitched.dbn.zst")
+
+    # Assert
+    for stitched in (in_memory, on_disk):
+        assert stitched.metadata.start == store.metadata.start
+        assert stitched.metadata.end == store.metadata.end
+        assert stitched.to_ndarray().tobytes() == records.tobytes()
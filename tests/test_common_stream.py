@@ -0,0 +1,168 @@
+"""
+Unit tests for decoding DBN data as it arrives.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from collections.abc import Generator
+
+import numpy as np
+import pytest
+import zstandard
+from databento_dbn import Schema
+
+from databento.common.dbnstore import DBNStore
+from databento.common.error import BentoError
+from databento.common.error import BentoWarning
+from databento.common.publishers import Dataset
+from databento.common.stream import DBNStream
+
+
+def iter_chunks(
+    data: bytes,
+    size: int,
+    read: list[int] | None = None,
+) -> Generator[bytes, None, None]:
+    """
+    Yield the chunks of `data` of `size` bytes, counting the chunks read.
+    """
+    for start in range(0, len(data), size):
+        if read is not None:
+            read.append(start)
+        yield data[start : start + size]
+
+
+@pytest.mark.parametrize(
+    "compressed",
+    [
+        True,
+        False,
+    ],
+)
+@pytest.mark.parametrize(
+    "chunk_size",
+    [
+        1,
+        7,
+        2**20,
+    ],
+)
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.MBO,
+        Schema.DEFINITION,
+    ],
+)
+def test_dbn_stream_records(
+    test_data: Callable[[Dataset, Schema], bytes],
+    compressed: bool,
+    chunk_size: int,
+    schema: Schema,
+) -> None:
+    """
+    Test that the records of a stream match the records of a `DBNStore`,
+    however the data is chunked.
+    """
+    # Arrange
+    data = test_data(Dataset.GLBX_MDP3, schema)
+    if not compressed:
+        data = zstandard.ZstdDecompressor().stream_reader(data).read()
+    store = DBNStore.from_bytes(data)
+
+    # Act
+    stream = DBNStream(iter_chunks(data, chunk_size))
+    records = list(stream)
+
+    # Assert
+    assert stream.metadata == store.metadata
+    assert [bytes(record) for record in records] == [bytes(record) for record in store]
+
+
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        1,
+        3,
+    ],
+)
+def test_dbn_stream_iter_ndarray(
+    test_data: Callable[[Dataset, Schema], bytes],
+    count: int | None,
+) -> None:
+    """
+    Test that the arrays of a stream have at most `count` records and match
+    the array of a `DBNStore`.
+    """
+    # Arrange
+    data = test_data(Dataset.GLBX_MDP3, Schema.MBP_10)
+    store = DBNStore.from_bytes(data)
+
+    # Act
+    arrays = list(DBNStream(iter_chunks(data, 50)).iter_ndarray(count))
+
+    # Assert
+    assert all(0 < len(array) <= (count or len(array)) for array in arrays)
+    assert np.array_equal(np.concatenate(arrays), store.to_ndarray())
+
+
+def test_dbn_stream_decodes_incrementally(
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    """
+    Test that the first record is decoded before the rest of the data is
+    read.
+    """
+    # Arrange
+    data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    read: list[int] = []
+    chunks = iter_chunks(data, 64, read)
+    stream = DBNStream(chunks)
+
+    # Act
+    first = next(iter(stream))
+    num_read = len(read)
+    stream.close()
+
+    # Assert
+    assert first == next(iter(DBNStore.from_bytes(data)))
+    assert num_read < len(data) // 64
+    assert chunks.gi_frame is None  # the source has been closed
+
+
+def test_dbn_stream_read_once(
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    """
+    Test that the records of a stream cannot be read twice.
+    """
+    # Arrange
+    stream = DBNStream(iter_chunks(test_data(Dataset.GLBX_MDP3, Schema.TRADES), 100))
+    list(stream)
+
+    # Act, Assert
+    with pytest.raises(BentoError):
+        list(stream.iter_ndarray())
+
+
+def test_dbn_stream_truncated(
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    """
+    Test that a stream which ends within a record warns and that a stream
+    which ends within its metadata raises a BentoError.
+    """
+    # Arrange
+    data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+
+    # Act, Assert
+    with pytest.warns(BentoWarning):
+        list(DBNStream(iter_chunks(data[:-1], 100)))
+    with pytest.raises(BentoError):
+        DBNStream(iter_chunks(data[:20], 100)).metadata
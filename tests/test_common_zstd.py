@@ -0,0 +1,188 @@
+"""
+Unit tests for zstd frame handling.
+"""
+
+from io import BytesIO
+from pathlib import Path
+
+import pytest
+import zstandard
+
+from databento.common.zstd import FrameIndexEntry
+from databento.common.zstd import ParallelZstdReader
+from databento.common.zstd import read_frame_index
+from databento.common.zstd import read_frames
+from databento.common.zstd import write_frame_index
+
+
+@pytest.mark.parametrize(
+    "write_content_size",
+    [
+        True,
+        False,
+    ],
+)
+@pytest.mark.parametrize(
+    "write_checksum",
+    [
+        True,
+        False,
+    ],
+)
+def test_read_frames(
+    write_content_size: bool,
+    write_checksum: bool,
+) -> None:
+    """
+    Test that the locations of zstd frames are read from a compressed stream.
+    """
+    # Arrange
+    compressor = zstandard.ZstdCompressor(
+        write_content_size=write_content_size,
+        write_checksum=write_checksum,
+    )
+    chunks = [bytes(range(256)) * 1000, b"DBN" * 10, b""]
+    skippable = (0x184D2A50).to_bytes(4, "little") + (3).to_bytes(4, "little") + b"abc"
+    compressed = [skippable, *(compressor.compress(chunk) for chunk in chunks)]
+    reader = BytesIO(b"".join(compressed))
+
+    # Act
+    frames = read_frames(reader)
+
+    # Assert
+    assert [frame.size for frame in frames] == [len(frame) for frame in compressed]
+    assert [frame.skippable for frame in frames] == [True, False, False, False]
+    assert frames[0].offset == 0
+    for previous, frame in zip(frames, frames[1:]):
+        assert frame.offset == previous.offset + previous.size
+    for frame, chunk in zip(frames[1:], chunks):
+        assert frame.content_size == (len(chunk) if write_content_size else None)
+
+
+def test_read_frames_invalid() -> None:
+    """
+    Test that reading the frames of an invalid stream raises a ValueError.
+    """
+    # Arrange
+    reader = BytesIO(b"DBN" * 10)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        read_frames(reader)
+
+
+def test_read_frames_truncated() -> None:
+    """
+    Test that reading the frames of a truncated stream raises a ValueError.
+    """
+    # Arrange
+    compressed = zstandard.ZstdCompressor().compress(bytes(range(256)) * 1000)
+    reader = BytesIO(compressed[: len(compressed) // 2])
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="Truncated"):
+        read_frames(reader)
+
+
+def test_read_frames_reserved_block_type() -> None:
+    """
+    Test that reading a frame with a reserved block type raises a ValueError.
+    """
+    # Arrange
+    compressed = zstandard.ZstdCompressor(write_checksum=False).compress(b"")
+    block_header = (0b111).to_bytes(3, "little")  # last block of reserved type 3
+    reader = BytesIO(compressed[:-3] + block_header)
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="Reserved"):
+        read_frames(reader)
+
+
+def test_frame_index_round_trip(
+    tmp_path: Path,
+) -> None:
+    """
+    Test that a frame index can be written and read back, and that it is
+    discarded once the source file changes.
+    """
+    # Arrange
+    source = tmp_path / "test.dbn.zst"
+    source.write_bytes(b"test")
+    index_path = tmp_path / "test.dbn.zst.idx"
+    entries = [FrameIndexEntry(0, 0, 100, 1), FrameIndexEntry(10, 1000, 1008, 2)]
+
+    # Act
+    write_frame_index(index_path, source, entries)
+    actual = read_frame_index(index_path, source)
+    source.write_bytes(b"changed")
+    stale = read_frame_index(index_path, source)
+
+    # Assert
+    assert actual == entries
+    assert stale is None
+
+
+@pytest.mark.parametrize(
+    "threads",
+    [
+        1,
+        4,
+    ],
+)
+@pytest.mark.parametrize(
+    "read_size",
+    [
+        -1,
+        1,
+        1000,
+        2**20,
+    ],
+)
+def test_parallel_zstd_reader(
+    threads: int,
+    read_size: int,
+) -> None:
+    """
+    Test that a ParallelZstdReader decompresses the frames of a stream in
+    order.
+    """
+    # Arrange
+    compressor = zstandard.ZstdCompressor()
+    data = bytes(range(256)) * 1000
+    reader = BytesIO(
+        b"".join(compressor.compress(data[i : i + 7777]) for i in range(0, len(data), 7777)),
+    )
+    parallel_reader = ParallelZstdReader(reader, read_frames(reader), threads=threads)
+
+    # Act
+    chunks = []
+    while chunk := parallel_reader.read(read_size):
+        chunks.append(chunk)
+    parallel_reader.close()
+
+    # Assert
+    assert b"".join(chunks) == data
+    assert parallel_reader.closed
+
+
+def test_parallel_zstd_reader_seek() -> None:
+    """
+    Test that a ParallelZstdReader supports seeking forward only.
+    """
+    # Arrange
+    compressor = zstandard.ZstdCompressor()
+    data = bytes(range(256)) * 100
+    reader = BytesIO(
+        b"".join(compressor.compress(data[i : i + 1000]) for i in range(0, len(data), 1000)),
+    )
+    parallel_reader = ParallelZstdReader(reader, read_frames(reader), threads=2)
+
+    # Act
+    parallel_reader.seek(2500)
+    chunk = parallel_reader.read(10)
+
+    # Assert
+    assert chunk == data[2500:2510]
+    assert parallel_reader.tell() == 2510
+    with pytest.raises(OSError):
+        parallel_reader.seek(0)
@@ -65,7 +65,7 @@ def test_batch_submit_job_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     # Act
     historical_client.batch.submit_job(
@@ -114,7 +114,7 @@ def test_batch_list_jobs_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.batch.list_jobs(since="2022-01-01")
@@ -138,7 +138,7 @@ def test_batch_list_files_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
     job_id = "GLBX-20220610-5DEFXVTMSM"
 
     # Act
@@ -162,7 +162,7 @@ def test_batch_get_job_details_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
     job_id = "GLBX-20220610-5DEFXVTMSM"
 
     # Act
@@ -217,7 +217,7 @@ def test_batch_download_single_file_sends_expected_request(
     )
 
     # Mock the call for get, so we can capture the download arguments
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.batch.download(
@@ -285,7 +285,7 @@ def test_batch_download_rate_limit_429(
         iter_content=MagicMock(return_value=iter([file_content])),
     )
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         MagicMock(
             side_effect=[rate_limit_response, ok_response],
@@ -350,7 +350,7 @@ def test_batch_download_file_exists(
         iter_content=MagicMock(return_value=iter([file_content])),
     )
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         MagicMock(
             side_effect=[ok_response],
@@ -422,7 +422,7 @@ def test_batch_download_file_larger_than_expected(
         iter_content=MagicMock(return_value=iter([file_content])),
     )
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         MagicMock(
             side_effect=[ok_response],
@@ -484,7 +484,7 @@ def test_batch_download_all_files(
     )
 
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         mocked_get := MagicMock(
             side_effect=[zip_response],
@@ -550,7 +550,7 @@ async def test_batch_download_all_files_async(
     )
 
     monkeypatch.setattr(
-        requests,
+        requests.Session,
         "get",
         mocked_get := MagicMock(
             side_effect=[zip_response],
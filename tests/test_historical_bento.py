@@ -1,6 +1,8 @@
 import collections
 import datetime as dt
 import decimal
+import sys
+import threading
 import zoneinfo
 from collections.abc import Callable
 from io import BytesIO
@@ -10,13 +12,17 @@ from typing import Literal
 from unittest.mock import MagicMock
 from zoneinfo import ZoneInfo
 
+import databento_dbn
 import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import pytest
 import zstandard
 from databento_dbn import Compression
 from databento_dbn import DBNRecord
 from databento_dbn import MBOMsg
+from databento_dbn import RType
 from databento_dbn import Schema
 from databento_dbn import SType
 
@@ -24,9 +30,11 @@ import databento
 import databento.common.dbnstore
 from databento.common.constants import SCHEMA_STRUCT_MAP
 from databento.common.dbnstore import DBNStore
+from databento.common.dbnstore import MergedDBNStore
 from databento.common.error import BentoError
 from databento.common.error import BentoWarning
 from databento.common.publishers import Dataset
+from databento.common.zstd import read_frames
 
 
 def test_from_file_when_not_exists_raises_expected_exception() -> None:
@@ -275,6 +283,91 @@ def test_to_file_compression(
     assert new_store.compression == compression
 
 
+@pytest.mark.parametrize(
+    "threads",
+    [
+        None,
+        4,
+    ],
+)
+def test_to_file_frame_size(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+    threads: int | None,
+) -> None:
+    """
+    Test that specifying a frame_size for DBNStore.to_file writes multiple
+    zstd frames which decode to the same records.
+    """
+    # Arrange
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    dbnstore = DBNStore.from_bytes(data=stub_data)
+    dbn_path = tmp_path / "my_test.dbn.zst"
+
+    # Act
+    dbnstore.to_file(
+        path=dbn_path,
+        compression=Compression.ZSTD,
+        frame_size=100,
+    )
+    new_store = DBNStore.from_file(dbn_path, threads=threads)
+
+    # Assert
+    with open(dbn_path, "rb") as reader:
+        assert len(read_frames(reader)) == 6
+    assert new_store.compression == Compression.ZSTD
+    assert np.array_equal(new_store.to_ndarray(), dbnstore.to_ndarray())
+    assert list(map(bytes, new_store)) == list(map(bytes, dbnstore))
+    pd.testing.assert_frame_equal(new_store.to_df(), dbnstore.to_df())
+
+
+def test_reader_threads_share_executor(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the parallel readers of a DBNStore share one pool of threads.
+    """
+    # Arrange
+    dbn_path = tmp_path / "my_test.dbn.zst"
+    DBNStore.from_bytes(data=test_data(Dataset.GLBX_MDP3, Schema.MBO)).to_file(
+        path=dbn_path,
+        compression=Compression.ZSTD,
+        frame_size=100,
+    )
+    dbnstore = DBNStore.from_file(dbn_path, threads=2)
+    thread_count = threading.active_count()
+
+    # Act
+    readers = [dbnstore.reader for _ in range(10)]
+    for reader in readers:
+        reader.read(1)
+
+    # Assert
+    assert threading.active_count() <= thread_count + 2
+
+
+def test_to_file_frame_size_uncompressed(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that specifying a frame_size for uncompressed output raises a
+    ValueError.
+    """
+    # Arrange
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    dbnstore = DBNStore.from_bytes(data=stub_data)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        dbnstore.to_file(
+            path=tmp_path / "my_test.dbn",
+            compression=Compression.NONE,
+            frame_size=100,
+        )
+
+
 def test_to_csv_overwrite(
     test_data: Callable[[Dataset, Schema], bytes],
     tmp_path: Path,
@@ -462,6 +555,116 @@ def test_replay_with_stub_data_record_passes_to_callback(
     assert record.sequence == 1180
 
 
+@pytest.mark.parametrize(
+    "batch_size",
+    [
+        1,
+        3,
+        1000,
+    ],
+)
+def test_replay_batches(
+    test_data: Callable[[Dataset, Schema], bytes],
+    batch_size: int,
+) -> None:
+    """
+    Test that the records are passed to the callback in batches of at most
+    `batch_size` records.
+    """
+    # Arrange
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    data = DBNStore.from_bytes(data=stub_data)
+
+    handler: list[np.ndarray] = []
+
+    # Act
+    data.replay_batches(callback=handler.append, batch_size=batch_size)
+
+    # Assert
+    assert all(0 < len(batch) <= batch_size for batch in handler)
+    assert np.array_equal(np.concatenate(handler), data.to_ndarray())
+
+
+@pytest.mark.parametrize(
+    "scan",
+    [
+        True,
+        False,
+    ],
+)
+def test_replay_batches_mixed_schema(
+    monkeypatch: pytest.MonkeyPatch,
+    live_test_data_path: Path,
+    scan: bool,
+) -> None:
+    """
+    Test that the records of mixed DBN data are passed to the callback in
+    one array per record type, whether located by their headers or decoded.
+    """
+    # Arrange
+    if not scan:
+        monkeypatch.setattr(databento_dbn, "DBN_VERSION", 0)
+    dbnstore = DBNStore.from_file(live_test_data_path)
+
+    handler: list[np.ndarray] = []
+
+    # Act
+    dbnstore.replay_batches(callback=handler.append, batch_size=4)
+
+    # Assert
+    assert all(len(set(batch["rtype"].tolist())) == 1 for batch in handler)
+    assert sum(len(batch) for batch in handler) == len(list(dbnstore))
+    trades = np.concatenate([batch for batch in handler if batch["rtype"][0] == RType.MBP_0])
+    assert np.array_equal(trades, dbnstore.to_ndarray(Schema.TRADES))
+
+
+def test_replay_batches_speed(
+    monkeypatch: pytest.MonkeyPatch,
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    """
+    Test that with a `speed`, each batch waits until its timestamp relative
+    to the first batch, scaled by the speed.
+    """
+    # Arrange
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.OHLCV_1S)
+    data = DBNStore.from_bytes(data=stub_data)
+    monkeypatch.setattr(databento.common.dbnstore.time, "monotonic", lambda: 0.0)
+    delays: list[float] = []
+    monkeypatch.setattr(databento.common.dbnstore.time, "sleep", delays.append)
+
+    # Act
+    data.replay_batches(callback=lambda batch: None, batch_size=1, speed=2.0)
+
+    # Assert
+    ts_event = data.to_ndarray()["ts_event"]
+    expected = (ts_event[1:] - ts_event[0]) / 2.0 / 1e9
+    assert delays == expected[expected > 0].tolist()
+
+
+@pytest.mark.parametrize(
+    "batch_size, speed",
+    [
+        (0, None),
+        (10, 0.0),
+    ],
+)
+def test_replay_batches_invalid(
+    test_data: Callable[[Dataset, Schema], bytes],
+    batch_size: int,
+    speed: float | None,
+) -> None:
+    """
+    Test that a non-positive `batch_size` or `speed` raises a ValueError.
+    """
+    # Arrange
+    data = DBNStore.from_bytes(data=test_data(Dataset.GLBX_MDP3, Schema.MBO))
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        data.replay_batches(callback=lambda batch: None, batch_size=batch_size, speed=speed)
+
+
 @pytest.mark.parametrize(
     "schema",
     [
@@ -681,6 +884,7 @@ def test_to_df_with_price_type_invalid(
     [
         "fixed",
         "float",
+        "decimal",
     ],
 )
 @pytest.mark.parametrize(
@@ -703,7 +907,7 @@ def test_to_parquet(
     test_data: Callable[[Dataset, Schema], bytes],
     dataset: Dataset,
     schema: Schema,
-    price_type: Literal["fixed", "float"],
+    price_type: Literal["fixed", "float", "decimal"],
     pretty_ts: bool,
     map_symbols: bool,
 ) -> None:
@@ -730,109 +934,495 @@ def test_to_parquet(
     # Replace None values with np.nan
     actual.fillna(value=np.nan)
 
+    # Parquet stores undefined decimal prices as nulls instead of NaN
+    if price_type == "decimal":
+        for field in SCHEMA_STRUCT_MAP[schema]._price_fields:
+            actual[field] = actual[field].fillna(decimal.Decimal("NaN"))
+
     # Assert
     pd.testing.assert_frame_equal(actual, expected)
 
 
-def test_to_parquet_kwargs(
+def test_to_parquet_with_parquet_schema(
     monkeypatch: pytest.MonkeyPatch,
     tmp_path: Path,
     test_data: Callable[[Dataset, Schema], bytes],
 ) -> None:
     # Arrange
     monkeypatch.setattr(databento.common.dbnstore, "PARQUET_CHUNK_SIZE", 1)
-    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
     data = DBNStore.from_bytes(data=stub_data)
     parquet_file = tmp_path / "test.parquet"
-
-    # Act
-    expected = data.to_df()
-    data.to_parquet(
-        parquet_file,
-        compression="zstd",
-        write_statistics="false",
+    parquet_schema = pa.schema(
+        [
+            ("price", pa.float32()),
+            ("size", pa.uint64()),
+            ("symbol", pa.string()),
+        ],
     )
-    actual = pd.read_parquet(parquet_file)
 
-    # Replace None values with np.nan
-    actual.fillna(value=np.nan)
+    # Act
+    data.to_parquet(parquet_file, parquet_schema=parquet_schema)
+    actual = pq.read_table(parquet_file)
 
     # Assert
-    pd.testing.assert_frame_equal(actual, expected)
+    assert actual.schema == parquet_schema
+    assert actual.num_rows == len(data.to_ndarray())
 
 
 @pytest.mark.parametrize(
-    "expected_schema",
+    "schema",
     [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
 )
-def test_from_file_given_various_paths_returns_expected_metadata(
-    test_data_path: Callable[[Dataset, Schema], Path],
-    expected_schema: Schema,
+@pytest.mark.parametrize(
+    "map_symbols",
+    [
+        True,
+        False,
+    ],
+)
+def test_to_parquet_with_columns(
+    tmp_path: Path,
+    test_data: Callable[[Dataset, Schema], bytes],
+    schema: Schema,
+    map_symbols: bool,
 ) -> None:
     # Arrange
-    path = test_data_path(Dataset.GLBX_MDP3, expected_schema)
+    stub_data = test_data(Dataset.GLBX_MDP3, schema)
+    data = DBNStore.from_bytes(data=stub_data)
+    parquet_file = tmp_path / "test.parquet"
+    columns = list(SCHEMA_STRUCT_MAP[schema]._ordered_fields[-1:0:-2])
 
     # Act
-    data = DBNStore.from_file(path=path)
+    expected = data.to_df(map_symbols=map_symbols, columns=columns)
+    data.to_parquet(parquet_file, map_symbols=map_symbols, columns=columns)
+    actual = pd.read_parquet(parquet_file)
 
     # Assert
-    assert data.schema == expected_schema
+    pd.testing.assert_frame_equal(actual, expected)
 
 
-def test_read_dbn_alias(
-    test_data_path: Callable[[Dataset, Schema], Path],
+@pytest.mark.parametrize(
+    "dataset",
+    [
+        Dataset.GLBX_MDP3,
+        Dataset.XNAS_ITCH,
+        Dataset.OPRA_PILLAR,
+    ],
+)
+@pytest.mark.parametrize(
+    "schema",
+    [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
+)
+@pytest.mark.parametrize(
+    "price_type",
+    [
+        "fixed",
+        "float",
+    ],
+)
+@pytest.mark.parametrize(
+    "pretty_ts",
+    [
+        True,
+        False,
+    ],
+)
+@pytest.mark.parametrize(
+    "map_symbols",
+    [
+        True,
+        False,
+    ],
+)
+def test_to_arrow(
+    test_data: Callable[[Dataset, Schema], bytes],
+    dataset: Dataset,
+    schema: Schema,
+    price_type: Literal["fixed", "float"],
+    pretty_ts: bool,
+    map_symbols: bool,
 ) -> None:
     # Arrange
-    path = test_data_path(Dataset.GLBX_MDP3, Schema.MBO)
+    stub_data = test_data(dataset, schema)
+    data = DBNStore.from_bytes(data=stub_data)
 
     # Act
-    data = databento.read_dbn(path=path)
+    expected = data.to_df(
+        price_type=price_type,
+        pretty_ts=pretty_ts,
+        map_symbols=map_symbols,
+    )
+    table = data.to_arrow(
+        price_type=price_type,
+        pretty_ts=pretty_ts,
+        map_symbols=map_symbols,
+    )
+    actual = table.to_pandas()
 
     # Assert
-    assert data.schema == Schema.MBO
-    assert len(data.to_ndarray()) == 4
+    assert isinstance(table, pa.Table)
+    if map_symbols:
+        assert pa.types.is_dictionary(table.schema.field("symbol").type)
+        actual["symbol"] = actual["symbol"].astype(expected["symbol"].dtype)
+    pd.testing.assert_frame_equal(actual, expected)
 
 
-def test_mbo_to_csv_writes_expected_file_to_disk(
-    test_data_path: Callable[[Dataset, Schema], Path],
-    tmp_path: Path,
+@pytest.mark.parametrize(
+    "count",
+    [
+        1,
+        3,
+    ],
+)
+def test_to_arrow_with_count(
+    test_data: Callable[[Dataset, Schema], bytes],
+    count: int,
 ) -> None:
     # Arrange
-    data = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
-
-    path = tmp_path / "test.my_mbo.csv"
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBP_1)
+    data = DBNStore.from_bytes(data=stub_data)
+    expected = data.to_arrow()
 
     # Act
-    data.to_csv(
-        path,
-        pretty_ts=False,
-        pretty_px=False,
-        map_symbols=False,
-    )
+    reader = data.to_arrow(count=count)
+    batches = list(reader)
 
     # Assert
-    written = path.read_text()
-    expected = (
-        "ts_recv,ts_event,rtype,publisher_id,instrument_id,action,side,price,size,channel_id,order_id,flags,ts_in_delta,sequence\n"
-        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675750000000,2,0,647784248135,40,0,1180\n"
-        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675500000000,1,0,647782686353,40,0,1160\n"
-        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675250000000,1,0,647782884482,40,0,1166\n"
-        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675000000000,1,0,647782912367,40,0,1166\n"
+    assert isinstance(reader, pa.RecordBatchReader)
+    assert all(batch.num_rows <= count for batch in batches)
+    assert pa.Table.from_batches(batches, schema=reader.schema).equals(
+        expected.unify_dictionaries(),
     )
 
-    assert written == expected
-
-
-def test_mbp_1_to_csv_with_no_options_writes_expected_file_to_disk(
-    test_data_path: Callable[[Dataset, Schema], Path],
-    tmp_path: Path,
-) -> None:
-    # Arrange
-    data = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBP_1))
-
-    path = tmp_path / "test.my_mbo.csv"
 
-    # Act
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.MBO,
+        Schema.MBP_10,
+        Schema.DEFINITION,
+    ],
+)
+def test_to_arrow_with_price_type_decimal(
+    test_data: Callable[[Dataset, Schema], bytes],
+    schema: Schema,
+) -> None:
+    # Arrange
+    stub_data = test_data(Dataset.GLBX_MDP3, schema)
+    data = DBNStore.from_bytes(data=stub_data)
+    expected = data.to_df(price_type="decimal")
+
+    # Act
+    table = data.to_arrow(price_type="decimal")
+
+    # Assert
+    for field in SCHEMA_STRUCT_MAP[schema]._price_fields:
+        assert table.schema.field(field).type == pa.decimal128(19, 9)
+        actual = table.column(field).to_pylist()
+        assert [
+            expected_px.is_nan() if actual_px is None else actual_px == expected_px
+            for actual_px, expected_px in zip(actual, expected[field])
+        ] == [True] * len(expected)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
+)
+@pytest.mark.parametrize(
+    "price_type",
+    [
+        "fixed",
+        "float",
+        "decimal",
+    ],
+)
+def test_to_polars(
+    test_data: Callable[[Dataset, Schema], bytes],
+    schema: Schema,
+    price_type: Literal["fixed", "float", "decimal"],
+) -> None:
+    # Arrange
+    pl = pytest.importorskip("polars")
+    stub_data = test_data(Dataset.GLBX_MDP3, schema)
+    data = DBNStore.from_bytes(data=stub_data)
+    expected = data.to_arrow(price_type=price_type)
+
+    # Act
+    actual = data.to_polars(price_type=price_type)
+
+    # Assert
+    assert isinstance(actual, pl.DataFrame)
+    assert actual.columns[0] == expected.schema.names[-1]
+    expected_frame = pl.from_arrow(expected)
+    assert actual.select(expected.schema.names).equals(expected_frame)
+
+
+@pytest.mark.parametrize(
+    "lazy",
+    [
+        True,
+        False,
+    ],
+)
+def test_to_polars_with_count(
+    test_data: Callable[[Dataset, Schema], bytes],
+    lazy: bool,
+) -> None:
+    # Arrange
+    pl = pytest.importorskip("polars")
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBP_1)
+    data = DBNStore.from_bytes(data=stub_data)
+    expected = data.to_polars()
+
+    # Act
+    frames = list(data.to_polars(count=3, lazy=lazy))
+
+    # Assert
+    if lazy:
+        assert all(isinstance(frame, pl.LazyFrame) for frame in frames)
+        frames = [frame.collect() for frame in frames]
+    assert [len(frame) for frame in frames] == [3, 1]
+    assert pl.concat(frames).equals(expected)
+
+
+def test_to_polars_lazy(
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    # Arrange
+    pl = pytest.importorskip("polars")
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
+    data = DBNStore.from_bytes(data=stub_data)
+    expected = data.to_polars().select("price")
+
+    # Act
+    actual = data.to_polars(lazy=True)
+
+    # Assert
+    assert isinstance(actual, pl.LazyFrame)
+    assert actual.select("price").collect().equals(expected)
+
+
+def test_to_polars_not_installed(
+    monkeypatch: pytest.MonkeyPatch,
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    # Arrange
+    monkeypatch.setitem(sys.modules, "polars", None)
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
+    data = DBNStore.from_bytes(data=stub_data)
+
+    # Act, Assert
+    with pytest.raises(ImportError, match="databento\\[polars\\]"):
+        data.to_polars()
+
+
+def test_to_parquet_kwargs(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "PARQUET_CHUNK_SIZE", 1)
+    stub_data = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    data = DBNStore.from_bytes(data=stub_data)
+    parquet_file = tmp_path / "test.parquet"
+
+    # Act
+    expected = data.to_df()
+    data.to_parquet(
+        parquet_file,
+        compression="zstd",
+        write_statistics="false",
+    )
+    actual = pd.read_parquet(parquet_file)
+
+    # Replace None values with np.nan
+    actual.fillna(value=np.nan)
+
+    # Assert
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize(
+    "pretty_ts",
+    [
+        True,
+        False,
+    ],
+)
+def test_to_parquet_dataset(
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    test_data: Callable[[Dataset, Schema], bytes],
+    pretty_ts: bool,
+) -> None:
+    """
+    Test that records are written to a Hive partitioned parquet dataset in
+    their original order.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "PARQUET_CHUNK_SIZE", 3)
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    records = np.resize(stub_store.to_ndarray(), 10)
+    records["ts_recv"] = pd.Timestamp("2020-12-28", tz="UTC").value + np.arange(10) * 17 * 10**12
+    records["instrument_id"] = [5482, 1234] * 5
+    data = DBNStore.from_bytes(dbn_stub_data[: stub_store._metadata_length] + records.tobytes())
+    root = tmp_path / "dataset"
+
+    # Act
+    data.to_parquet_dataset(
+        root,
+        partition_by=("date", "instrument_id"),
+        pretty_ts=pretty_ts,
+        row_group_size=2,
+    )
+    dataset = pq.ParquetDataset(root)
+
+    # Assert
+    assert sorted(p.relative_to(root).parent.as_posix() for p in root.rglob("*.parquet")) == [
+        "date=2020-12-28/instrument_id=1234",
+        "date=2020-12-28/instrument_id=5482",
+        "date=2020-12-29/instrument_id=1234",
+        "date=2020-12-29/instrument_id=5482",
+    ]
+    for path in root.rglob("*.parquet"):
+        metadata = pq.ParquetFile(path).metadata
+        assert metadata.num_row_groups == -(-metadata.num_rows // 2)
+        assert metadata.row_group(0).column(0).statistics.has_min_max
+
+    expected = data.to_df(pretty_ts=pretty_ts).reset_index()
+    actual = dataset.read().to_pandas().sort_values(["ts_recv", "instrument_id"])
+    assert list(actual.columns[:-2]) == list(expected.columns.drop("instrument_id"))
+    for column in expected.columns.drop("instrument_id"):
+        assert actual[column].tolist() == expected[column].tolist()
+
+
+def test_to_parquet_dataset_exclusive(
+    tmp_path: Path,
+    test_data: Callable[[Dataset, Schema], bytes],
+) -> None:
+    """
+    Test that writing to a non-empty directory with mode "x" raises a
+    FileExistsError and that mode "w" replaces the written partitions.
+    """
+    # Arrange
+    data = DBNStore.from_bytes(data=test_data(Dataset.GLBX_MDP3, Schema.MBO))
+    root = tmp_path / "dataset"
+    data.to_parquet_dataset(root, partition_by=("symbol",))
+
+    # Act, Assert
+    with pytest.raises(FileExistsError):
+        data.to_parquet_dataset(root, partition_by=("symbol",), mode="x")
+    data.to_parquet_dataset(root, partition_by=("symbol",), mode="w")
+    assert len(list(root.rglob("*.parquet"))) == 1
+
+
+@pytest.mark.parametrize(
+    "partition_by",
+    [
+        (),
+        ("symbol",),
+        ("date", "bid_px_00"),
+    ],
+)
+def test_to_parquet_dataset_invalid_partition_by(
+    tmp_path: Path,
+    test_data: Callable[[Dataset, Schema], bytes],
+    partition_by: tuple[str, ...],
+) -> None:
+    """
+    Test that partitioning by a column which is not in the data raises a
+    ValueError.
+    """
+    # Arrange
+    data = DBNStore.from_bytes(data=test_data(Dataset.GLBX_MDP3, Schema.MBO))
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        data.to_parquet_dataset(
+            tmp_path / "dataset",
+            partition_by=partition_by,
+            map_symbols=False,
+        )
+
+
+@pytest.mark.parametrize(
+    "expected_schema",
+    [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
+)
+def test_from_file_given_various_paths_returns_expected_metadata(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    expected_schema: Schema,
+) -> None:
+    # Arrange
+    path = test_data_path(Dataset.GLBX_MDP3, expected_schema)
+
+    # Act
+    data = DBNStore.from_file(path=path)
+
+    # Assert
+    assert data.schema == expected_schema
+
+
+def test_read_dbn_alias(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    # Arrange
+    path = test_data_path(Dataset.GLBX_MDP3, Schema.MBO)
+
+    # Act
+    data = databento.read_dbn(path=path)
+
+    # Assert
+    assert data.schema == Schema.MBO
+    assert len(data.to_ndarray()) == 4
+
+
+def test_mbo_to_csv_writes_expected_file_to_disk(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    data = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
+
+    path = tmp_path / "test.my_mbo.csv"
+
+    # Act
+    data.to_csv(
+        path,
+        pretty_ts=False,
+        pretty_px=False,
+        map_symbols=False,
+    )
+
+    # Assert
+    written = path.read_text()
+    expected = (
+        "ts_recv,ts_event,rtype,publisher_id,instrument_id,action,side,price,size,channel_id,order_id,flags,ts_in_delta,sequence\n"
+        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675750000000,2,0,647784248135,40,0,1180\n"
+        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675500000000,1,0,647782686353,40,0,1160\n"
+        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675250000000,1,0,647782884482,40,0,1166\n"
+        "1609113600000000000,1609099225061045683,160,1,5482,A,B,3675000000000,1,0,647782912367,40,0,1166\n"
+    )
+
+    assert written == expected
+
+
+def test_mbp_1_to_csv_with_no_options_writes_expected_file_to_disk(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    tmp_path: Path,
+) -> None:
+    # Arrange
+    data = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBP_1))
+
+    path = tmp_path / "test.my_mbo.csv"
+
+    # Act
     data.to_csv(
         path,
         pretty_ts=False,
@@ -1324,29 +1914,357 @@ def test_dbnstore_to_ndarray_with_schema(
         assert row == expected[i]
 
 
-def test_dbnstore_to_ndarray_with_count_empty(
-    test_data_path: Callable[[Dataset, Schema], Path],
+@pytest.mark.parametrize(
+    "schema",
+    [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
+)
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        1,
+        2,
+    ],
+)
+def test_dbnstore_to_ndarray_mmap(
+    schema: Schema,
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+    count: int | None,
 ) -> None:
     """
-    Test that calling to_ndarray on a DBNStore that contains no data with count
-    set returns an iterator for one empty ndarray.
+    Test that calling to_ndarray on a memory-mapped uncompressed DBN file
+    produces read-only arrays identical to the buffered reader.
     """
     # Arrange
-    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.TRADES))
+    dbn_path = tmp_path / "test.dbn"
+    dbn_path.write_bytes(
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, schema)).read(),
+    )
+    dbnstore = DBNStore.from_file(path=dbn_path, mmap=True)
 
     # Act
-    nd_iter = dbnstore.to_ndarray(
-        schema=Schema.MBO,
-        count=10,
-    )
+    expected = DBNStore.from_file(path=dbn_path).to_ndarray()
+    if count is None:
+        batches = [dbnstore.to_ndarray()]
+    else:
+        batches = list(dbnstore.to_ndarray(count=count))
 
     # Assert
-    assert len(next(nd_iter)) == 0
+    for batch in batches:
+        assert not batch.flags.writeable
+        assert count is None or len(batch) <= count
+    assert np.array_equal(expected, np.concatenate(batches))
 
 
-@pytest.mark.parametrize(
-    "schema, expected_count",
-    [
+def test_dbnstore_to_ndarray_mmap_truncated_dbn(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that a truncated memory-mapped DBN file decodes the complete records
+    and emits a warning.
+    """
+    # Arrange
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    truncated = tmp_path / "truncated.dbn"
+    truncated.write_bytes(dbn_stub_data[:-8])  # leave out 8 bytes of data
+    dbnstore = DBNStore.from_file(path=truncated, mmap=True)
+
+    # Act
+    with pytest.warns(BentoWarning):
+        array = dbnstore.to_ndarray()
+
+    # Assert
+    assert len(array) == 3
+
+
+def test_dbnstore_mmap_compressed(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    """
+    Test that a memory-mapped zstd compressed DBN file is decoded identically
+    to the buffered reader.
+    """
+    # Arrange
+    path = test_data_path(Dataset.GLBX_MDP3, Schema.MBO)
+    dbnstore = DBNStore.from_file(path=path, mmap=True)
+
+    # Act
+    array = dbnstore.to_ndarray()
+    df = dbnstore.to_df()
+
+    # Assert
+    assert dbnstore.compression == Compression.ZSTD
+    assert np.array_equal(array, DBNStore.from_file(path=path).to_ndarray())
+    assert len(df) == len(list(dbnstore)) == 4
+
+
+@pytest.mark.parametrize(
+    "compression,frame_size",
+    [
+        pytest.param(Compression.NONE, None, id="none"),
+        pytest.param(Compression.ZSTD, None, id="zstd-single-frame"),
+        pytest.param(Compression.ZSTD, 1000, id="zstd-multi-frame"),
+    ],
+)
+@pytest.mark.parametrize(
+    "mmap",
+    [
+        False,
+        True,
+    ],
+)
+@pytest.mark.parametrize(
+    "start,end",
+    [
+        (None, None),
+        (1234, 5678),
+        (0, 10),
+        (9990, None),
+        (None, 0),
+        (10_000, 20_000),
+    ],
+)
+def test_dbnstore_slice(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+    compression: Compression,
+    frame_size: int | None,
+    mmap: bool,
+    start: int | None,
+    end: int | None,
+) -> None:
+    """
+    Test that DBNStore.slice returns the records within the time range.
+    """
+    # Arrange
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    records = np.resize(stub_store.to_ndarray(), 1000)
+    records["ts_recv"] = np.arange(1000) * 10
+    data = dbn_stub_data[: stub_store._metadata_length] + records.tobytes()
+
+    if compression == Compression.ZSTD:
+        frame_size = frame_size or len(data)
+        compressor = zstandard.ZstdCompressor()
+        data = b"".join(
+            compressor.compress(data[i : i + frame_size]) for i in range(0, len(data), frame_size)
+        )
+
+    dbn_path = tmp_path / "test.dbn"
+    dbn_path.write_bytes(data)
+    dbnstore = DBNStore.from_file(dbn_path, mmap=mmap)
+
+    # Act
+    actual = dbnstore.slice(start=start, end=end)
+
+    # Assert
+    mask = np.ones(len(records), dtype=bool)
+    if start is not None:
+        mask &= records["ts_recv"] >= start
+    if end is not None:
+        mask &= records["ts_recv"] < end
+    assert np.array_equal(actual, records[mask])
+    assert (tmp_path / "test.dbn.idx").exists() == (compression == Compression.ZSTD)
+
+
+def test_dbnstore_slice_nanosecond_precision(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that DBNStore.slice compares full UNIX nanosecond timestamps exactly.
+    """
+    # Arrange
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    base = stub_store.metadata.start
+    records = np.resize(stub_store.to_ndarray(), 10)
+    records["ts_recv"] = base + np.arange(10)
+    dbn_path = tmp_path / "test.dbn.zst"
+    dbn_path.write_bytes(
+        zstandard.ZstdCompressor().compress(
+            dbn_stub_data[: stub_store._metadata_length] + records.tobytes(),
+        ),
+    )
+    dbnstore = DBNStore.from_file(dbn_path)
+
+    # Act
+    actual = dbnstore.slice(start=base + 3, end=base + 5)
+
+    # Assert
+    assert actual["ts_recv"].tolist() == [base + 3, base + 4]
+
+
+def test_dbnstore_slice_uses_frame_index(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that DBNStore.slice reuses an existing frame index sidecar file.
+    """
+    # Arrange
+    dbn_path = tmp_path / "test.dbn.zst"
+    dbn_path.write_bytes(test_data(Dataset.GLBX_MDP3, Schema.MBO))
+    DBNStore.from_file(dbn_path).slice()
+    index_path = tmp_path / "test.dbn.zst.idx"
+    index_mtime = index_path.stat().st_mtime_ns
+
+    # Act
+    actual = DBNStore.from_file(dbn_path).slice()
+
+    # Assert
+    assert len(actual) == 4
+    assert index_path.stat().st_mtime_ns == index_mtime
+
+
+def test_dbnstore_slice_live_raises(
+    live_test_data_path: Path,
+) -> None:
+    """
+    Test that DBNStore.slice cannot be used with mixed DBN data.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=live_test_data_path)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        dbnstore.slice()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
+)
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        1,
+        3,
+    ],
+)
+def test_dbnstore_to_ndarray_with_filters(
+    schema: Schema,
+    test_data_path: Callable[[Dataset, Schema], Path],
+    count: int | None,
+) -> None:
+    """
+    Test that calling to_ndarray with filters produces the same records as
+    masking the unfiltered array.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, schema))
+    expected = dbnstore.to_ndarray()
+    ts_field = SCHEMA_STRUCT_MAP[schema]._ordered_fields[0]
+    start = int(expected[ts_field][len(expected) // 2])
+    instrument_id = int(expected["instrument_id"][0])
+    mask = (expected[ts_field] >= start) & (expected["instrument_id"] == instrument_id)
+
+    # Act
+    actual = dbnstore.to_ndarray(
+        count=count,
+        instrument_ids=[instrument_id],
+        start=start,
+        rtypes=np.unique(expected["rtype"]).tolist(),
+    )
+
+    # Assert
+    if count is not None:
+        batches = list(actual)
+        assert all(len(batch) <= count for batch in batches)
+        actual = np.concatenate(batches)
+    assert np.array_equal(actual, expected[mask])
+
+
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        2,
+    ],
+)
+def test_dbnstore_to_ndarray_with_filters_empty(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    count: int | None,
+) -> None:
+    """
+    Test that calling to_ndarray with filters that exclude every record
+    returns one empty ndarray.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
+
+    # Act
+    actual = dbnstore.to_ndarray(count=count, rtypes=RType.MBP_0)
+
+    # Assert
+    if count is not None:
+        assert len(next(actual)) == 0
+        with pytest.raises(StopIteration):
+            next(actual)
+    else:
+        assert len(actual) == 0
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.MBO,
+        Schema.STATISTICS,
+        Schema.DEFINITION,
+    ],
+)
+def test_dbnstore_to_ndarray_with_filters_live(
+    live_test_data_path: Path,
+    schema: Schema,
+) -> None:
+    """
+    Test that calling to_ndarray with filters on mixed DBN data produces the
+    same records as masking the unfiltered array.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(live_test_data_path)
+    expected = dbnstore.to_ndarray(schema=schema)
+    end = int(expected["ts_recv"][-1])
+
+    # Act
+    actual = dbnstore.to_ndarray(schema=schema, end=pd.Timestamp(end, tz="UTC"))
+
+    # Assert
+    assert actual.tolist() == expected[expected["ts_recv"] < end].tolist()
+
+
+def test_dbnstore_to_ndarray_with_count_empty(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    """
+    Test that calling to_ndarray on a DBNStore that contains no data with count
+    set returns an iterator for one empty ndarray.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.TRADES))
+
+    # Act
+    nd_iter = dbnstore.to_ndarray(
+        schema=Schema.MBO,
+        count=10,
+    )
+
+    # Assert
+    assert len(next(nd_iter)) == 0
+
+
+@pytest.mark.parametrize(
+    "schema, expected_count",
+    [
         (Schema.MBO, 5),
         (Schema.MBP_1, 2),
         (Schema.MBP_10, 2),
@@ -1362,47 +2280,504 @@ def test_dbnstore_to_ndarray_with_count_empty(
 def test_dbnstore_to_ndarray_with_schema_live(
     live_test_data_path: Path,
     schema: Schema,
-    expected_count: int,
+    expected_count: int,
+) -> None:
+    # Arrange
+    dbnstore = DBNStore.from_file(live_test_data_path)
+
+    # Act
+    array = dbnstore.to_ndarray(schema=schema)
+
+    # Assert
+    assert len(array) == expected_count
+
+
+def test_dbnstore_to_ndarray_with_schema_empty(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    """
+    Test that calling to_ndarray on a DBNStore that contains no data of the
+    specified schema returns an empty DataFrame.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.TRADES))
+
+    # Act
+    array = dbnstore.to_ndarray(schema=Schema.MBO)
+
+    # Assert
+    assert len(array) == 0
+
+
+def test_dbnstore_to_ndarray_with_schema_empty_live(
+    live_test_data_path: Path,
+) -> None:
+    """
+    Test that a schema must be specified for live data.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=live_test_data_path)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        dbnstore.to_ndarray()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.MBO,
+        Schema.STATISTICS,
+        Schema.DEFINITION,
+    ],
+)
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        7,
+    ],
+)
+def test_dbnstore_to_ndarray_live_runs(
+    monkeypatch: pytest.MonkeyPatch,
+    live_test_data: bytes,
+    schema: Schema,
+    count: int | None,
+) -> None:
+    """
+    Test that records of mixed data are located by their headers across
+    runs of records with the same length and across read boundaries.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "SCAN_READ_SIZE", 1000)
+    monkeypatch.setattr(databento.common.dbnstore, "SCAN_RUN_SIZE", 4)
+    dbn_stub_data = zstandard.ZstdDecompressor().stream_reader(live_test_data).read()
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    records = [bytes(record) for record in stub_store]
+    rng = np.random.default_rng(seed=42)
+    body = b"".join(
+        record * int(rng.integers(1, 40)) if rng.random() < 0.3 else record
+        for record in rng.choice(np.array(records, dtype=object), size=300)
+    )
+    dbnstore = DBNStore.from_bytes(dbn_stub_data[: stub_store._metadata_length] + body)
+    schema_rtype = RType.from_schema(schema)
+    expected = b"".join(bytes(r) for r in dbnstore if r.rtype == schema_rtype)
+
+    # Act
+    actual = dbnstore.to_ndarray(schema=schema, count=count)
+
+    # Assert
+    if count is not None:
+        actual = np.concatenate(list(actual))
+    assert actual.tobytes() == expected
+
+
+def test_dbnstore_split_by_schema_live(
+    monkeypatch: pytest.MonkeyPatch,
+    live_test_data_path: Path,
+) -> None:
+    """
+    Test that splitting live data by schema returns the same records as
+    `to_ndarray` for each schema.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "SCAN_READ_SIZE", 100)
+    dbnstore = DBNStore.from_file(path=live_test_data_path)
+
+    # Act
+    actual = dbnstore.split_by_schema()
+
+    # Assert
+    assert set(actual) == {
+        Schema.MBO,
+        Schema.MBP_1,
+        Schema.MBP_10,
+        Schema.TRADES,
+        Schema.OHLCV_1S,
+        Schema.OHLCV_1M,
+        Schema.DEFINITION,
+        Schema.STATISTICS,
+    }
+    for schema, records in actual.items():
+        assert np.array_equal(records, dbnstore.to_ndarray(schema))
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.MBO,
+        Schema.MBP_10,
+        Schema.DEFINITION,
+    ],
+)
+def test_dbnstore_split_by_schema(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    schema: Schema,
+) -> None:
+    """
+    Test that splitting data with a single schema returns all records.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, schema))
+
+    # Act
+    actual = dbnstore.split_by_schema()
+
+    # Assert
+    assert list(actual) == [schema]
+    assert np.array_equal(actual[schema], dbnstore.to_ndarray())
+
+
+def test_dbnstore_split_by_schema_truncated(
+    live_test_data: bytes,
+) -> None:
+    """
+    Test that splitting truncated data warns and returns the complete records.
+    """
+    # Arrange
+    dbn_stub_data = zstandard.ZstdDecompressor().stream_reader(live_test_data).read()
+    dbnstore = DBNStore.from_bytes(dbn_stub_data)
+    truncated_store = DBNStore.from_bytes(dbn_stub_data[:-8])
+
+    # Act
+    with pytest.warns(BentoWarning):
+        actual = truncated_store.split_by_schema()
+
+    # Assert
+    expected = dbnstore.split_by_schema()
+    assert sum(map(len, actual.values())) >= sum(map(len, expected.values())) - 1
+    for schema, records in actual.items():
+        assert np.array_equal(records, expected[schema][: len(records)])
+
+
+@pytest.mark.parametrize(
+    "chunk_size",
+    [
+        1,
+        7,
+        1000,
+    ],
+)
+def test_dbnstore_stats(
+    monkeypatch: pytest.MonkeyPatch,
+    test_data: Callable[[Dataset, Schema], bytes],
+    chunk_size: int,
+) -> None:
+    """
+    Test that the statistics of each instrument computed over chunks match a
+    pandas groupby over all records.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "STATS_CHUNK_SIZE", chunk_size)
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    rng = np.random.default_rng(seed=42)
+    records = np.resize(stub_store.to_ndarray(), 100)
+    records["instrument_id"] = rng.integers(0, 5, size=100)
+    records["ts_recv"] = stub_store.metadata.start + np.cumsum(rng.integers(0, 100, size=100))
+    records["price"] = rng.integers(1, 100, size=100) * databento.common.dbnstore.FIXED_PRICE_SCALE
+    records["price"][::10] = databento.common.dbnstore.UNDEF_PRICE
+    records["action"] = rng.choice([b"A", b"C", b"T"], size=100)
+    dbnstore = DBNStore.from_bytes(dbn_stub_data[: stub_store._metadata_length] + records.tobytes())
+
+    # Act
+    actual = dbnstore.stats(gap_threshold=150, pretty_ts=False)
+
+    # Assert
+    df = pd.DataFrame(
+        {
+            "instrument_id": records["instrument_id"],
+            "ts": records["ts_recv"].astype(np.int64),
+            "price": np.where(
+                records["price"] == databento.common.dbnstore.UNDEF_PRICE,
+                np.nan,
+                records["price"] / databento.common.dbnstore.FIXED_PRICE_SCALE,
+            ),
+            "volume": np.where(records["action"] == b"T", records["size"], 0),
+        },
+    )
+    df["gap"] = df["ts"] - df.groupby("instrument_id")["ts"].shift(fill_value=0)
+    df.loc[~df["instrument_id"].duplicated(), "gap"] = 0
+    grouped = df.groupby("instrument_id")
+    assert actual.index.tolist() == sorted(df["instrument_id"].unique())
+    assert actual["count"].tolist() == grouped.size().tolist()
+    assert actual["first_ts"].tolist() == grouped["ts"].min().tolist()
+    assert actual["last_ts"].tolist() == grouped["ts"].max().tolist()
+    assert actual["min_price"].tolist() == grouped["price"].min().tolist()
+    assert actual["max_price"].tolist() == grouped["price"].max().tolist()
+    assert actual["volume"].tolist() == grouped["volume"].sum().tolist()
+    assert actual["max_gap"].tolist() == grouped["gap"].max().tolist()
+    expected_gaps = (df["gap"] > 150).groupby(df["instrument_id"]).sum()
+    assert actual["num_gaps"].tolist() == expected_gaps.tolist()
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.OHLCV_1M,
+        Schema.DEFINITION,
+    ],
+)
+def test_dbnstore_stats_columns(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    schema: Schema,
+) -> None:
+    """
+    Test that the price and volume columns are only present for schemas with
+    those fields.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, schema))
+    df = dbnstore.to_df(price_type="float")
+
+    # Act
+    actual = dbnstore.stats()
+
+    # Assert
+    assert actual["count"].sum() == len(df)
+    assert actual["first_ts"].min() == df.index.min()
+    assert actual["last_ts"].max() == df.index.max()
+    if schema == Schema.OHLCV_1M:
+        assert actual["min_price"].min() == df["low"].min()
+        assert actual["max_price"].max() == df["high"].max()
+        assert actual["volume"].sum() == df["volume"].sum()
+    else:
+        assert "min_price" not in actual
+        assert "volume" not in actual
+    assert "num_gaps" not in actual
+
+
+def test_dbnstore_stats_mixed_schema(
+    live_test_data_path: Path,
+) -> None:
+    """
+    Test that computing statistics of mixed data without a schema raises a
+    ValueError.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=live_test_data_path)
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        dbnstore.stats()
+
+    assert dbnstore.stats(Schema.MBO)["count"].sum() == len(dbnstore.to_ndarray(Schema.MBO))
+
+
+@pytest.mark.parametrize(
+    "price_field",
+    [
+        "price",
+        "bid_px_00",
+    ],
+)
+@pytest.mark.parametrize(
+    "chunk_size",
+    [
+        1,
+        7,
+        1000,
+    ],
+)
+def test_dbnstore_resample(
+    monkeypatch: pytest.MonkeyPatch,
+    test_data: Callable[[Dataset, Schema], bytes],
+    price_field: str,
+    chunk_size: int,
+) -> None:
+    """
+    Test that bars resampled over chunks match a pandas groupby over all
+    records.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "RESAMPLE_CHUNK_SIZE", chunk_size)
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor()
+        .stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBP_1))
+        .read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    rng = np.random.default_rng(seed=42)
+    records = np.resize(stub_store.to_ndarray(), 200)
+    records["instrument_id"] = rng.integers(0, 3, size=200)
+    records["ts_event"] = stub_store.metadata.start + np.sort(rng.integers(0, 10**10, size=200))
+    records["ts_recv"] = records["ts_event"] + 1000
+    records["action"] = rng.choice([b"A", b"C", b"T"], size=200)
+    records["price"] = rng.integers(1, 100, size=200) * databento.common.dbnstore.FIXED_PRICE_SCALE
+    records["size"] = rng.integers(1, 10, size=200)
+    records["bid_px_00"] = records["price"] + databento.common.dbnstore.FIXED_PRICE_SCALE
+    records[price_field][::9] = databento.common.dbnstore.UNDEF_PRICE
+    dbnstore = DBNStore.from_bytes(dbn_stub_data[: stub_store._metadata_length] + records.tobytes())
+
+    # Act
+    actual = dbnstore.resample("1s", price_field=price_field, map_symbols=False)
+
+    # Assert
+    df = dbnstore.to_df(map_symbols=False).reset_index()
+    df["ts_event"] = df["ts_event"].dt.floor("1s")
+    trades = df[(df["action"] == "T") & df["price"].notna()]
+    ohlc_records = trades if price_field == "price" else df[df[price_field].notna()]
+    ohlc = ohlc_records.groupby(["ts_event", "instrument_id"])[price_field].agg(
+        ["first", "max", "min", "last"],
+    )
+    ohlc.columns = ["open", "high", "low", "close"]
+    volume = trades.groupby(["ts_event", "instrument_id"])["size"].sum().rename("volume")
+    keys = [trades["ts_event"], trades["instrument_id"]]
+    notional = (trades["price"] * trades["size"]).groupby(keys).sum()
+    expected = ohlc.join(volume, how="outer").reset_index(level="instrument_id")
+    expected["volume"] = expected["volume"].fillna(0).astype(np.uint64)
+    expected["vwap"] = (notional / volume).reindex(ohlc.index.union(volume.index)).to_numpy()
+    pd.testing.assert_frame_equal(actual, expected, check_dtype=False, check_freq=False)
+
+
+def test_dbnstore_resample_by_none(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    """
+    Test that resampling without `by` computes bars over all records and that
+    fixed prices are preserved.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.TRADES))
+    df = dbnstore.to_df(price_type="fixed")
+
+    # Act
+    actual = dbnstore.resample(10**10, by=None, price_type="fixed", pretty_ts=False)
+
+    # Assert
+    assert list(actual.columns) == ["open", "high", "low", "close", "volume", "vwap"]
+    assert actual.index.tolist() == [df["ts_event"].iloc[0].value // 10**10 * 10**10]
+    assert actual["open"].iloc[0] == df["price"].iloc[0]
+    assert actual["high"].iloc[0] == df["price"].max()
+    assert actual["low"].iloc[0] == df["price"].min()
+    assert actual["close"].iloc[0] == df["price"].iloc[-1]
+    assert actual["volume"].iloc[0] == df["size"].sum()
+
+
+@pytest.mark.parametrize(
+    "schema, kwargs",
+    [
+        (Schema.OHLCV_1M, {}),
+        (Schema.TRADES, {"price_field": "size"}),
+        (Schema.TRADES, {"by": "action"}),
+        (Schema.TRADES, {"freq": "0s"}),
+    ],
+)
+def test_dbnstore_resample_invalid(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    schema: Schema,
+    kwargs: dict[str, Any],
 ) -> None:
+    """
+    Test that resampling with an invalid schema, field, or frequency raises a
+    ValueError.
+    """
     # Arrange
-    dbnstore = DBNStore.from_file(live_test_data_path)
-
-    # Act
-    array = dbnstore.to_ndarray(schema=schema)
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, schema))
 
-    # Assert
-    assert len(array) == expected_count
+    # Act, Assert
+    with pytest.raises(ValueError):
+        dbnstore.resample(**{"freq": "1s", **kwargs})
 
 
-def test_dbnstore_to_ndarray_with_schema_empty(
-    test_data_path: Callable[[Dataset, Schema], Path],
+@pytest.mark.parametrize(
+    "depth, schema",
+    [
+        (1, Schema.MBP_1),
+        (3, Schema.MBP_10),
+        (10, Schema.MBP_10),
+    ],
+)
+@pytest.mark.parametrize(
+    "batch_size",
+    [
+        1,
+        2**12,
+    ],
+)
+def test_dbnstore_to_mbp(
+    monkeypatch: pytest.MonkeyPatch,
+    test_data: Callable[[Dataset, Schema], bytes],
+    depth: int,
+    schema: Schema,
+    batch_size: int,
 ) -> None:
     """
-    Test that calling to_ndarray on a DBNStore that contains no data of the
-    specified schema returns an empty DataFrame.
+    Test that MBO data is sampled into MBP records of the book of each
+    instrument at every interval.
     """
     # Arrange
-    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.TRADES))
+    monkeypatch.setattr(databento.common.dbnstore, "MBP_BATCH_SIZE", batch_size)
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    rng = np.random.default_rng(seed=42)
+    records = np.resize(stub_store.to_ndarray(), 100)
+    records["instrument_id"] = rng.integers(0, 2, size=100)
+    records["order_id"] = np.arange(100)
+    records["action"] = b"A"
+    records["side"] = rng.choice([b"A", b"B"], size=100)
+    records["price"] = rng.integers(1, 20, size=100) * databento.common.dbnstore.FIXED_PRICE_SCALE
+    records["ts_recv"] = stub_store.metadata.start + np.arange(100) * 10**6
+    dbnstore = DBNStore.from_bytes(dbn_stub_data[: stub_store._metadata_length] + records.tobytes())
 
     # Act
-    array = dbnstore.to_ndarray(schema=Schema.MBO)
+    actual = dbnstore.to_mbp(depth=depth, interval="10ms")
 
     # Assert
-    assert len(array) == 0
+    assert actual.dtype == np.dtype(SCHEMA_STRUCT_MAP[schema]._dtypes)
+    assert len(actual) == 2 * 10
+    assert np.all(actual["length"] == actual.dtype.itemsize // 4)
+    assert np.all(actual["rtype"] == RType.from_schema(schema))
+    assert np.all(actual["action"] == b"N")
+    assert np.all(actual["price"] == databento.common.dbnstore.UNDEF_PRICE)
+    for row in actual:
+        ts_recv, instrument_id = row["ts_recv"], row["instrument_id"]
+        is_applied = (records["ts_recv"] < ts_recv) & (records["instrument_id"] == instrument_id)
+        applied = records[is_applied]
+        assert row["sequence"] == applied["sequence"][-1]
+        bids = np.unique(applied["price"][applied["side"] == b"B"])[::-1]
+        asks = np.unique(applied["price"][applied["side"] == b"A"])
+        for index in range(depth):
+            bid_px = bids[index] if index < len(bids) else databento.common.dbnstore.UNDEF_PRICE
+            ask_px = asks[index] if index < len(asks) else databento.common.dbnstore.UNDEF_PRICE
+            assert row[f"bid_px_{index:02d}"] == bid_px
+            assert row[f"ask_px_{index:02d}"] == ask_px
+            is_bid = (applied["price"] == bid_px) & (applied["side"] == b"B")
+            assert row[f"bid_sz_{index:02d}"] == applied["size"][is_bid].sum()
+            assert row[f"bid_ct_{index:02d}"] == is_bid.sum()
+    if schema == Schema.MBP_10:
+        for index in range(depth, 10):
+            assert np.all(actual[f"bid_px_{index:02d}"] == databento.common.dbnstore.UNDEF_PRICE)
+            assert np.all(actual[f"bid_sz_{index:02d}"] == 0)
 
 
-def test_dbnstore_to_ndarray_with_schema_empty_live(
-    live_test_data_path: Path,
+@pytest.mark.parametrize(
+    "schema, kwargs",
+    [
+        (Schema.MBO, {"depth": 0}),
+        (Schema.MBO, {"depth": 11}),
+        (Schema.MBO, {"interval": "-1s"}),
+        (Schema.MBP_10, {}),
+    ],
+)
+def test_dbnstore_to_mbp_invalid(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    schema: Schema,
+    kwargs: dict[str, Any],
 ) -> None:
     """
-    Test that a schema must be specified for live data.
+    Test that an invalid depth, interval, or schema raises a ValueError.
     """
     # Arrange
-    dbnstore = DBNStore.from_file(path=live_test_data_path)
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, schema))
 
     # Act, Assert
     with pytest.raises(ValueError):
-        dbnstore.to_ndarray()
+        dbnstore.to_mbp(**kwargs)
 
 
 @pytest.mark.parametrize(
@@ -1478,6 +2853,151 @@ def test_dbnstore_to_df_with_schema_live(
     assert len(df) == expected_count
 
 
+@pytest.mark.parametrize(
+    "schema",
+    [pytest.param(schema, id=str(schema)) for schema in Schema.variants()],
+)
+@pytest.mark.parametrize(
+    "map_symbols",
+    [
+        True,
+        False,
+    ],
+)
+@pytest.mark.parametrize(
+    "price_type",
+    [
+        "fixed",
+        "float",
+        "decimal",
+    ],
+)
+def test_dbnstore_to_df_with_columns(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    schema: Schema,
+    map_symbols: bool,
+    price_type: str,
+) -> None:
+    """
+    Test that calling to_df with columns produces the same DataFrame as
+    selecting the columns from the full DataFrame.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, schema))
+    columns = list(SCHEMA_STRUCT_MAP[schema]._ordered_fields[-1:0:-2])
+    expected = dbnstore.to_df(price_type=price_type, map_symbols=map_symbols)
+    if map_symbols:
+        expected = expected[[*columns, "symbol"]]
+    else:
+        expected = expected[columns]
+
+    # Act
+    actual = dbnstore.to_df(
+        price_type=price_type,
+        map_symbols=map_symbols,
+        columns=columns,
+    )
+
+    # Assert
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_dbnstore_to_df_with_columns_invalid(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    """
+    Test that calling to_df with a column not in the schema raises a
+    ValueError.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="bid_px_00"):
+        dbnstore.to_df(columns=["price", "bid_px_00"])
+
+
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        1,
+    ],
+)
+def test_dbnstore_to_ndarray_with_columns(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    count: int | None,
+) -> None:
+    """
+    Test that calling to_ndarray with columns returns views with only the
+    requested fields.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBP_10))
+    columns = ["bid_px_00", "ts_recv", "ask_sz_09"]
+    expected = dbnstore.to_ndarray()
+
+    # Act
+    actual = dbnstore.to_ndarray(count=count, columns=columns)
+
+    # Assert
+    if count is not None:
+        actual = np.concatenate(list(actual))
+    assert actual.dtype.names == tuple(columns)
+    for column in columns:
+        assert np.array_equal(actual[column], expected[column])
+
+
+def test_dbnstore_to_ndarray_with_columns_invalid(
+    test_data_path: Callable[[Dataset, Schema], Path],
+) -> None:
+    """
+    Test that calling to_ndarray with a field not in the schema raises a
+    ValueError.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="symbol"):
+        dbnstore.to_ndarray(columns=["symbol"])
+
+
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        1,
+    ],
+)
+def test_dbnstore_to_df_with_filters(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    count: int | None,
+) -> None:
+    """
+    Test that calling to_df with filters produces the same DataFrame as
+    filtering the unfiltered DataFrame.
+    """
+    # Arrange
+    dbnstore = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.OHLCV_1S))
+    expected = dbnstore.to_df()
+    start = expected.index[1]
+    end = expected.index[3]
+
+    # Act
+    actual = dbnstore.to_df(
+        count=count,
+        instrument_ids=int(expected["instrument_id"].iloc[0]),
+        start=start,
+        end=end,
+    )
+
+    # Assert
+    if count is not None:
+        actual = pd.concat(actual)
+    pd.testing.assert_frame_equal(actual, expected.loc[start:end].iloc[:-1])
+
+
 def test_dbnstore_to_df_with_schema_empty(
     test_data_path: Callable[[Dataset, Schema], Path],
 ) -> None:
@@ -1821,3 +3341,237 @@ def test_dbnstore_transcode_truncated_live_dbn(
 
     with pytest.warns(BentoWarning):
         truncated_store.to_parquet(tmp_path / "truncated.parquet", schema=Schema.STATISTICS)
+
+
+@pytest.fixture(name="merge_paths")
+def fixture_merge_paths(
+    test_data: Callable[[Dataset, Schema], bytes],
+    tmp_path: Path,
+) -> list[Path]:
+    """
+    Fixture for three MBO DBN files with interleaved and tied `ts_recv`
+    timestamps, where each file has a distinct `publisher_id`.
+    """
+    dbn_stub_data = (
+        zstandard.ZstdDecompressor().stream_reader(test_data(Dataset.GLBX_MDP3, Schema.MBO)).read()
+    )
+    stub_store = DBNStore.from_bytes(dbn_stub_data)
+    rng = np.random.default_rng(seed=42)
+
+    paths = []
+    for index, size in enumerate([100, 37, 0]):
+        records = np.resize(stub_store.to_ndarray(), size)
+        records["ts_recv"] = stub_store.metadata.start + np.sort(rng.integers(0, 200, size=size))
+        records["publisher_id"] = index
+        records["order_id"] = np.arange(size)
+        path = tmp_path / f"test_{index}.dbn.zst"
+        path.write_bytes(
+            zstandard.ZstdCompressor().compress(
+                dbn_stub_data[: stub_store._metadata_length] + records.tobytes(),
+            ),
+        )
+        paths.append(path)
+
+    return paths
+
+
+@pytest.mark.parametrize(
+    "count",
+    [
+        None,
+        1,
+        10,
+        1000,
+    ],
+)
+def test_merged_dbnstore_to_ndarray(
+    monkeypatch: pytest.MonkeyPatch,
+    merge_paths: list[Path],
+    count: int | None,
+) -> None:
+    """
+    Test that merging DBN files yields all records in timestamp order with the
+    order of each file preserved.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "MERGE_CHUNK_SIZE", 7)
+    stores = [DBNStore.from_file(path) for path in merge_paths]
+    expected = np.concatenate([store.to_ndarray().reshape(-1) for store in stores])
+
+    # Act
+    merged = DBNStore.merge(merge_paths)
+    actual = merged.to_ndarray(count=count)
+
+    # Assert
+    if count is not None:
+        batches = list(actual)
+        assert all(0 < len(batch) <= count for batch in batches)
+        actual = np.concatenate(batches)
+    assert isinstance(merged, MergedDBNStore)
+    assert len(actual) == len(expected)
+    assert np.all(np.diff(actual["ts_recv"].astype(np.int64)) >= 0)
+    for index, store in enumerate(stores):
+        assert np.array_equal(
+            actual[actual["publisher_id"] == index],
+            store.to_ndarray().reshape(-1),
+        )
+
+
+def test_merged_dbnstore_to_ndarray_with_filters(
+    monkeypatch: pytest.MonkeyPatch,
+    merge_paths: list[Path],
+) -> None:
+    """
+    Test that filters are applied to each merged file.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "MERGE_CHUNK_SIZE", 7)
+    merged = DBNStore.merge(merge_paths)
+    expected = merged.to_ndarray()
+
+    # Act
+    start = merged.metadata.start + 50
+    end = merged.metadata.start + 150
+    actual = merged.to_ndarray(rtypes=RType.MBO, start=start, end=end)
+
+    # Assert
+    mask = (expected["ts_recv"] >= start) & (expected["ts_recv"] < end)
+    assert np.array_equal(actual, expected[mask])
+
+
+@pytest.mark.parametrize(
+    "compression",
+    [
+        Compression.NONE,
+        Compression.ZSTD,
+    ],
+)
+def test_merged_dbnstore_to_file(
+    monkeypatch: pytest.MonkeyPatch,
+    merge_paths: list[Path],
+    tmp_path: Path,
+    compression: Compression,
+) -> None:
+    """
+    Test that merged data written to a DBN file can be read back.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "MERGE_CHUNK_SIZE", 7)
+    merged = DBNStore.merge(merge_paths)
+    dbn_path = tmp_path / "merged.dbn"
+
+    # Act
+    merged.to_file(dbn_path, compression=compression)
+    actual = DBNStore.from_file(dbn_path)
+
+    # Assert
+    assert actual.compression == compression
+    assert actual.schema == merged.schema
+    assert actual.metadata.mappings == merged.metadata.mappings
+    assert np.array_equal(actual.to_ndarray(), merged.to_ndarray())
+
+
+def test_merged_dbnstore_to_df_and_to_parquet(
+    monkeypatch: pytest.MonkeyPatch,
+    merge_paths: list[Path],
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the merged data converted to a DataFrame and a parquet file
+    matches the merged DBN file.
+    """
+    # Arrange
+    monkeypatch.setattr(databento.common.dbnstore, "MERGE_CHUNK_SIZE", 7)
+    monkeypatch.setattr(databento.common.dbnstore, "PARQUET_CHUNK_SIZE", 16)
+    merged = DBNStore.merge(merge_paths)
+    dbn_path = tmp_path / "merged.dbn"
+    parquet_path = tmp_path / "merged.parquet"
+    merged.to_file(dbn_path)
+    expected = DBNStore.from_file(dbn_path).to_df()
+
+    # Act
+    merged.to_parquet(parquet_path)
+    df = merged.to_df()
+    df_chunks = list(merged.to_df(count=16))
+
+    # Assert
+    pd.testing.assert_frame_equal(df, expected)
+    pd.testing.assert_frame_equal(pd.concat(df_chunks), expected)
+    pd.testing.assert_frame_equal(pd.read_parquet(parquet_path), expected)
+
+
+@pytest.mark.parametrize(
+    "schema",
+    [
+        Schema.TRADES,
+        Schema.MBP_1,
+    ],
+)
+def test_merged_dbnstore_different_schema(
+    test_data_path: Callable[[Dataset, Schema], Path],
+    schema: Schema,
+) -> None:
+    """
+    Test that merging DBN files of different schemas raises a ValueError.
+    """
+    # Arrange
+    paths = [
+        test_data_path(Dataset.GLBX_MDP3, Schema.MBO),
+        test_data_path(Dataset.GLBX_MDP3, schema),
+    ]
+
+    # Act, Assert
+    with pytest.raises(ValueError, match="schema"):
+        DBNStore.merge(paths)
+
+
+@pytest.mark.parametrize(
+    "has_end",
+    [
+        False,
+        True,
+    ],
+)
+def test_merged_dbnstore_metadata(
+    test_data: Callable[[Dataset, Schema], bytes],
+    has_end: bool,
+) -> None:
+    """
+    Test that the metadata of merged DBN files spans every file, and has no
+    end when any file has no end.
+    """
+    # Arrange
+    store = DBNStore.from_bytes(test_data(Dataset.GLBX_MDP3, Schema.MBO))
+    metadata = store.metadata
+    end = metadata.end + 1 if has_end else None
+    other_metadata = databento_dbn.Metadata(
+        dataset=metadata.dataset,
+        start=metadata.start,
+        stype_in=metadata.stype_in,
+        stype_out=metadata.stype_out,
+        schema=Schema.MBO,
+        symbols=["NQH1"],
+        end=end,
+        ts_out=metadata.ts_out,
+        version=metadata.version,
+    )
+    other = DBNStore.from_bytes(other_metadata.encode() + store.to_ndarray().tobytes())
+
+    # Act
+    merged = MergedDBNStore([store, other])
+
+    # Assert
+    assert merged.metadata.start == metadata.start
+    assert merged.metadata.end == end
+    assert merged.metadata.schema == Schema.MBO
+    assert merged.metadata.symbols == [*metadata.symbols, "NQH1"]
+    assert merged.metadata.mappings == metadata.mappings
+
+
+def test_merged_dbnstore_empty() -> None:
+    """
+    Test that merging no DBN files raises a ValueError.
+    """
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        DBNStore.merge([])
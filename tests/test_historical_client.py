@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 import pathlib
 from collections.abc import Callable
 from unittest.mock import MagicMock
@@ -102,13 +103,129 @@ def test_custom_gateway_force_https(
     assert client.gateway == expected
 
 
+def test_http_session_shared_between_requests(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that the requests of every endpoint of a client use the same
+    session, with a connection pool of `pool_size`.
+    """
+    # Arrange
+    sessions: list[requests.Session] = []
+
+    def get(self: requests.Session, **kwargs: object) -> MagicMock:
+        sessions.append(self)
+        return MagicMock()
+
+    monkeypatch.setattr(requests.Session, "get", get)
+    client = db.Historical(key="DUMMY_API_KEY", pool_size=4)
+
+    # Act
+    client.metadata.list_datasets()
+    client.metadata.list_schemas("GLBX.MDP3")
+    client.batch.list_jobs()
+
+    # Assert
+    assert len(sessions) == 3
+    assert all(session is sessions[0] for session in sessions)
+    assert sessions[0].get_adapter(client.gateway)._pool_maxsize == 4  # type: ignore [attr-defined]
+    assert client.symbology._session is client.timeseries._session
+
+
+def test_http_session_close(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """
+    Test that exiting the client context closes its session.
+    """
+    # Arrange
+    monkeypatch.setattr(requests.Session, "close", mocked_close := MagicMock())
+
+    # Act
+    with db.Historical(key="DUMMY_API_KEY") as client:
+        pass
+
+    # Assert
+    assert isinstance(client, Historical)
+    mocked_close.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_http_session_async_reused() -> None:
+    """
+    Test that asynchronous requests in the same event loop use the same
+    session, which is closed with the client.
+    """
+    # Arrange
+    client = db.Historical(key="DUMMY_API_KEY")
+
+    # Act
+    first = await client.timeseries._session.get_async_session()
+    second = await client.metadata._session.get_async_session()
+    connector = first.connector
+    await client.aclose()
+
+    # Assert
+    assert first is second
+    assert first.closed
+    assert connector is not None
+    assert connector.limit == 0
+    assert connector.limit_per_host == 0
+
+
+def test_http_session_async_closed_with_event_loop() -> None:
+    """
+    Test that the asynchronous session of an event loop is closed when the
+    loop shuts down, and that a new loop gets a new session.
+    """
+    # Arrange
+    client = db.Historical(key="DUMMY_API_KEY")
+
+    # Act
+    first = asyncio.run(client.timeseries._session.get_async_session())
+    second = asyncio.run(client.timeseries._session.get_async_session())
+
+    # Assert
+    assert first is not second
+    assert first.closed
+    assert second.closed
+
+
+@pytest.mark.asyncio
+async def test_http_session_close_in_event_loop() -> None:
+    """
+    Test that closing the client within an event loop closes its
+    asynchronous session in the background.
+    """
+    # Arrange
+    client = db.Historical(key="DUMMY_API_KEY")
+    session = await client.timeseries._session.get_async_session()
+
+    # Act
+    client.close()
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+    # Assert
+    assert session.closed
+
+
+def test_http_session_invalid_pool_size() -> None:
+    """
+    Test that a non-positive `pool_size` raises a ValueError.
+    """
+    # Arrange, Act, Assert
+    with pytest.raises(ValueError):
+        db.Historical(key="DUMMY_API_KEY", pool_size=0)
+
+
 def test_re_request_symbology_makes_expected_request(
     test_data_path: Callable[[Dataset, Schema], pathlib.Path],
     monkeypatch: pytest.MonkeyPatch,
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     bento = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
 
@@ -140,7 +257,7 @@ def test_request_full_definitions_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     # Create an MBO bento
     bento = DBNStore.from_file(path=test_data_path(Dataset.GLBX_MDP3, Schema.MBO))
@@ -176,3 +293,51 @@ def test_request_full_definitions_expected_request(
     assert call["timeout"] == (100, 100)
     assert isinstance(call["auth"], requests.auth.HTTPBasicAuth)
     assert len(stream_bytes) == definition_bento.nbytes
+
+
+def test_symbology_resolve_batches_symbols(
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+) -> None:
+    """
+    Test that resolving more than 2,000 symbols makes requests of at most
+    2,000 symbols, of which the results are merged.
+    """
+
+    # Arrange
+    def post(**kwargs: dict[str, str]) -> MagicMock:
+        symbols = kwargs["data"]["symbols"].split(",")
+        response = MagicMock()
+        response.__enter__.return_value.json.return_value = {
+            "result": {s: [{"d0": "2020-12-28", "d1": "2020-12-29", "s": s}] for s in symbols},
+            "symbols": symbols,
+            "stype_in": "raw_symbol",
+            "stype_out": "instrument_id",
+            "start_date": "2020-12-28",
+            "end_date": "2020-12-29",
+            "partial": [],
+            "not_found": symbols[:1] if len(symbols) < 2000 else [],
+            "message": "Not found" if len(symbols) < 2000 else "OK",
+            "status": 2 if len(symbols) < 2000 else 0,
+        }
+        return response
+
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock(side_effect=post))
+    symbols = [f"SYM{i}" for i in range(4001)]
+
+    # Act
+    result = historical_client.symbology.resolve(
+        dataset="GLBX.MDP3",
+        symbols=symbols,
+        stype_in="raw_symbol",
+        stype_out="instrument_id",
+        start_date="2020-12-28",
+    )
+
+    # Assert
+    assert mocked_post.call_count == 3
+    assert sorted(result["symbols"]) == sorted(symbols)
+    assert sorted(result["result"]) == sorted(symbols)
+    assert result["not_found"] == ["SYM4000"]
+    assert result["status"] == 2
+    assert result["message"] == "Not found"
@@ -15,7 +15,7 @@ def test_list_publishers_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.list_publishers()
@@ -35,7 +35,7 @@ def test_list_datasets_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.list_datasets(
@@ -60,7 +60,7 @@ def test_list_schemas_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.list_schemas(dataset="GLBX.MDP3")
@@ -81,7 +81,7 @@ def test_list_fields_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.list_fields(
@@ -114,7 +114,7 @@ def test_list_unit_price_sends_expected_request(
     dataset: Dataset | str,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.list_unit_prices(dataset=dataset)
@@ -137,7 +137,7 @@ def test_get_dataset_condition_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.get_dataset_condition(
@@ -167,7 +167,7 @@ def test_get_dataset_range_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "get", mocked_get := MagicMock())
+    monkeypatch.setattr(requests.Session, "get", mocked_get := MagicMock())
 
     # Act
     historical_client.metadata.get_dataset_range(dataset="GLBX.MDP3")
@@ -192,7 +192,7 @@ def test_get_record_count_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     # Act
     historical_client.metadata.get_record_count(
@@ -228,7 +228,7 @@ def test_get_billable_size_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     # Act
     historical_client.metadata.get_billable_size(
@@ -267,7 +267,7 @@ def test_get_cost_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     # Act
     historical_client.metadata.get_cost(
@@ -297,3 +297,84 @@ def test_get_cost_sends_expected_request(
     }
     assert call["timeout"] == (100, 100)
     assert isinstance(call["auth"], requests.auth.HTTPBasicAuth)
+
+
+@pytest.mark.parametrize(
+    "method, limit, expected",
+    [
+        ["get_record_count", None, 4500],
+        ["get_record_count", 1000, 1000],
+        ["get_billable_size", None, 4500],
+        ["get_cost", None, 4500],
+    ],
+)
+def test_metadata_batches_symbols(
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+    method: str,
+    limit: int | None,
+    expected: int,
+) -> None:
+    """
+    Test that more than 2,000 symbols are split into requests of at most
+    2,000 symbols, of which the results are summed.
+    """
+
+    # Arrange
+    def post(**kwargs: dict[str, str]) -> MagicMock:
+        response = MagicMock()
+        response.__enter__.return_value.json.return_value = len(
+            kwargs["data"]["symbols"].split(","),
+        )
+        return response
+
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock(side_effect=post))
+    symbols = [f"SYM{i}" for i in range(4500)]
+
+    # Act
+    result = getattr(historical_client.metadata, method)(
+        dataset="GLBX.MDP3",
+        symbols=symbols,
+        schema="mbo",
+        start="2020-12-28T12:00",
+        end="2020-12-29",
+        limit=limit,
+    )
+
+    # Assert
+    batches = [call.kwargs["data"]["symbols"].split(",") for call in mocked_post.call_args_list]
+    assert sorted(map(len, batches)) == [500, 2000, 2000]
+    assert sorted(sum(batches, [])) == sorted(symbols)
+    assert result == expected
+
+
+@pytest.mark.parametrize(
+    "method",
+    [
+        "get_billable_size",
+        "get_cost",
+    ],
+)
+def test_metadata_batches_symbols_with_limit(
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+    method: str,
+) -> None:
+    """
+    Test that a `limit` with more than 2,000 symbols raises a ValueError for
+    results which cannot be limited after they are summed.
+    """
+    # Arrange
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        getattr(historical_client.metadata, method)(
+            dataset="GLBX.MDP3",
+            symbols=[f"SYM{i}" for i in range(2001)],
+            schema="mbo",
+            start="2020-12-28T12:00",
+            end="2020-12-29",
+            limit=10,
+        )
+    mocked_post.assert_not_called()
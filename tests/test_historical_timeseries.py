@@ -1,9 +1,13 @@
+import threading
 from collections.abc import Callable
 from pathlib import Path
 from unittest.mock import MagicMock
 
+import numpy as np
+import pandas as pd
 import pytest
 import requests
+from databento_dbn import Metadata
 from databento_dbn import Schema
 
 import databento as db
@@ -70,7 +74,7 @@ def test_get_range_error_no_file_write(
             return_value={},
         ),
     )
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mocked_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mocked_response))
 
     output_file = tmp_path / "output.dbn"
 
@@ -96,7 +100,7 @@ def test_get_range_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
     stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
 
     monkeypatch.setattr(
@@ -142,7 +146,7 @@ def test_get_range_with_limit_sends_expected_request(
     historical_client: Historical,
 ) -> None:
     # Arrange
-    monkeypatch.setattr(requests, "post", mocked_post := MagicMock())
+    monkeypatch.setattr(requests.Session, "post", mocked_post := MagicMock())
 
     # Mock from_bytes with the definition stub
     stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
@@ -182,3 +186,475 @@ def test_get_range_with_limit_sends_expected_request(
     }
     assert call["timeout"] == (100, 100)
     assert isinstance(call["auth"], requests.auth.HTTPBasicAuth)
+
+
+def test_get_range_stream_sends_expected_request(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+) -> None:
+    """
+    Test that a streamed request decodes the records of the response
+    content as it is iterated and then closes the response.
+    """
+    # Arrange
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
+    mocked_response = MagicMock(
+        status_code=200,
+        headers={},
+        iter_content=MagicMock(
+            return_value=(stream_bytes[i : i + 10] for i in range(0, len(stream_bytes), 10)),
+        ),
+    )
+    mocked_response.__enter__.return_value = mocked_response
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        mocked_post := MagicMock(return_value=mocked_response),
+    )
+
+    # Act
+    stream = historical_client.timeseries.get_range_stream(
+        dataset="GLBX.MDP3",
+        symbols="ESH1",
+        schema="trades",
+        start="2020-12-28T12:00",
+        end="2020-12-29",
+    )
+    records = list(stream)
+
+    # Assert
+    call = mocked_post.call_args.kwargs
+    assert call["url"] == f"{historical_client.gateway}/v{db.API_VERSION}/timeseries.get_range"
+    assert call["data"]["schema"] == "trades"
+    assert call["stream"] is True
+    assert isinstance(call["auth"], requests.auth.HTTPBasicAuth)
+    assert records == list(DBNStore.from_bytes(stream_bytes))
+    mocked_response.__exit__.assert_called_once()
+
+
+def test_get_range_stream_error_raised_on_request(
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+) -> None:
+    """
+    Test that an HTTP error is raised when the stream is requested, rather
+    than when it is first read, and the response is closed.
+    """
+    # Arrange
+    mocked_response = MagicMock(
+        status_code=500,
+        headers={},
+        json=MagicMock(return_value={}),
+    )
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mocked_response))
+
+    # Act
+    with pytest.raises(BentoServerError):
+        historical_client.timeseries.get_range_stream(
+            dataset="GLBX.MDP3",
+            symbols="ESH1",
+            schema="trades",
+            start="2020-12-28T12:00",
+            end="2020-12-29",
+        )
+
+    # Assert
+    mocked_response.close.assert_called_once()
+
+
+def shard_store(
+    stream_bytes: bytes,
+    data: dict[str, object | None],
+) -> DBNStore:
+    """
+    Return the records of `stream_bytes` in the range of the request `data`.
+    """
+    store = DBNStore.from_bytes(stream_bytes)
+    start = pd.Timestamp(str(data["start"])).value
+    end = pd.Timestamp(str(data["end"])).value
+    records = store.to_ndarray()
+    records = records[(records["ts_recv"] >= start) & (records["ts_recv"] < end)]
+    metadata = store.metadata
+    return DBNStore.from_bytes(
+        bytes(
+            Metadata(
+                dataset=metadata.dataset,
+                start=start,
+                stype_in=metadata.stype_in,
+                stype_out=metadata.stype_out,
+                schema=metadata.schema,
+                symbols=metadata.symbols,
+                partial=[],
+                not_found=[],
+                mappings=[],
+                end=end,
+                limit=None,
+                ts_out=metadata.ts_out,
+                version=metadata.version,
+            ),
+        )
+        + records.tobytes(),
+    )
+
+
+def test_get_range_sharded(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+) -> None:
+    """
+    Test that a sharded request downloads each sub-range and stitches the
+    records in order.
+    """
+    # Arrange
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    requests_data: list[dict[str, object | None]] = []
+
+    def stream(url: str, data: dict[str, object | None], **kwargs: object) -> DBNStore:
+        requests_data.append(data)
+        return shard_store(stream_bytes, data)
+
+    monkeypatch.setattr(historical_client.timeseries, "_stream", stream)
+
+    # Act
+    store = historical_client.timeseries.get_range(
+        dataset="GLBX.MDP3",
+        symbols="ESH1",
+        schema="mbo",
+        start="2020-12-28",
+        end="2020-12-28T00:00:01",
+        parallel=4,
+        shard="100ms",
+    )
+
+    # Assert
+    assert len(requests_data) == 10
+    assert sorted(data["start"] for data in requests_data)[:2] == [
+        "2020-12-28T00:00:00+00:00",
+        "2020-12-28T00:00:00.100000+00:00",
+    ]
+    assert all(data["schema"] == "mbo" for data in requests_data)
+    assert store.metadata.start == pd.Timestamp("2020-12-28", tz="UTC").value
+    assert store.metadata.end == pd.Timestamp("2020-12-28T00:00:01", tz="UTC").value
+    assert np.array_equal(store.to_ndarray(), DBNStore.from_bytes(stream_bytes).to_ndarray())
+
+
+@pytest.mark.parametrize(
+    "parallel, expected_concurrency",
+    [
+        [1, 1],
+        [16, 10],
+    ],
+)
+def test_get_range_sharded_parallel(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+    parallel: int,
+    expected_concurrency: int,
+) -> None:
+    """
+    Test that the sub-ranges of a shard are downloaded `parallel` at a time,
+    with a connection pool of at least `parallel`.
+    """
+    # Arrange
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    barrier = threading.Barrier(expected_concurrency, timeout=5)
+    lock = threading.Lock()
+    active: list[int] = [0, 0]
+
+    def stream(url: str, data: dict[str, object | None], **kwargs: object) -> DBNStore:
+        with lock:
+            active[0] += 1
+            active[1] = max(active)
+        barrier.wait()
+        with lock:
+            active[0] -= 1
+        return shard_store(stream_bytes, data)
+
+    monkeypatch.setattr(historical_client.timeseries, "_stream", stream)
+
+    # Act
+    historical_client.timeseries.get_range(
+        dataset="GLBX.MDP3",
+        symbols="ESH1",
+        schema="mbo",
+        start="2020-12-28",
+        end="2020-12-28T00:00:01",
+        parallel=parallel,
+        shard="100ms",
+    )
+
+    # Assert
+    assert active[1] == expected_concurrency
+    session = historical_client.timeseries._session
+    assert session.pool_size == max(10, parallel)
+    adapter = session.session.get_adapter(historical_client.gateway)
+    assert adapter._pool_maxsize == max(10, parallel)  # type: ignore [attr-defined]
+
+
+@pytest.mark.asyncio
+async def test_get_range_async_sharded(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+) -> None:
+    """
+    Test that a sharded asynchronous request downloads each sub-range and
+    stitches the records in order.
+    """
+    # Arrange
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
+
+    async def stream_async(
+        url: str,
+        data: dict[str, object | None],
+        **kwargs: object,
+    ) -> DBNStore:
+        return shard_store(stream_bytes, data)
+
+    monkeypatch.setattr(historical_client.timeseries, "_stream_async", stream_async)
+
+    # Act
+    store = await historical_client.timeseries.get_range_async(
+        dataset="GLBX.MDP3",
+        symbols="ESH1",
+        schema="trades",
+        start="2020-12-28",
+        end="2020-12-28T00:00:01",
+        parallel=3,
+    )
+
+    # Assert
+    assert np.array_equal(store.to_ndarray(), DBNStore.from_bytes(stream_bytes).to_ndarray())
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"end": None},
+        {"limit": 10},
+        {"parallel": 0},
+        {"shard": "0s"},
+    ],
+)
+def test_get_range_sharded_invalid(
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+    kwargs: dict[str, object],
+) -> None:
+    """
+    Test that a sharded request without an `end`, with a `limit`, or with a
+    non-positive `parallel` or `shard` raises a ValueError.
+    """
+    # Arrange
+    monkeypatch.setattr(historical_client.timeseries, "_stream", mocked_stream := MagicMock())
+    params: dict[str, object] = {
+        "dataset": "GLBX.MDP3",
+        "symbols": "ESH1",
+        "start": "2020-12-28",
+        "end": "2020-12-29",
+        "parallel": 2,
+        **kwargs,
+    }
+
+    # Act, Assert
+    with pytest.raises(ValueError):
+        historical_client.timeseries.get_range(**params)  # type: ignore [arg-type]
+    mocked_stream.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "limit",
+    [
+        None,
+        3,
+    ],
+)
+def test_get_range_batches_symbols(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    historical_client: Historical,
+    limit: int | None,
+) -> None:
+    """
+    Test that a request of more than 2,000 symbols is split into requests of
+    at most 2,000 symbols, of which the records are merged in time order.
+    """
+    # Arrange
+    store = DBNStore.from_bytes(test_data(Dataset.GLBX_MDP3, Schema.MBO))
+    records = store.to_ndarray()
+    symbols = [f"SYM{i}" for i in range(2001)]
+    requests_data: list[dict[str, object | None]] = []
+
+    def stream(url: str, data: dict[str, object | None], **kwargs: object) -> DBNStore:
+        requests_data.append(data)
+        batch = records[int(data["symbols"] == "SYM2000") :: 2]
+        return DBNStore.from_bytes(store.metadata.encode() + batch.tobytes())
+
+    monkeypatch.setattr(historical_client.timeseries, "_stream", stream)
+
+    # Act
+    merged = historical_client.timeseries.get_range(
+        dataset="GLBX.MDP3",
+        symbols=symbols,
+        schema="mbo",
+        start="2020-12-28",
+        end="2020-12-29",
+        limit=limit,
+    )
+
+    # Assert
+    merged_records = merged.to_ndarray()
+    assert sorted(len(str(data["symbols"]).split(",")) for data in requests_data) == [1, 2000]
+    assert [data.get("limit") for data in requests_data] == [limit and str(limit)] * 2
+    assert np.all(np.diff(merged_records["ts_recv"].astype("i8")) >= 0)
+    assert len(merged_records) == (limit or len(records))
+    if limit is None:
+        assert sorted(r.tobytes() for r in merged_records) == sorted(r.tobytes() for r in records)
+
+
+def test_get_range_cached(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that an identical request is read from the cache, including when
+    it is written to a path, and that a request which has not ended is not
+    cached.
+    """
+    # Arrange
+    client = db.Historical(key="DUMMY_API_KEY", cache_dir=tmp_path / "cache")
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.TRADES)
+
+    def stream(url: str, data: dict[str, object | None], **kwargs: object) -> DBNStore:
+        path = kwargs.get("path")
+        if path is None:
+            return DBNStore.from_bytes(stream_bytes)
+        Path(path).write_bytes(stream_bytes)
+        return DBNStore.from_file(path)
+
+    mocked_stream = MagicMock(side_effect=stream)
+    monkeypatch.setattr(client.timeseries, "_stream", mocked_stream)
+    params: dict[str, object] = {
+        "dataset": "GLBX.MDP3",
+        "symbols": "ESH1",
+        "schema": "trades",
+        "start": "2020-12-28",
+        "end": "2020-12-29",
+    }
+
+    # Act
+    first = client.timeseries.get_range(**params)  # type: ignore [arg-type]
+    second = client.timeseries.get_range(
+        **{**params, "start": "2020-12-28T00:00:00+00:00"},  # type: ignore [arg-type]
+        path=tmp_path / "second.dbn.zst",
+    )
+    num_calls = mocked_stream.call_count
+    client.timeseries.get_range(**{**params, "end": "2099-01-01"})  # type: ignore [arg-type]
+    client.timeseries.get_range(**{**params, "end": "2099-01-01"})  # type: ignore [arg-type]
+
+    # Assert
+    assert num_calls == 1
+    assert mocked_stream.call_count == 3
+    assert first.nbytes == second.nbytes == len(stream_bytes)
+    assert (tmp_path / "second.dbn.zst").read_bytes() == stream_bytes
+    assert client.timeseries.cache is not None
+    assert client.timeseries.cache.size == len(stream_bytes)
+
+
+def test_get_range_cached_sharded(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+) -> None:
+    """
+    Test that the sub-ranges of a sharded request are cached separately, so
+    an overlapping request only downloads the sub-ranges which are not
+    cached.
+    """
+    # Arrange
+    client = db.Historical(key="DUMMY_API_KEY", cache_dir=tmp_path)
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+    requests_data: list[dict[str, object | None]] = []
+
+    def stream(url: str, data: dict[str, object | None], **kwargs: object) -> DBNStore:
+        requests_data.append(data)
+        path = Path(str(kwargs["path"]))
+        path.write_bytes(shard_store(stream_bytes, data).raw)
+        return DBNStore.from_file(path)
+
+    monkeypatch.setattr(client.timeseries, "_stream", stream)
+    params: dict[str, object] = {
+        "dataset": "GLBX.MDP3",
+        "symbols": "ESH1",
+        "schema": "mbo",
+        "start": "2020-12-28",
+        "shard": "100ms",
+    }
+
+    # Act
+    client.timeseries.get_range(**params, end="2020-12-28T00:00:00.5")  # type: ignore [arg-type]
+    store = client.timeseries.get_range(
+        **params,  # type: ignore [arg-type]
+        end="2020-12-28T00:00:01",
+    )
+
+    # Assert
+    assert len(requests_data) == 10
+    assert np.array_equal(store.to_ndarray(), DBNStore.from_bytes(stream_bytes).to_ndarray())
+
+
+@pytest.mark.parametrize(
+    "to_file",
+    [
+        False,
+        True,
+    ],
+)
+def test_get_range_cached_sharded_evicted(
+    test_data: Callable[[Dataset, Schema], bytes],
+    monkeypatch: pytest.MonkeyPatch,
+    tmp_path: Path,
+    to_file: bool,
+) -> None:
+    """
+    Test that concurrent sub-ranges of a sharded request are loaded even
+    when writing each one evicts the others from a full cache.
+    """
+    # Arrange
+    client = db.Historical(key="DUMMY_API_KEY", cache_dir=tmp_path / "cache", cache_size=1)
+    stream_bytes = test_data(Dataset.GLBX_MDP3, Schema.MBO)
+
+    def stream(url: str, data: dict[str, object | None], **kwargs: object) -> DBNStore:
+        path = Path(str(kwargs["path"]))
+        path.write_bytes(shard_store(stream_bytes, data).raw)
+        return DBNStore.from_file(path)
+
+    monkeypatch.setattr(client.timeseries, "_stream", stream)
+    params: dict[str, object] = {
+        "dataset": "GLBX.MDP3",
+        "symbols": "ESH1",
+        "schema": "mbo",
+        "start": "2020-12-28",
+        "end": "2020-12-28T00:00:01",
+        "parallel": 4,
+        "shard": "100ms",
+    }
+
+    # Act
+    store = client.timeseries.get_range(
+        **params,  # type: ignore [arg-type]
+        path=tmp_path / "data.dbn.zst" if to_file else None,
+    )
+    cached_store = client.timeseries.get_range(
+        **params,  # type: ignore [arg-type]
+        path=tmp_path / "cached.dbn.zst" if to_file else None,
+    )
+
+    # Assert
+    expected = DBNStore.from_bytes(stream_bytes).to_ndarray()
+    assert np.array_equal(store.to_ndarray(), expected)
+    assert np.array_equal(cached_store.to_ndarray(), expected)
@@ -66,7 +66,11 @@ def test_adjustment_factors_get_range_sends_expected_request(
     mock_response.content = zstandard.compress(b'{"ex_date":"1970-01-01"}\n')
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", mock_post := MagicMock(return_value=mock_response))
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        mock_post := MagicMock(return_value=mock_response),
+    )
 
     # Act
     reference_client.adjustment_factors.get_range(
@@ -108,7 +112,7 @@ def test_adjustment_factors_get_range_when_empty_response(
     mock_response.content = zstandard.compress(b"")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.adjustment_factors.get_range(
@@ -132,7 +136,7 @@ def test_adjustment_factors_get_range_response(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.adjustment_factors.get_range(
@@ -81,7 +81,11 @@ def test_corporate_actions_get_range_sends_expected_request(
     mock_response.content = zstandard.compress(b"{}")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", mock_post := MagicMock(return_value=mock_response))
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        mock_post := MagicMock(return_value=mock_response),
+    )
 
     # Act
     reference_client.corporate_actions.get_range(
@@ -126,7 +130,7 @@ def test_corporate_actions_get_range_when_empty_response(
     mock_response.content = zstandard.compress(b"")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.corporate_actions.get_range(
@@ -150,7 +154,7 @@ def test_corporate_actions_get_range_response_parsing_as_pit(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.corporate_actions.get_range(
@@ -181,7 +185,7 @@ def test_corporate_actions_get_range_response(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.corporate_actions.get_range(
@@ -207,7 +211,7 @@ def test_corporate_actions_get_range_with_ts_record_index(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.corporate_actions.get_range(
@@ -241,7 +245,7 @@ def test_corporate_actions_get_range_without_flattening(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.corporate_actions.get_range(
@@ -66,7 +66,11 @@ def test_security_master_get_last_sends_expected_request(
     mock_response.content = zstandard.compress(b"{}\n")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", mock_post := MagicMock(return_value=mock_response))
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        mock_post := MagicMock(return_value=mock_response),
+    )
 
     # Act
     reference_client.security_master.get_last(
@@ -146,7 +150,11 @@ def test_security_master_get_range_sends_expected_request(
     mock_response.content = zstandard.compress(b"{}\n")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", mock_post := MagicMock(return_value=mock_response))
+    monkeypatch.setattr(
+        requests.Session,
+        "post",
+        mock_post := MagicMock(return_value=mock_response),
+    )
 
     # Act
     reference_client.security_master.get_range(
@@ -186,7 +194,7 @@ def test_security_master_get_last_when_empty_response(
     mock_response.content = zstandard.compress(b"")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.security_master.get_last(
@@ -206,7 +214,7 @@ def test_security_master_get_range_when_empty_response(
     mock_response.content = zstandard.compress(b"")
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.security_master.get_range(
@@ -230,7 +238,7 @@ def test_security_master_get_last_response(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.security_master.get_last(
@@ -260,7 +268,7 @@ def test_security_master_get_range_response(
     mock_response.content = zstandard.compress(data_path.read_bytes())
     mock_response.__enter__.return_value = mock_response
     mock_response.__exit__ = MagicMock()
-    monkeypatch.setattr(requests, "post", MagicMock(return_value=mock_response))
+    monkeypatch.setattr(requests.Session, "post", MagicMock(return_value=mock_response))
 
     # Act
     df_raw = reference_client.security_master.get_range(